@@ -8,9 +8,11 @@ from flask import Flask, render_template, request, jsonify, redirect, url_for, f
 from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
 from flask_cors import CORS
-from datetime import datetime, timezone, timedelta
+from datetime import datetime, date, timezone, timedelta
+from decimal import Decimal
 import os
 import sys
+import io
 import json
 import configparser
 from apscheduler.schedulers.background import BackgroundScheduler
@@ -18,12 +20,26 @@ from apscheduler.triggers.cron import CronTrigger
 import threading
 import time
 import argparse
+from collections import deque
 import psycopg2
 from psycopg2 import OperationalError
 import traceback
 
 # db_connection_test import
 from db_connection_test import get_server_config, connect_altibase, connect_informix, connect_postgresql, execute_query as db_execute_query
+from db_connection_test import open_block_reader, DEFAULT_FETCH_SIZE, ChunkPipeline, ColumnBatch, set_statement_params
+from db_connection_test import connect_jdbc, start_jvm_async, jvm_status
+from db_connection_test import connect_pooled, pooled_connection, pool_status, get_pool
+from db_connection_test import server_registry
+from db_connection_test import fingerprint_row, fingerprint_rows
+from db_connection_test import JobHashIndex
+from db_connection_test import merge_diff
+from db_connection_test import RANGE_CHECKSUM_DB_TYPES, RangeChecksumIndex, bucket_query
+from db_connection_test import CopyLoader, copy_rows
+from db_connection_test import JdbcBatchWriter
+from db_connection_test import SWAP_DB_TYPES, ShadowTable, suffixed_name
+from db_connection_test import IndexDeferral, restore_deferred_indexes, update_statistics, INDEX_DEFER_MIN_ROWS, ANALYZE_MIN_ROWS
+from db_connection_test import ensure_unique_key_index, find_index
 
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'your-secret-key-here'
@@ -200,11 +216,31 @@ def parse_cron_expression(cron_expr):
     except Exception as e:
         return cron_expr
 
+def _run_pooled_test_query(conf, test_query):
+    """연결 풀의 연결로 테스트 쿼리 실행 (JDBC)"""
+    with pooled_connection(conf) as conn:
+        java_stmt, reader = open_block_reader(conn.jconn, test_query)
+        try:
+            rows = []
+            for block in reader:
+                rows.extend(block)
+        finally:
+            reader.close()
+            java_stmt.close()
+    return rows
+
 def test_informix_connection(conf, test_query):
     """Informix 연결 테스트 (별도 함수)"""
-    import jaydebeapi
     import os
     
+    # 연결 풀의 연결로 먼저 시도 (실패하면 드라이버/JAR 조합별로 직접 연결해 진단)
+    try:
+        rows = _run_pooled_test_query(conf, test_query)
+        print(f"✅ Informix 연결 성공 (연결 풀)")
+        return rows, True, None
+    except Exception as e:
+        print(f"⚠️ 연결 풀 연결 실패, 드라이버별 직접 연결로 진단합니다: {e}")
+    
     # 시도할 드라이버 클래스명들 (JAR 파일 분석 결과 기반)
     driver_classes = [
         "com.informix.jdbc.IfxDriver",  # 실제 JAR 파일에 존재하는 클래스
@@ -231,10 +267,6 @@ def test_informix_connection(conf, test_query):
     for driver in driver_classes:
         for jar in jar_paths:
             try:
-                # 작업 디렉토리를 db_connection_test로 변경
-                original_cwd = os.getcwd()
-                os.chdir('/app/db_connection_test')
-                
                 try:
                     print(f"\n=== Informix 연결 시도 ===")
                     print(f"드라이버: {driver}")
@@ -255,32 +287,20 @@ def test_informix_connection(conf, test_query):
                     print(f"JAR 파일 크기: {os.path.getsize(jar)} bytes")
                     
                     # 연결 시도
-                    conn = jaydebeapi.connect(driver, url, [conf['user'], conf['password']], jar)
+                    conn = connect_jdbc(driver, url, [conf['user'], conf['password']], jar)
                     print(f"✅ JDBC 연결 성공")
                     
-                    # Java 레벨에서 직접 접근
-                    java_conn = conn.jconn
-                    java_stmt = java_conn.createStatement()
-                    java_stmt.setQueryTimeout(30)
-                    
+                    # Java 레벨에서 직접 접근 (메타데이터는 한 번만 조회)
                     print(f"테스트 쿼리 실행: {test_query}")
-                    java_result_set = java_stmt.executeQuery(test_query)
+                    java_stmt, reader = open_block_reader(conn.jconn, test_query)
                     
                     # 결과 가져오기
                     rows = []
-                    while java_result_set.next():
-                        meta_data = java_result_set.getMetaData()
-                        column_count = meta_data.getColumnCount()
-                        
-                        row = []
-                        for i in range(1, column_count + 1):
-                            value = java_result_set.getObject(i)
-                            row.append(value)
-                        
-                        rows.append(tuple(row))
+                    for block in reader:
+                        rows.extend(block)
                     
                     # 자원 반납
-                    java_result_set.close()
+                    reader.close()
                     java_stmt.close()
                     conn.close()
                     
@@ -295,10 +315,6 @@ def test_informix_connection(conf, test_query):
                     print(f"스택 트레이스: {traceback.format_exc()}")
                     continue
                     
-                finally:
-                    # 작업 디렉토리 복원
-                    os.chdir(original_cwd)
-                    
             except Exception as e:
                 print(f"❌ Informix 연결 시도 실패: {driver}, {jar} - {e}")
                 continue
@@ -309,7 +325,11 @@ def test_informix_connection(conf, test_query):
 
 def test_altibase_connection(conf, test_query):
     """Altibase 연결 테스트 (별도 함수)"""
-    import jaydebeapi
+    # 연결 풀의 연결로 먼저 시도 (실패하면 드라이버 클래스별로 직접 연결)
+    try:
+        return _run_pooled_test_query(conf, test_query), True, None
+    except Exception as e:
+        print(f"⚠️ 연결 풀 연결 실패, 드라이버 클래스별 직접 연결을 시도합니다: {e}")
     
     # 시도할 드라이버 클래스명들 (올바른 순서로)
     driver_classes = [
@@ -319,47 +339,27 @@ def test_altibase_connection(conf, test_query):
     
     for driver in driver_classes:
         try:
-            # 작업 디렉토리를 db_connection_test로 변경
-            original_cwd = os.getcwd()
-            os.chdir('/app/db_connection_test')
+            # 직접 jaydebeapi로 연결 (절대 경로 사용)
+            url = f"jdbc:Altibase://{conf['host']}:{conf['port']}/{conf['database']}"
+            jar = "/app/db_connection_test/Altibase.jar"  # 절대 경로로 변경
             
-            try:
-                # 직접 jaydebeapi로 연결 (절대 경로 사용)
-                url = f"jdbc:Altibase://{conf['host']}:{conf['port']}/{conf['database']}"
-                jar = "/app/db_connection_test/Altibase.jar"  # 절대 경로로 변경
-                
-                conn = jaydebeapi.connect(driver, url, [conf['user'], conf['password']], jar)
-                conn.autocommit = False
-                
-                # Java 레벨에서 직접 접근
-                java_conn = conn.jconn
-                java_stmt = java_conn.createStatement()
-                java_stmt.setQueryTimeout(30)
-                java_result_set = java_stmt.executeQuery(test_query)
-                
-                # 결과 가져오기
-                rows = []
-                while java_result_set.next():
-                    meta_data = java_result_set.getMetaData()
-                    column_count = meta_data.getColumnCount()
-                    
-                    row = []
-                    for i in range(1, column_count + 1):
-                        value = java_result_set.getObject(i)
-                        row.append(value)
-                    
-                    rows.append(tuple(row))
-                
-                # 자원 반납
-                java_result_set.close()
-                java_stmt.close()
-                conn.close()
-                
-                return rows, True, None
-                
-            finally:
-                # 작업 디렉토리 복원
-                os.chdir(original_cwd)
+            conn = connect_jdbc(driver, url, [conf['user'], conf['password']], jar)
+            conn.autocommit = False
+            
+            # Java 레벨에서 직접 접근 (메타데이터는 한 번만 조회)
+            java_stmt, reader = open_block_reader(conn.jconn, test_query)
+            
+            # 결과 가져오기
+            rows = []
+            for block in reader:
+                rows.extend(block)
+            
+            # 자원 반납
+            reader.close()
+            java_stmt.close()
+            conn.close()
+            
+            return rows, True, None
                 
         except Exception as e:
             if driver == driver_classes[-1]:  # 마지막 시도였다면
@@ -395,215 +395,815 @@ def wait_for_postgres(max_retries=30, retry_interval=2):
     
     return False
 
-def execute_query_with_columns(server_name, query):
-    """컬럼명을 포함한 쿼리 실행"""
-    import jaydebeapi
+def compute_row_hash(row):
+    """행 데이터의 해시 ID 생성 (64비트 정수 지문)"""
+    return fingerprint_row(row)
+
+def hash_rows(rows):
+    """각 행의 앞에 해시 ID 추가 (ColumnBatch는 data_hash 컬럼을 앞에 추가)"""
+    if isinstance(rows, ColumnBatch):
+        return rows.prepend_column('data_hash', fingerprint_rows(rows))
+    return [(row_hash,) + tuple(row) for row_hash, row in zip(fingerprint_rows(rows), rows)]
+
+def normalize_row_hash(value):
+    """타겟에서 읽은 data_hash 값을 지문과 같은 정수로 변환 (TEXT 컬럼에 저장된 경우 포함)"""
+    if value is None or isinstance(value, int):
+        return value
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        # 이전 형식(md5 16자리)의 해시
+        return value
+
+def column_definition(column, default_type):
+    """타겟 테이블 생성 시 컬럼 정의 (data_hash는 64비트 정수 지문이므로 BIGINT)"""
+    if column == 'data_hash':
+        return f'{column} BIGINT'
+    return f'{column} {default_type}'
+
+class RowChunkStream:
+    """fetch_rows로 chunk_size씩 읽어 청크(ColumnBatch)를 반환하는 스트림 (with_hash면 해시 ID 추가)
+    
+    끝까지 읽거나 close()를 호출하면 연결을 정리합니다. 제너레이터와 달리
+    한 번도 읽지 않은 상태에서 close()해도 연결이 닫힙니다.
+    """
+    
+    def __init__(self, fetch_rows, close, chunk_size, with_hash=True):
+        self._fetch_rows = fetch_rows
+        self._close = close
+        self.chunk_size = chunk_size
+        self.with_hash = with_hash
+        self.closed = False
+        self._peeked = None
+    
+    def __iter__(self):
+        return self
+    
+    def peek(self):
+        """다음 청크를 소비하지 않고 미리 읽음 (더 읽을 청크가 없으면 None)"""
+        if self._peeked is None:
+            self._peeked = next(self, None)
+        return self._peeked
+    
+    def __next__(self):
+        if self._peeked is not None:
+            chunk, self._peeked = self._peeked, None
+            return chunk
+        if self.closed:
+            raise StopIteration
+        try:
+            rows = self._fetch_rows(self.chunk_size)
+        except Exception:
+            self.close()
+            raise
+        if not rows:
+            self.close()
+            raise StopIteration
+        return hash_rows(rows) if self.with_hash else rows
+    
+    def close(self):
+        if not self.closed:
+            self.closed = True
+            self._close()
+
+def open_query_stream(server_name, query, chunk_size=10000, fetch_size=None, with_hash=True, params=None):
+    """
+    컬럼명을 먼저 확인한 뒤 청크 단위로 결과를 읽는 스트림 열기
+    
+    fetch_size(기본값: DEFAULT_FETCH_SIZE)는 Altibase/Informix의 JDBC fetch size,
+    PostgreSQL 서버 측 커서의 itersize로 사용됩니다.
+    params가 있으면 쿼리의 바인드 자리(PostgreSQL은 %s, Altibase/Informix는 ?)에 값을 바인딩합니다.
+    
+    Returns:
+        tuple: (columns, chunks, success, error)
+            columns는 data_hash가 앞에 붙은 컬럼명 목록,
+            chunks는 최대 chunk_size 행의 ColumnBatch를 반환하는 스트림 (행 리스트처럼 사용 가능)
+            (with_hash=False면 해시 ID 없이 원본 행을 반환하므로 hash_rows로 직접 추가)
+    """
     import psycopg2
-    import hashlib
+    import itertools
+    import uuid
     
-    # 작업 디렉토리를 db_connection_test로 변경
-    original_cwd = os.getcwd()
-    os.chdir('/app/db_connection_test')
+    chunk_size = chunk_size or 10000
     
+    conn = None
     try:
         conf = get_server_config(server_name)
         db_type = conf['type']
         
         if db_type == 'postgresql':
-            # PostgreSQL 연결
-            conn = psycopg2.connect(
-                host=conf['host'],
-                port=conf['port'],
-                database=conf['database'],
-                user=conf['user'],
-                password=conf['password']
-            )
-            
-            cursor = conn.cursor()
-            cursor.execute(query)
-            
-            # 컬럼명 가져오기
-            columns = [desc[0] for desc in cursor.description]
-            
-            # 데이터 가져오기
-            rows = cursor.fetchall()
-            
-            # 각 행에 해시 ID 추가
-            result_rows = []
-            for i, row in enumerate(rows):
-                # 행 데이터를 문자열로 변환하여 해시 생성
-                row_str = str(row)
-                row_hash = hashlib.md5(row_str.encode()).hexdigest()[:16]  # 16자리 해시
-                
-                # 해시 ID를 첫 번째 컬럼으로 추가
-                new_row = (row_hash,) + row
-                result_rows.append(new_row)
+            # PostgreSQL 연결 (서버별 연결 풀에서 빌림)
+            conn = connect_pooled(conf)
             
-            # 컬럼명에 ID 컬럼 추가
-            result_columns = ['data_hash'] + columns
+            # 읽기 전용 트랜잭션 안에서 서버 측(named) 커서 사용
+            # (libpq가 전체 결과를 버퍼링하지 않고 itersize 단위로 FETCH)
+            conn.set_session(readonly=True, autocommit=False)
+            cursor = conn.cursor(name=f"fs_stream_{uuid.uuid4().hex}")
+            cursor.itersize = fetch_size or DEFAULT_FETCH_SIZE
+            cursor.execute(query, params or None)
             
-            cursor.close()
-            conn.close()
-            
-            return result_columns, result_rows, True, None
-            
-        elif db_type == 'altibase':
-            # Altibase 연결
-            url = f"jdbc:Altibase://{conf['host']}:{conf['port']}/{conf['database']}"
-            jar = "/app/db_connection_test/Altibase.jar"
-            
-            conn = jaydebeapi.connect(
-                "com.altibase.jdbc.driver.AltibaseDriver",
-                url,
-                [conf['user'], conf['password']],
-                jar
-            )
-            
-            java_conn = conn.jconn
-            java_stmt = java_conn.createStatement()
-            java_stmt.setQueryTimeout(30)
-            java_result_set = java_stmt.executeQuery(query)
+            # named 커서는 첫 FETCH 이후에 description이 채워지므로 첫 블록을 미리 읽음
+            prefetched = list(itertools.islice(cursor, chunk_size))
             
             # 컬럼명 가져오기
-            meta_data = java_result_set.getMetaData()
-            column_count = meta_data.getColumnCount()
-            columns = []
-            for i in range(1, column_count + 1):
-                columns.append(meta_data.getColumnName(i))
+            columns = [desc[0] for desc in cursor.description]
             
-            # 데이터 가져오기
-            rows = []
-            while java_result_set.next():
-                row = []
-                for i in range(1, column_count + 1):
-                    value = java_result_set.getObject(i)
-                    row.append(value)
-                rows.append(tuple(row))
-            
-            # 각 행에 해시 ID 추가
-            result_rows = []
-            for i, row in enumerate(rows):
-                row_str = str(row)
-                row_hash = hashlib.md5(row_str.encode()).hexdigest()[:16]
-                new_row = (row_hash,) + row
-                result_rows.append(new_row)
-            
-            # 컬럼명에 ID 컬럼 추가
-            result_columns = ['data_hash'] + columns
-            
-            java_result_set.close()
-            java_stmt.close()
-            conn.close()
+            def fetch_rows(size):
+                nonlocal prefetched
+                if prefetched is not None:
+                    rows, prefetched = prefetched, None
+                else:
+                    rows = list(itertools.islice(cursor, size))
+                return ColumnBatch.from_rows(columns, rows)
             
-            return result_columns, result_rows, True, None
+            def close():
+                cursor.close()
+                conn.rollback()
+                conn.close()
             
-        elif db_type == 'informix':
-            # Informix 연결
-            url = f"jdbc:informix-sqli://{conf['host']}:{conf['port']}/{conf['database']}:NEWCODESET=EUC-KR,cp1252,819"
-            jar = "/app/db_connection_test/ifxjdbc.jar"
-            
-            conn = jaydebeapi.connect(
-                "com.informix.jdbc.IfxDriver",
-                url,
-                [conf['user'], conf['password']],
-                jar
-            )
+        elif db_type in ('altibase', 'informix'):
+            # Altibase/Informix 연결 (서버별 연결 풀에서 빌림)
+            conn = connect_pooled(conf)
             
-            java_conn = conn.jconn
-            java_stmt = java_conn.createStatement()
-            java_stmt.setQueryTimeout(30)
-            java_result_set = java_stmt.executeQuery(query)
+            # fetch size가 설정된 Statement로 실행 (메타데이터와 컬럼별 변환 함수는 한 번만 준비)
+            java_stmt, reader = open_block_reader(conn.jconn, query, fetch_size, convert=True, params=params)
             
             # 컬럼명 가져오기
-            meta_data = java_result_set.getMetaData()
-            column_count = meta_data.getColumnCount()
-            columns = []
-            for i in range(1, column_count + 1):
-                columns.append(meta_data.getColumnName(i))
-            
-            # 데이터 가져오기
-            rows = []
-            while java_result_set.next():
-                row = []
-                for i in range(1, column_count + 1):
-                    value = java_result_set.getObject(i)
-                    row.append(value)
-                rows.append(tuple(row))
-            
-            # 각 행에 해시 ID 추가
-            result_rows = []
-            for i, row in enumerate(rows):
-                row_str = str(row)
-                row_hash = hashlib.md5(row_str.encode()).hexdigest()[:16]
-                new_row = (row_hash,) + row
-                result_rows.append(new_row)
-            
-            # 컬럼명에 ID 컬럼 추가
-            result_columns = ['data_hash'] + columns
-            
-            java_result_set.close()
-            java_stmt.close()
-            conn.close()
+            columns = reader.columns
+            fetch_rows = reader.fetch_columns
             
-            return result_columns, result_rows, True, None
+            def close():
+                reader.close()
+                java_stmt.close()
+                conn.close()
             
         else:
             return None, None, False, f"지원하지 않는 데이터베이스 타입: {db_type}"
-            
+        
+        # 컬럼명에 ID 컬럼 추가
+        result_columns = ['data_hash'] + columns
+        
+        return result_columns, RowChunkStream(fetch_rows, close, chunk_size, with_hash), True, None
+        
     except Exception as e:
         import traceback
+        if conn is not None:
+            # 상태를 알 수 없는 연결은 풀에 돌려보내지 않고 닫음
+            conn.invalidate()
         error_msg = f"{str(e)}\n{traceback.format_exc()}"
         return None, None, False, error_msg
-    finally:
-        # 작업 디렉토리 복원
-        os.chdir(original_cwd)
 
-def execute_incremental_query(server_name, base_query, sync_key_column, last_sync_value, sync_strategy):
-    """증분 동기화를 위한 쿼리 실행"""
-    import jaydebeapi
-    import psycopg2
-    import hashlib
+def execute_query_with_columns(server_name, query, params=None):
+    """컬럼명을 포함한 쿼리 실행 (전체 결과를 리스트로 반환)"""
+    columns, chunks, success, error = open_query_stream(server_name, query, params=params)
+    if not success:
+        return None, None, False, error
+    
+    try:
+        result_rows = []
+        for chunk in chunks:
+            result_rows.extend(chunk)
+        return columns, result_rows, True, None
+    except Exception as e:
+        import traceback
+        error_msg = f"{str(e)}\n{traceback.format_exc()}"
+        return None, None, False, error_msg
+
+def parse_sync_key_columns(sync_key_column):
+    """동기화 키 컬럼 목록 (쉼표로 구분한 복합 키, 예: "updated_at, id")"""
+    return [column.strip() for column in (sync_key_column or '').split(',') if column.strip()]
+
+def parse_sync_value(value, sync_strategy=None):
+    """저장된 마지막 동기화 값(문자열)을 바인드 파라미터용 타입으로 변환 (전략이 없으면 타입 추측)"""
+    if value is None or value == '':
+        return None
+    if not isinstance(value, str):
+        return value
+    
+    if sync_strategy in ('timestamp', None):
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            if sync_strategy == 'timestamp':
+                return value
+    if sync_strategy in ('sequence', None):
+        try:
+            return int(value)
+        except ValueError:
+            try:
+                return Decimal(value)
+            except ArithmeticError:
+                return value
+    return value
+
+def format_sync_value(value):
+    """동기화 값을 저장용 문자열로 변환 (parse_sync_value로 되돌릴 수 있는 형식)"""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.isoformat(sep=' ')
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value)
+
+# 구조화된 워터마크 값 타입 태그
+_WATERMARK_TYPES = {
+    'datetime': datetime.fromisoformat,
+    'date': date.fromisoformat,
+    'int': int,
+    'decimal': Decimal,
+    'float': float,
+    'bool': lambda value: value == 'True',
+    'str': str,
+    'null': lambda value: None,
+}
+
+def _watermark_type(value):
+    if value is None:
+        return 'null'
+    if isinstance(value, datetime):
+        return 'datetime'
+    if isinstance(value, date):
+        return 'date'
+    if isinstance(value, bool):
+        return 'bool'
+    if isinstance(value, int):
+        return 'int'
+    if isinstance(value, Decimal):
+        return 'decimal'
+    if isinstance(value, float):
+        return 'float'
+    return 'str'
+
+def encode_sync_values(values):
+    """값 리스트를 [타입, 문자열] 리스트로 변환 (JSON으로 저장한 뒤 decode_sync_values로 복원)"""
+    return [[_watermark_type(value), format_sync_value(value)] for value in values]
+
+def decode_sync_values(encoded):
+    """encode_sync_values 결과를 값 리스트로 복원"""
+    return [_WATERMARK_TYPES[value_type](value) for value_type, value in encoded]
+
+def encode_watermark(key_columns, values):
+    """키 컬럼별 워터마크 값을 타입과 함께 JSON으로 변환 (타겟 상태 테이블/작업 정보에 저장)"""
+    return json.dumps({
+        'columns': list(key_columns),
+        'values': encode_sync_values(values),
+    }, ensure_ascii=False)
+
+def decode_watermark(text, key_columns, sync_strategy=None):
+    """
+    저장된 워터마크를 키 컬럼 순서의 값 리스트로 변환
+    
+    구조화된 JSON이면 저장된 타입으로 복원하고, 이전 형식/직접 입력한 문자열이면 쉼표로 나눠
+    첫 번째 값은 동기화 전략으로, 나머지는 타입을 추측해 변환합니다.
+    키 컬럼 구성이 바뀌었으면 None (전체 조회)
+    """
+    if text is None or text == '':
+        return None
+    
+    if text.lstrip().startswith('{'):
+        watermark = json.loads(text)
+        if [column.lower() for column in watermark['columns']] != [column.lower() for column in key_columns]:
+            print(f"⚠️ 워터마크의 키 컬럼 {watermark['columns']}이 현재 설정 {key_columns}과 달라 사용하지 않습니다.")
+            return None
+        return decode_sync_values(watermark['values'])
+    
+    parts = [part.strip() for part in text.split(',')] if len(key_columns) > 1 else [text]
+    values = [parse_sync_value(parts[0], sync_strategy)] + [parse_sync_value(part) for part in parts[1:]]
+    # 값이 키 컬럼보다 적으면 앞쪽 키 컬럼만 비교
+    return values[:len(key_columns)]
+
+def format_watermark(values):
+    """워터마크 화면 표시용 문자열 (복합 키는 쉼표로 구분)"""
+    return ', '.join(format_sync_value(value) for value in values)
+
+def build_keyset_predicate(key_columns, values, db_type='postgresql'):
+    """
+    복합 키의 사전순(keyset) 비교 조건: (c1, c2, ...) > (v1, v2, ...)
+    
+    PostgreSQL은 행 값 비교를 그대로 사용해 (c1, c2) 복합 인덱스 범위 스캔이 가능하고,
+    Altibase/Informix는 같은 의미의 OR 조건으로 풀어 쓰되 첫 번째 키의 >= 조건을 앞에 둬서 인덱스를 탑니다.
+    
+    Returns:
+        tuple: (조건 SQL, 바인드 파라미터 리스트)
+    """
+    key_columns = key_columns[:len(values)]
+    placeholder = '%s' if db_type == 'postgresql' else '?'
+    
+    if len(key_columns) == 1:
+        return f"{key_columns[0]} > {placeholder}", list(values)
+    
+    if db_type == 'postgresql':
+        placeholders = ', '.join([placeholder] * len(values))
+        return f"({', '.join(key_columns)}) > ({placeholders})", list(values)
+    
+    terms = []
+    params = [values[0]]
+    for i, column in enumerate(key_columns):
+        conditions = [f"{key_columns[j]} = {placeholder}" for j in range(i)] + [f"{column} > {placeholder}"]
+        terms.append(f"({' AND '.join(conditions)})")
+        params.extend(values[:i + 1])
+    return f"{key_columns[0]} >= {placeholder} AND ({' OR '.join(terms)})", params
+
+def build_incremental_query(base_query, sync_key_column, last_sync_value, sync_strategy, db_type='postgresql'):
+    """
+    증분 동기화 조건이 추가된 쿼리 생성
+    
+    마지막 동기화 값은 문자열로 이어 붙이지 않고 타입이 있는 바인드 파라미터로 전달하므로
+    소스가 키 컬럼 인덱스를 사용할 수 있습니다. 키 컬럼이 여러 개면 사전순 비교로
+    마지막 값과 같은 시각의 행도 빠뜨리지 않습니다.
     
-    # 작업 디렉토리를 db_connection_test로 변경
-    original_cwd = os.getcwd()
-    os.chdir('/app/db_connection_test')
+    Returns:
+        tuple: (query, params) - params는 open_query_stream에 그대로 전달
+    """
+    key_columns = parse_sync_key_columns(sync_key_column)
+    if sync_strategy not in ('timestamp', 'sequence') or not key_columns:
+        # 해시 기반 증분 동기화 (전체 테이블 스캔 후 해시 비교)
+        return base_query, None
     
+    values = decode_watermark(last_sync_value, key_columns, sync_strategy)
+    if not values or any(value is None for value in values):
+        # 첫 실행
+        return base_query, None
+    
+    # 원본 쿼리를 감싸서 조건 추가 (psycopg2는 바인드 자리 외의 %를 %%로 써야 함)
+    if db_type == 'postgresql':
+        base_query = base_query.replace('%', '%%')
+    predicate, params = build_keyset_predicate(key_columns, values, db_type)
+    return f"SELECT * FROM ({base_query}) incremental_src WHERE {predicate}", params
+
+def order_by_sync_keys(query, sync_key_column):
+    """키 컬럼 순서로 정렬 (소스의 키 컬럼 인덱스 순서로 읽도록)"""
+    key_columns = parse_sync_key_columns(sync_key_column)
+    if not key_columns:
+        return query
+    return f"{query} ORDER BY {', '.join(key_columns)}"
+
+def execute_incremental_query(server_name, base_query, sync_key_column, last_sync_value, sync_strategy):
+    """증분 동기화를 위한 쿼리 실행"""
     try:
-        conf = get_server_config(server_name)
-        db_type = conf['type']
-        
-        # 증분 동기화 조건 추가
-        if sync_strategy == 'timestamp':
-            # 타임스탬프 기반 증분 동기화
-            if 'WHERE' in base_query.upper():
-                incremental_query = f"{base_query} AND {sync_key_column} > '{last_sync_value}'"
-            else:
-                incremental_query = f"{base_query} WHERE {sync_key_column} > '{last_sync_value}'"
-        elif sync_strategy == 'sequence':
-            # 시퀀스 기반 증분 동기화
-            if 'WHERE' in base_query.upper():
-                incremental_query = f"{base_query} AND {sync_key_column} > {last_sync_value}"
-            else:
-                incremental_query = f"{base_query} WHERE {sync_key_column} > {last_sync_value}"
-        elif sync_strategy == 'hash':
-            # 해시 기반 증분 동기화 (전체 테이블 스캔 후 해시 비교)
-            # 해시 전략에서는 전체 데이터를 가져온 후 타겟과 비교하여 중복 제거
-            incremental_query = base_query
-        else:
-            incremental_query = base_query
-        
-        print(f"증분 동기화 쿼리: {incremental_query}")
+        db_type = get_server_config(server_name)['type']
+        incremental_query, params = build_incremental_query(
+            base_query, sync_key_column, last_sync_value, sync_strategy, db_type
+        )
+        print(f"증분 동기화 쿼리: {incremental_query} (파라미터: {params})")
         
         # 기존 execute_query_with_columns 함수 사용
-        return execute_query_with_columns(server_name, incremental_query)
+        return execute_query_with_columns(server_name, incremental_query, params)
         
     except Exception as e:
         import traceback
         error_msg = f"증분 동기화 쿼리 실행 중 오류: {str(e)}\n{traceback.format_exc()}"
         return None, None, False, error_msg
+
+def get_partition_bounds(server_name, query, column, params=None):
+    """파티션 컬럼의 최소/최대값 조회 (값이 없으면 None, None)"""
+    bounds_query = f"SELECT MIN({column}), MAX({column}) FROM ({query}) partition_src"
+    columns, chunks, success, error = open_query_stream(server_name, bounds_query, 1, with_hash=False, params=params)
+    if not success:
+        raise Exception(f"파티션 범위 조회 실패: {error}")
+    
+    rows = [row for chunk in chunks for row in chunk]
+    if not rows:
+        return None, None
+    return rows[0][0], rows[0][1]
+
+def _partition_literal(value):
+    """파티션 경계값을 SQL 리터럴로 변환"""
+    if isinstance(value, datetime):
+        return f"'{value.strftime('%Y-%m-%d %H:%M:%S')}'"
+    if isinstance(value, date):
+        return f"'{value.strftime('%Y-%m-%d')}'"
+    return str(value)
+
+def _split_range(min_value, max_value, num_partitions):
+    """최소/최대값 사이를 균등 분할한 내부 경계값 목록 (분할할 수 없으면 빈 목록)"""
+    if isinstance(min_value, (datetime, date)) and isinstance(max_value, (datetime, date)):
+        step = (max_value - min_value) / num_partitions
+        boundaries = [min_value + step * i for i in range(1, num_partitions)]
+    elif isinstance(min_value, int) and isinstance(max_value, int):
+        # 정수 연산으로 계산 (2**53보다 큰 BIGINT 키도 경계가 반올림되지 않음)
+        span = max_value - min_value
+        boundaries = [min_value + (span * i) // num_partitions for i in range(1, num_partitions)]
+    elif isinstance(min_value, (int, float, Decimal)) and isinstance(max_value, (int, float, Decimal)):
+        step = (Decimal(str(max_value)) - Decimal(str(min_value))) / num_partitions
+        boundaries = [Decimal(str(min_value)) + step * i for i in range(1, num_partitions)]
+    else:
+        return []
+    
+    # 리터럴 기준으로 중복 제거 (값 범위가 파티션 수보다 좁은 경우)
+    literals = []
+    for boundary in boundaries:
+        literal = _partition_literal(boundary)
+        if literal not in literals and literal != _partition_literal(min_value):
+            literals.append(literal)
+    return literals
+
+def build_partition_queries(base_query, column, num_partitions, method='range', bounds=None):
+    """
+    쿼리를 파티션 컬럼 기준으로 num_partitions개의 쿼리로 분할
+    
+    range는 bounds(최소, 최대값)를 균등 분할한 구간, modulo는 MOD(column, N)으로 나눕니다.
+    첫 파티션은 NULL 키 행도 포함하며, 분할할 수 없으면 원본 쿼리 하나만 반환합니다.
+    """
+    wrapped = f"SELECT * FROM ({base_query}) partition_src"
+    
+    if method == 'modulo':
+        conditions = [f"ABS(MOD({column}, {num_partitions})) = {i}" for i in range(num_partitions)]
+    else:
+        min_value, max_value = bounds or (None, None)
+        if min_value is None or max_value is None:
+            return [base_query]
+        
+        literals = _split_range(min_value, max_value, num_partitions)
+        if not literals:
+            return [base_query]
+        
+        conditions = [f"{column} < {literals[0]}"]
+        for lower, upper in zip(literals, literals[1:]):
+            conditions.append(f"{column} >= {lower} AND {column} < {upper}")
+        conditions.append(f"{column} >= {literals[-1]}")
+    
+    conditions[0] = f"({conditions[0]}) OR {column} IS NULL"
+    return [f"{wrapped} WHERE {condition}" for condition in conditions]
+
+# 작업별 워터마크를 타겟 적재와 같은 트랜잭션으로 기록하는 타겟 측 테이블
+SYNC_STATE_TABLE = 'fs_sync_state'
+
+def _ensure_state_table(conn, db_type, table_name, create_sql):
+    """타겟에 작업 상태 테이블(job_id 컬럼 포함)이 없으면 생성"""
+    if db_type == 'postgresql':
+        cursor = conn.cursor()
+        cursor.execute(create_sql.replace('CREATE TABLE', 'CREATE TABLE IF NOT EXISTS', 1))
+        cursor.close()
+        return
+    
+    stmt = conn.jconn.createStatement()
+    try:
+        try:
+            stmt.executeQuery(f"SELECT job_id FROM {table_name} WHERE 1=0").close()
+        except:
+            stmt.execute(create_sql)
     finally:
-        # 작업 디렉토리 복원
-        os.chdir(original_cwd)
+        stmt.close()
+
+def _ensure_sync_state_table(conn, db_type):
+    """타겟에 동기화 상태 테이블이 없으면 생성"""
+    _ensure_state_table(conn, db_type, SYNC_STATE_TABLE, f"""
+        CREATE TABLE {SYNC_STATE_TABLE} (
+            job_id INTEGER PRIMARY KEY,
+            target_table VARCHAR(200),
+            watermark VARCHAR(1000),
+            updated_at VARCHAR(40)
+        )
+    """)
+
+def write_sync_state(conn, db_type, job_id, table_name, watermark):
+    """
+    워터마크 기록 (커밋하지 않음)
+    
+    적재에 사용한 연결로 커밋 직전에 호출하면 데이터와 워터마크가 함께 커밋되거나 함께 롤백됩니다.
+    """
+    _ensure_sync_state_table(conn, db_type)
+    params = [job_id, table_name, watermark, get_kst_now().isoformat(sep=' ')]
+    
+    if db_type == 'postgresql':
+        cursor = conn.cursor()
+        cursor.execute(f"DELETE FROM {SYNC_STATE_TABLE} WHERE job_id = %s", (job_id,))
+        cursor.execute(f"INSERT INTO {SYNC_STATE_TABLE} (job_id, target_table, watermark, updated_at) "
+                       f"VALUES (%s, %s, %s, %s)", params)
+        cursor.close()
+        return
+    
+    jconn = conn.jconn
+    for sql, values in ((f"DELETE FROM {SYNC_STATE_TABLE} WHERE job_id = ?", [job_id]),
+                        (f"INSERT INTO {SYNC_STATE_TABLE} (job_id, target_table, watermark, updated_at) "
+                         f"VALUES (?, ?, ?, ?)", params)):
+        prep_stmt = jconn.prepareStatement(sql)
+        try:
+            set_statement_params(prep_stmt, values)
+            prep_stmt.executeUpdate()
+        finally:
+            prep_stmt.close()
+
+def set_synchronous_commit(conn, enabled):
+    """
+    PostgreSQL 세션의 synchronous_commit 설정 (바로 커밋해서 이후 롤백되어도 유지)
+    
+    off이면 커밋할 때 WAL이 디스크에 기록될 때까지 기다리지 않습니다. 서버가 비정상 종료되면
+    마지막 몇 개의 커밋이 사라질 수 있지만 데이터가 깨지지는 않습니다.
+    풀에 반납하는 연결이므로 적재가 끝나면 기본값으로 되돌려야 합니다.
+    """
+    cursor = conn.cursor()
+    cursor.execute(f"SET synchronous_commit TO {'DEFAULT' if enabled else 'off'}")
+    cursor.close()
+    conn.commit()
+
+def read_sync_state(target_conf, job_id):
+    """타겟에 기록된 작업의 워터마크 (기록이 없으면 None)"""
+    with pooled_connection(target_conf) as conn:
+        if target_conf['type'] == 'postgresql':
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT EXISTS (
+                    SELECT FROM information_schema.tables 
+                    WHERE table_schema = 'public' AND table_name = %s
+                );
+            """, (SYNC_STATE_TABLE,))
+            if not cursor.fetchone()[0]:
+                cursor.close()
+                return None
+            cursor.execute(f"SELECT watermark FROM {SYNC_STATE_TABLE} WHERE job_id = %s", (job_id,))
+            row = cursor.fetchone()
+            cursor.close()
+            conn.rollback()
+            return row[0] if row else None
+        
+        prep_stmt = None
+        try:
+            prep_stmt = conn.jconn.prepareStatement(f"SELECT watermark FROM {SYNC_STATE_TABLE} WHERE job_id = ?")
+            set_statement_params(prep_stmt, [job_id])
+            result_set = prep_stmt.executeQuery()
+        except:
+            if prep_stmt is not None:
+                prep_stmt.close()
+            return None  # 상태 테이블 없음
+        
+        try:
+            watermark = result_set.getString(1) if result_set.next() else None
+            result_set.close()
+            return str(watermark) if watermark is not None else None
+        finally:
+            prep_stmt.close()
+
+def store_sync_state(target_conf, job_id, table_name, watermark):
+    """워터마크만 따로 기록 (작업 수정 화면에서 마지막 동기화 값을 바꾼 경우)"""
+    with pooled_connection(target_conf) as conn:
+        if target_conf['type'] == 'postgresql':
+            write_sync_state(conn, 'postgresql', job_id, table_name, watermark)
+            conn.commit()
+        else:
+            conn.jconn.setAutoCommit(False)
+            write_sync_state(conn, target_conf['type'], job_id, table_name, watermark)
+            conn.jconn.commit()
+
+def update_watermark(current, batch, column_indexes):
+    """청크의 키 컬럼 (사전순) 최대값으로 워터마크 갱신 (키에 NULL이 있는 행 제외)"""
+    keys = [key for key in zip(*[batch.column(i) for i in column_indexes]) if None not in key]
+    if not keys:
+        return current
+    chunk_max = max(keys)
+    if current is None or chunk_max > current:
+        return chunk_max
+    return current
+
+def find_column_index(columns, column_name):
+    """컬럼명 위치 (대소문자 무시, 없으면 None)"""
+    lowered = [str(column).lower() for column in columns]
+    name = column_name.strip().lower()
+    return lowered.index(name) if name in lowered else None
+
+# 청크 단위 체크포인트를 청크 적재와 같은 트랜잭션으로 기록하는 타겟 측 테이블
+CHECKPOINT_TABLE = 'fs_run_checkpoint'
+
+def _encode_key(values):
+    """체크포인트 키 값(튜플)을 저장용 JSON으로 변환"""
+    if values is None:
+        return None
+    return json.dumps(encode_sync_values(values), ensure_ascii=False)
+
+def _decode_key(text):
+    if text is None:
+        return None
+    return tuple(decode_sync_values(json.loads(text)))
+
+def build_resume_query(query, params, key_columns, after, db_type='postgresql'):
+    """
+    파티션 쿼리에 마지막으로 커밋된 청크의 끝 키 이후 조건 추가
+    
+    Returns:
+        tuple: (query, params) - 원래 바인드 파라미터 뒤에 키 값이 추가됨
+    """
+    if db_type == 'postgresql' and not params:
+        # 바인드 파라미터가 새로 생기므로 바인드 자리 외의 %를 %%로 변경
+        query = query.replace('%', '%%')
+    predicate, resume_params = build_keyset_predicate(key_columns, list(after), db_type)
+    return f"SELECT * FROM ({query}) resume_src WHERE {predicate}", list(params or []) + resume_params
+
+class PartitionStream:
+    """청크 스트림의 청크마다 파티션 번호를 붙여 (파티션 번호, 청크)로 반환 (close()는 원래 스트림에 전달)"""
+    
+    def __init__(self, stream, partition):
+        self.stream = stream
+        self.partition = partition
+    
+    def __iter__(self):
+        return self
+    
+    def __next__(self):
+        return self.partition, next(self.stream)
+    
+    def close(self):
+        self.stream.close()
+
+class RunCheckpoint:
+    """
+    청크 단위 체크포인트 (실패하거나 중단된 실행을 마지막으로 커밋된 청크 다음부터 이어서 실행)
+    
+    적재 함수는 청크마다 타겟의 fs_run_checkpoint에 (실행 ID, 파티션, 청크 키 범위, 누적 워터마크, 누적 행 수)를
+    청크와 같은 트랜잭션으로 기록하고 커밋합니다. 다음 실행은 실행 계획(동기화 모드, 쿼리, 키 컬럼, 파티션 분할)이
+    같으면 파티션별로 마지막 청크의 끝 키보다 큰 행만 읽고, 전체 동기화라도 타겟을 다시 비우지 않습니다.
+    모든 청크를 적재하면 워터마크와 같은 트랜잭션에서 체크포인트를 지웁니다.
+    
+    파티션마다 키 컬럼 순서로 읽으므로 키 컬럼(복합 키 포함)이 행을 유일하게 식별해야 하며,
+    키가 NULL인 행은 이어서 실행할 때 다시 적재될 수 있습니다.
+    실행 계획은 partition_no가 -1인 행에 기록합니다. (range_start/range_end: 범위 파티션의 최소/최대값, watermark: 계획 JSON)
+    """
+    
+    def __init__(self, job_id, run_id, table_name, key_columns, plan):
+        self.job_id = job_id
+        self.run_id = run_id  # 처음 시작한 실행의 로그 ID (이어서 실행해도 유지)
+        self.table_name = table_name
+        self.key_columns = list(key_columns)
+        self.plan = json.loads(json.dumps(plan, default=str))
+        self.bounds = None  # 범위 파티션의 (최소, 최대값)
+        self.found = False  # 타겟에 이전 실행의 체크포인트가 남아 있었는지
+        self.resumed = False
+        self.chunk_no = 0
+        self.rows = 0  # 이전 실행을 포함해 커밋된 누적 행 수
+        self.watermark = None  # 커밋된 청크의 키 최대값
+        self.partition_ends = {}  # 파티션 번호 -> 마지막으로 커밋된 청크의 끝 키
+        self._pending = deque()  # 변환 단계를 통과해 적재를 기다리는 청크의 (파티션, 시작 키, 끝 키)
+        self._conn = None
+        self._db_type = None
+    
+    def load(self, target_conf):
+        """타겟에 남은 이전 실행의 체크포인트 읽기 (실행 계획이 같으면 이어서 실행, True 반환)"""
+        rows = self._read_rows(target_conf)
+        if not rows:
+            return False
+        self.found = True
+        
+        plan_row = next((row for row in rows if row[1] == -1), None)
+        if plan_row is None or json.loads(plan_row[5]) != self.plan:
+            print("⚠️ 이전 실행의 체크포인트가 현재 작업 설정과 달라 처음부터 실행합니다.")
+            return False
+        
+        self.run_id = plan_row[0]
+        if plan_row[3] is not None:
+            self.bounds = (_decode_key(plan_row[3])[0], _decode_key(plan_row[4])[0])
+        
+        for run_id, partition_no, chunk_no, range_start, range_end, watermark, row_count in rows:
+            if partition_no < 0:
+                continue
+            end = _decode_key(range_end)
+            if end is not None:
+                self.partition_ends[partition_no] = end
+            if chunk_no > self.chunk_no:
+                self.chunk_no = chunk_no
+                self.rows = row_count
+                self.watermark = _decode_key(watermark)
+        
+        self.resumed = True
+        print(f"이전 실행(로그 ID {self.run_id})의 체크포인트에서 이어서 실행: 청크 {self.chunk_no}개, {self.rows}행 적재됨")
+        return True
+    
+    def _read_rows(self, target_conf):
+        """작업의 체크포인트 행 (청크 순서, 테이블이 없으면 빈 리스트)"""
+        sql = (f"SELECT run_id, partition_no, chunk_no, range_start, range_end, watermark, row_count "
+               f"FROM {CHECKPOINT_TABLE} WHERE job_id = ? ORDER BY chunk_no")
+        
+        with pooled_connection(target_conf) as conn:
+            if target_conf['type'] == 'postgresql':
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT EXISTS (
+                        SELECT FROM information_schema.tables 
+                        WHERE table_schema = 'public' AND table_name = %s
+                    );
+                """, (CHECKPOINT_TABLE,))
+                rows = []
+                if cursor.fetchone()[0]:
+                    cursor.execute(sql.replace('?', '%s'), (self.job_id,))
+                    rows = cursor.fetchall()
+                cursor.close()
+                conn.rollback()
+                return rows
+            
+            prep_stmt = None
+            try:
+                prep_stmt = conn.jconn.prepareStatement(sql)
+                set_statement_params(prep_stmt, [self.job_id])
+                result_set = prep_stmt.executeQuery()
+            except:
+                if prep_stmt is not None:
+                    prep_stmt.close()
+                return []  # 체크포인트 테이블 없음
+            
+            def text(index):
+                value = result_set.getString(index)
+                return str(value) if value is not None else None
+            
+            try:
+                rows = []
+                while result_set.next():
+                    rows.append((int(result_set.getInt(1)), int(result_set.getInt(2)), int(result_set.getInt(3)),
+                                 text(4), text(5), text(6), int(result_set.getLong(7))))
+                result_set.close()
+                return rows
+            finally:
+                prep_stmt.close()
+    
+    def track(self, partition, batch, key_indexes):
+        """변환 단계에서 적재로 넘기는 청크의 키 범위 기록 (청크는 파티션별로 키 순서)"""
+        keys = [key for key in zip(*[batch.column(i) for i in key_indexes]) if None not in key]
+        self._pending.append((partition, min(keys) if keys else None, max(keys) if keys else None))
+    
+    def _execute(self, sql, params):
+        if self._db_type == 'postgresql':
+            cursor = self._conn.cursor()
+            cursor.execute(sql.replace('?', '%s'), params)
+            cursor.close()
+            return
+        
+        prep_stmt = self._conn.jconn.prepareStatement(sql)
+        try:
+            set_statement_params(prep_stmt, params)
+            prep_stmt.executeUpdate()
+        finally:
+            prep_stmt.close()
+    
+    def _insert(self, partition_no, chunk_no, range_start, range_end, watermark, row_count):
+        self._execute(
+            f"INSERT INTO {CHECKPOINT_TABLE} (job_id, run_id, partition_no, chunk_no, range_start, range_end, "
+            f"watermark, row_count, committed_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [self.job_id, self.run_id, partition_no, chunk_no, range_start, range_end, watermark, row_count,
+             get_kst_now().isoformat(sep=' ')]
+        )
+    
+    def _commit(self):
+        if self._db_type == 'postgresql':
+            self._conn.commit()
+        else:
+            self._conn.jconn.commit()
+    
+    def begin(self, conn, db_type):
+        """적재 연결로 체크포인트 시작 (새 실행이면 이전 체크포인트를 지우고 실행 계획 기록, 커밋하지 않음)"""
+        self._conn = conn
+        self._db_type = db_type
+        _ensure_state_table(conn, db_type, CHECKPOINT_TABLE, f"""
+            CREATE TABLE {CHECKPOINT_TABLE} (
+                job_id INTEGER NOT NULL,
+                run_id INTEGER NOT NULL,
+                partition_no INTEGER NOT NULL,
+                chunk_no INTEGER NOT NULL,
+                range_start VARCHAR(1000),
+                range_end VARCHAR(1000),
+                watermark VARCHAR(1000),
+                row_count BIGINT,
+                committed_at VARCHAR(40)
+            )
+        """)
+        if self.resumed:
+            return
+        
+        self._execute(f"DELETE FROM {CHECKPOINT_TABLE} WHERE job_id = ?", [self.job_id])
+        min_value, max_value = self.bounds or (None, None)
+        self._insert(-1, 0, _encode_key([min_value]) if self.bounds else None,
+                     _encode_key([max_value]) if self.bounds else None, json.dumps(self.plan), 0)
+    
+    def commit_chunk(self, rows):
+        """적재한 청크의 체크포인트를 기록하고 커밋 (적재 함수가 청크마다 호출)"""
+        partition, start, end = self._pending.popleft()
+        self.chunk_no += 1
+        self.rows += rows
+        if end is not None:
+            self.partition_ends[partition] = end
+            if self.watermark is None or end > self.watermark:
+                self.watermark = end
+        
+        self._insert(partition, self.chunk_no, _encode_key(start), _encode_key(end),
+                     _encode_key(self.watermark), self.rows)
+        self._commit()
+    
+    def finish(self):
+        """모든 청크를 적재했으므로 체크포인트 삭제 (커밋하지 않음, 워터마크와 함께 커밋)"""
+        if self._conn is not None:
+            self._execute(f"DELETE FROM {CHECKPOINT_TABLE} WHERE job_id = ?", [self.job_id])
+    
+    def complete(self, target_conf, sync_state=None):
+        """남은 청크 없이 실행을 마침 (마지막 커밋 직전에 중단된 실행을 이어서 실행한 경우)"""
+        db_type = target_conf['type']
+        with pooled_connection(target_conf) as conn:
+            if db_type != 'postgresql':
+                conn.jconn.setAutoCommit(False)
+            self.begin(conn, db_type)
+            state = sync_state() if sync_state else None
+            if state is not None:
+                write_sync_state(conn, db_type, state[0], self.table_name, state[1])
+            self.finish()
+            self._commit()
+            self._conn = None
 
 def get_target_data_hashes(target_conf, table_name):
     """타겟 테이블에서 기존 데이터의 해시값들을 가져오기"""
@@ -613,13 +1213,7 @@ def get_target_data_hashes(target_conf, table_name):
         if target_db_type == 'postgresql':
             # PostgreSQL에서 해시값 가져오기
             import psycopg2
-            conn = psycopg2.connect(
-                host=target_conf['host'],
-                port=target_conf['port'],
-                database=target_conf['database'],
-                user=target_conf['user'],
-                password=target_conf['password']
-            )
+            conn = connect_pooled(target_conf)
             
             cursor = conn.cursor()
             
@@ -639,7 +1233,7 @@ def get_target_data_hashes(target_conf, table_name):
             
             # data_hash 컬럼에서 해시값들 가져오기
             cursor.execute(f"SELECT data_hash FROM {table_name}")
-            existing_hashes = {row[0] for row in cursor.fetchall()}
+            existing_hashes = {normalize_row_hash(row[0]) for row in cursor.fetchall()}
             
             cursor.close()
             conn.close()
@@ -647,17 +1241,7 @@ def get_target_data_hashes(target_conf, table_name):
             
         elif target_db_type == 'altibase':
             # Altibase에서 해시값 가져오기
-            import jaydebeapi
-            
-            url = f"jdbc:Altibase://{target_conf['host']}:{target_conf['port']}/{target_conf['database']}"
-            jar = "/app/db_connection_test/Altibase.jar"
-            
-            conn = jaydebeapi.connect(
-                "com.altibase.jdbc.driver.AltibaseDriver",
-                url,
-                [target_conf['user'], target_conf['password']],
-                jar
-            )
+            conn = connect_pooled(target_conf)
             
             cursor = conn.jconn.createStatement()
             
@@ -677,7 +1261,7 @@ def get_target_data_hashes(target_conf, table_name):
             
             existing_hashes = set()
             while result_set.next():
-                existing_hashes.add(result_set.getString(1))
+                existing_hashes.add(normalize_row_hash(result_set.getString(1)))
             
             result_set.close()
             conn.close()
@@ -685,19 +1269,9 @@ def get_target_data_hashes(target_conf, table_name):
             
         elif target_db_type == 'informix':
             # Informix에서 해시값 가져오기
-            import jaydebeapi
+            conn = connect_pooled(target_conf)
             
-            url = f"jdbc:informix-sqli://{target_conf['host']}:{target_conf['port']}/{target_conf['database']}:NEWCODESET=EUC-KR,cp1252,819"
-            jar = "/app/db_connection_test/ifxjdbc.jar"
-            
-            conn = jaydebeapi.connect(
-                "com.informix.jdbc.IfxDriver",
-                url,
-                [target_conf['user'], target_conf['password']],
-                jar
-            )
-            
-            cursor = conn.jconn.createStatement()
+            cursor = conn.jconn.createStatement()
             
             # 테이블 존재 여부 확인
             try:
@@ -715,7 +1289,7 @@ def get_target_data_hashes(target_conf, table_name):
             
             existing_hashes = set()
             while result_set.next():
-                existing_hashes.add(result_set.getString(1))
+                existing_hashes.add(normalize_row_hash(result_set.getString(1)))
             
             result_set.close()
             conn.close()
@@ -728,11 +1302,141 @@ def get_target_data_hashes(target_conf, table_name):
         print(f"타겟 데이터 해시 가져오기 실패: {e}")
         return set()
 
+def has_legacy_row_hashes(target_conf, table_name):
+    """
+    타겟의 data_hash가 이전 형식(md5 16자리 문자열)인지 확인 (테이블이나 data_hash 컬럼이 없으면 False)
+    
+    64비트 정수 지문으로 바뀌기 전에 적재한 행은 어떤 소스 행의 지문과도 일치하지 않으므로
+    해시 기반 증분 동기화가 타겟의 모든 행을 새 행으로 다시 추가합니다.
+    전체 동기화 한 번으로 모든 행이 새 지문으로 바뀌므로 한 행만 확인합니다.
+    """
+    query = f"SELECT data_hash FROM {table_name} WHERE data_hash IS NOT NULL"
+    
+    with pooled_connection(target_conf) as conn:
+        if target_conf['type'] == 'postgresql':
+            cursor = conn.cursor()
+            try:
+                cursor.execute(query + " LIMIT 1")
+                row = cursor.fetchone()
+            except Exception:
+                row = None  # 테이블 또는 data_hash 컬럼 없음
+            finally:
+                cursor.close()
+                conn.rollback()
+        else:
+            stmt = conn.jconn.createStatement()
+            try:
+                stmt.setMaxRows(1)
+                result_set = stmt.executeQuery(query)
+                row = (str(result_set.getString(1)),) if result_set.next() else None
+                result_set.close()
+            except Exception:
+                row = None  # 테이블 또는 data_hash 컬럼 없음
+            finally:
+                stmt.close()
+    
+    return row is not None and not isinstance(normalize_row_hash(row[0]), int)
+
+def get_target_hash_summary(target_conf, table_name):
+    """타겟 테이블의 행 수와 data_hash 합계 (해시 인덱스 검증용, 테이블이 없으면 None)"""
+    query = f"SELECT COUNT(*), SUM(data_hash) FROM {table_name}"
+    
+    with pooled_connection(target_conf) as conn:
+        if target_conf['type'] == 'postgresql':
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT EXISTS (
+                    SELECT FROM information_schema.tables 
+                    WHERE table_schema = 'public' AND table_name = %s
+                );
+            """, (table_name,))
+            if not cursor.fetchone()[0]:
+                cursor.close()
+                return None
+            cursor.execute(query)
+            row_count, checksum = cursor.fetchone()
+            cursor.close()
+            conn.rollback()
+        else:
+            stmt = conn.jconn.createStatement()
+            try:
+                try:
+                    result_set = stmt.executeQuery(query)
+                except:
+                    return None  # 테이블 없음
+                result_set.next()
+                row_count = int(str(result_set.getString(1)))
+                checksum = result_set.getString(2)
+                result_set.close()
+            finally:
+                stmt.close()
+    
+    return int(row_count), int(Decimal(str(checksum))) if checksum is not None else 0
+
+def iter_target_hashes(target_server, table_name, chunk_size=100000):
+    """타겟 테이블의 data_hash를 청크 단위로 읽기 (이전 형식의 문자열 해시는 제외)"""
+    _, chunks, success, error = open_query_stream(
+        target_server, f"SELECT data_hash FROM {table_name}", chunk_size, with_hash=False
+    )
+    if not success:
+        raise Exception(f"타겟 해시 조회 실패: {error}")
+    
+    try:
+        for chunk in chunks:
+            hashes = map(normalize_row_hash, chunk.column(0))
+            yield [row_hash for row_hash in hashes if isinstance(row_hash, int)]
+    finally:
+        chunks.close()
+
+def open_job_hash_index(job, target_conf):
+    """
+    작업의 로컬 해시 인덱스 열기 (타겟의 행 수/체크섬과 다르면 타겟에서 다시 만듦)
+    
+    Returns:
+        JobHashIndex: 타겟과 일치하는 인덱스
+    """
+    hash_index = JobHashIndex.for_job(job.id)
+    summary = get_target_hash_summary(target_conf, job.target_table)
+    
+    if summary is None:
+        # 타겟 테이블이 아직 없으면 빈 인덱스로 시작
+        hash_index.rebuild([], 0, 0)
+    elif hash_index.load() and hash_index.matches(*summary):
+        print(f"해시 인덱스 사용: {len(hash_index)}개 (타겟 {summary[0]}행, 타겟 전체 조회 생략)")
+    else:
+        if hash_index.target_rows is not None:
+            print(f"해시 인덱스가 타겟과 다릅니다. (인덱스 {hash_index.target_rows}행, 타겟 {summary[0]}행) 다시 만듭니다.")
+        else:
+            print("해시 인덱스가 없습니다. 타겟에서 만듭니다.")
+        hash_index.rebuild(iter_target_hashes(job.target_server, job.target_table), *summary)
+    return hash_index
+
+def filter_new_data_by_index(source_data, hash_index):
+    """로컬 해시 인덱스에 없는 데이터만 필터링 (첫 번째 컬럼이 data_hash)"""
+    if not source_data:
+        return source_data
+    
+    hashes = source_data.column(0) if isinstance(source_data, ColumnBatch) else [row[0] for row in source_data]
+    mask = [not found for found in hash_index.contains_many(hashes)]
+    
+    if isinstance(source_data, ColumnBatch):
+        new_data = source_data.filter(mask)
+    else:
+        new_data = [row for row, keep in zip(source_data, mask) if keep]
+    print(f"해시 기반 필터링 (로컬 인덱스): 전체 {len(source_data)}행 중 새로운 데이터 {len(new_data)}행")
+    return new_data
+
 def filter_new_data_by_hash(source_data, target_hashes):
     """해시 기반으로 새로운 데이터만 필터링"""
     if not source_data:
         return []
     
+    if isinstance(source_data, ColumnBatch):
+        # 컬럼 배치는 data_hash 컬럼만 보고 마스크로 필터링
+        new_data = source_data.filter([row_hash not in target_hashes for row_hash in source_data.column(0)])
+        print(f"해시 기반 필터링: 전체 {len(source_data)}행 중 새로운 데이터 {len(new_data)}행")
+        return new_data
+    
     new_data = []
     for row in source_data:
         if len(row) > 0:
@@ -743,48 +1447,416 @@ def filter_new_data_by_hash(source_data, target_hashes):
     print(f"해시 기반 필터링: 전체 {len(source_data)}행 중 새로운 데이터 {len(new_data)}행")
     return new_data
 
-def detect_changes(source_data, target_data, sync_key_column):
-    """변경사항 감지 (추가, 수정, 삭제)"""
+class ServerHashFilter:
+    """
+    타겟 DB에서 안티 조인으로 새 데이터만 고르는 해시 필터 (해시 전략의 서버 측 비교 모드)
+    
+    타겟의 해시를 모두 메모리에 올리는 대신, 청크의 data_hash만 타겟의 스테이징 테이블에 넣고
+    NOT EXISTS로 타겟에 없는 해시를 조회합니다. 메모리에는 청크 하나 분량의 해시만 올라오며,
+    타겟 테이블의 data_hash 인덱스는 없으면 자동으로 생성합니다.
+    스테이징 테이블은 실행마다 다른 이름으로 만들고(PostgreSQL은 세션 임시 테이블) close()에서 삭제합니다.
+    """
+    
+    def __init__(self, target_conf, table_name):
+        self.db_type = target_conf['type']
+        self.table_name = table_name
+        self.stage_table = stage_table_name(table_name, 'hs')
+        self.stage_created = False
+        self.table_exists = False
+        self.numeric_hash = True
+        self.conn = connect_pooled(target_conf)
+        try:
+            if self.db_type == 'postgresql':
+                self._prepare_postgresql()
+            else:
+                self._prepare_jdbc()
+        except Exception:
+            self._drop_stage()
+            self.conn.invalidate()
+            self.conn = None
+            raise
+    
+    def _ensure_hash_index(self, cursor):
+        """data_hash 인덱스가 없으면 생성 (만들 수 없으면 로그만 남기고 인덱스 없이 비교)"""
+        print(f"data_hash 인덱스 확인: {self.table_name}")
+        try:
+            if find_index(self.db_type, cursor, self.table_name, ['data_hash']):
+                return
+            cursor.execute(f"CREATE INDEX {self.table_name}_data_hash_idx ON {self.table_name} (data_hash)")
+        except Exception as e:
+            print(f"data_hash 인덱스를 만들지 못했습니다. 인덱스 없이 비교합니다: {e}")
+            if self.db_type == 'postgresql':
+                self.conn.rollback()
+    
+    def _prepare_postgresql(self):
+        """PostgreSQL: data_hash 인덱스 확인 및 세션 임시 스테이징 테이블 생성"""
+        self.conn.autocommit = True
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            SELECT EXISTS (
+                SELECT FROM information_schema.tables 
+                WHERE table_schema = 'public' AND table_name = %s
+            );
+        """, (self.table_name,))
+        self.table_exists = cursor.fetchone()[0]
+        if not self.table_exists:
+            cursor.close()
+            return
+        
+        self._ensure_hash_index(cursor)
+        
+        # 타겟과 같은 타입의 세션 임시 테이블
+        cursor.execute(f"CREATE TEMP TABLE {self.stage_table} AS SELECT data_hash FROM {self.table_name} WHERE 1=0")
+        self.stage_created = True
+        cursor.close()
+    
+    def _prepare_jdbc(self):
+        """Altibase/Informix: data_hash 인덱스 확인 및 스테이징 테이블 생성"""
+        jconn = self.conn.jconn
+        stmt = jconn.createStatement()
+        try:
+            try:
+                stmt.executeQuery(f"SELECT data_hash FROM {self.table_name} WHERE 1=0").close()
+                self.table_exists = True
+            except Exception as e:
+                print(f"타겟 테이블 {self.table_name}의 data_hash를 조회할 수 없어 모든 행을 새 데이터로 처리합니다: {e}")
+                self.table_exists = False
+            if not self.table_exists:
+                return
+            
+            self._ensure_hash_index(stmt)
+            
+            # 타겟과 같은 타입의 스테이징 테이블 (실행마다 다른 이름)
+            stmt.execute(f"CREATE TABLE {self.stage_table} AS SELECT data_hash FROM {self.table_name} WHERE 1=0")
+            self.stage_created = True
+            
+            result_set = stmt.executeQuery(f"SELECT data_hash FROM {self.stage_table} WHERE 1=0")
+            # java.sql.Types: BIGINT, INTEGER, NUMERIC, DECIMAL (이전 형식은 문자열 컬럼)
+            self.numeric_hash = result_set.getMetaData().getColumnType(1) in (-5, 4, 2, 3)
+            result_set.close()
+        finally:
+            stmt.close()
+    
+    def find_new_hashes(self, hashes):
+        """타겟에 없는 해시 집합 조회"""
+        if not self.table_exists:
+            return set(hashes)
+        if self.db_type == 'postgresql':
+            return self._find_new_hashes_postgresql(hashes)
+        return self._find_new_hashes_jdbc(hashes)
+    
+    def _find_new_hashes_postgresql(self, hashes):
+        cursor = self.conn.cursor()
+        cursor.execute(f"TRUNCATE {self.stage_table}")
+        cursor.copy_from(io.StringIO('\n'.join(map(str, hashes))), self.stage_table, columns=('data_hash',))
+        cursor.execute(f"""
+            SELECT s.data_hash FROM {self.stage_table} s
+            WHERE NOT EXISTS (
+                SELECT 1 FROM {self.table_name} t WHERE t.data_hash = s.data_hash
+            )
+        """)
+        new_hashes = {normalize_row_hash(row[0]) for row in cursor.fetchall()}
+        cursor.close()
+        return new_hashes
+    
+    def _find_new_hashes_jdbc(self, hashes):
+        jconn = self.conn.jconn
+        stmt = jconn.createStatement()
+        insert_stmt = jconn.prepareStatement(f"INSERT INTO {self.stage_table} (data_hash) VALUES (?)")
+        try:
+            stmt.execute(f"DELETE FROM {self.stage_table}")
+            for row_hash in hashes:
+                if self.numeric_hash:
+                    insert_stmt.setLong(1, row_hash)
+                else:
+                    insert_stmt.setString(1, str(row_hash))
+                insert_stmt.addBatch()
+            insert_stmt.executeBatch()
+            
+            result_set = stmt.executeQuery(f"""
+                SELECT s.data_hash FROM {self.stage_table} s
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM {self.table_name} t WHERE t.data_hash = s.data_hash
+                )
+            """)
+            new_hashes = set()
+            while result_set.next():
+                new_hashes.add(normalize_row_hash(result_set.getString(1)))
+            result_set.close()
+            return new_hashes
+        finally:
+            insert_stmt.close()
+            stmt.close()
+    
+    def filter(self, batch):
+        """해시가 타겟에 없는 행만 남김 (첫 번째 컬럼이 data_hash)"""
+        if not batch:
+            return batch
+        
+        hashes = batch.column(0) if isinstance(batch, ColumnBatch) else [row[0] for row in batch]
+        new_hashes = self.find_new_hashes(hashes)
+        mask = [row_hash in new_hashes for row_hash in hashes]
+        
+        if isinstance(batch, ColumnBatch):
+            new_data = batch.filter(mask)
+        else:
+            new_data = [row for row, keep in zip(batch, mask) if keep]
+        print(f"해시 기반 필터링 (서버 측 비교): 전체 {len(batch)}행 중 새로운 데이터 {len(new_data)}행")
+        return new_data
+    
+    def _drop_stage(self):
+        """스테이징 테이블 삭제 (삭제하지 못하면 False)"""
+        if not self.stage_created:
+            return True
+        try:
+            if self.db_type == 'postgresql':
+                self.conn.rollback()
+                cursor = self.conn.cursor()
+                cursor.execute(f"DROP TABLE IF EXISTS {self.stage_table}")
+                cursor.close()
+            else:
+                stmt = self.conn.jconn.createStatement()
+                try:
+                    stmt.execute(f"DROP TABLE {self.stage_table}")
+                finally:
+                    stmt.close()
+        except Exception as e:
+            print(f"해시 스테이징 테이블 삭제 실패: {self.stage_table} ({e})")
+            return False
+        self.stage_created = False
+        return True
+    
+    def close(self):
+        """스테이징 테이블 정리 후 연결 반납"""
+        if self.conn is None:
+            return
+        if self._drop_stage():
+            self.conn.close()
+        else:
+            # 임시 테이블이 남은 연결은 재사용하지 않음
+            self.conn.invalidate()
+        self.conn = None
+
+def stage_table_name(table_name, kind):
+    """실행마다 다른 스테이징 테이블 이름 (같은 타겟 테이블에 동시에 적재하는 작업/실행끼리 겹치지 않음)"""
+    import uuid
+    return suffixed_name(table_name, f"_{kind}_{int(time.time())}_{uuid.uuid4().hex[:6]}")
+
+def resolve_key_columns(columns, key_columns):
+    """
+    키 컬럼명을 결과 컬럼명(대소문자 그대로)과 위치로 변환 (없는 컬럼이 있으면 예외)
+    
+    Returns:
+        tuple: (컬럼명 리스트, 위치 리스트)
+    """
+    indexes = [find_column_index(columns, column) for column in key_columns]
+    missing = [column for column, index in zip(key_columns, indexes) if index is None]
+    if missing:
+        raise Exception(f"업서트 키 컬럼이 쿼리 결과에 없습니다: {', '.join(missing)}")
+    return [columns[index] for index in indexes], indexes
+
+def dedupe_by_key(data, key_indexes):
+    """같은 키의 행이 여러 개면 마지막 행만 남김 (MERGE/ON CONFLICT는 한 문장에서 같은 행을 두 번 갱신할 수 없음)"""
+    if isinstance(data, ColumnBatch):
+        keys = list(zip(*[data.column(i) for i in key_indexes]))
+    else:
+        keys = [tuple(row[i] for i in key_indexes) for row in data]
+    
+    last = {key: i for i, key in enumerate(keys)}
+    if len(last) == len(keys):
+        return data
+    
+    keep = set(last.values())
+    mask = [i in keep for i in range(len(keys))]
+    print(f"업서트 키 중복 제거: {len(keys)}행 중 {len(keys) - len(keep)}행")
+    if isinstance(data, ColumnBatch):
+        return data.filter(mask)
+    return [row for row, keep_row in zip(data, mask) if keep_row]
+
+def track_chunks(chunks, stats):
+    """청크 스트림을 통과시키면서 행 수와 마지막 행을 stats에 기록"""
+    for chunk in chunks:
+        stats['rows'] += len(chunk)
+        if len(chunk):
+            stats['last_row'] = chunk[-1]
+        yield chunk
+
+def track_changes(change_sets, stats):
+    """키 비교 ChangeSet 스트림을 통과시키면서 추가/수정/삭제/동일 행 수를 stats에 기록 (빈 ChangeSet은 세기만 함)"""
+    for changes in change_sets:
+        stats['added'] = stats.get('added', 0) + changes.added_count
+        stats['updated'] = stats.get('updated', 0) + len(changes.updated)
+        stats['deleted'] = stats.get('deleted', 0) + len(changes.deleted)
+        stats['unchanged'] = stats.get('unchanged', 0) + changes.unchanged_count
+        if changes:
+            yield changes
+
+def target_table_exists(target_conf, table_name):
+    """타겟 테이블 존재 여부"""
+    with pooled_connection(target_conf) as conn:
+        if target_conf['type'] == 'postgresql':
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT EXISTS (
+                    SELECT FROM information_schema.tables 
+                    WHERE table_schema = 'public' AND table_name = %s
+                );
+            """, (table_name,))
+            exists = cursor.fetchone()[0]
+            cursor.close()
+            conn.rollback()
+            return exists
+        
+        stmt = conn.jconn.createStatement()
+        try:
+            stmt.executeQuery(f"SELECT 1 FROM {table_name} WHERE 1=0").close()
+            return True
+        except:
+            return False
+        finally:
+            stmt.close()
+
+def fetch_query_rows(server_name, query):
+    """결과가 작은 쿼리(집계 등)의 모든 행 조회 (행과 같은 순서의 컬럼명, 행 리스트 반환)"""
+    columns, chunks, success, error = open_query_stream(server_name, query, 10000, with_hash=False)
+    if not success:
+        raise Exception(error)
+    # 해시 없이 읽은 행이므로 컬럼명에서도 앞에 붙은 data_hash 제외
+    return columns[1:], [row for chunk in chunks for row in chunk]
+
+def validate_job_config(job):
+    """
+    작업 설정 검증 (저장/실행 전에 호출)
+    
+    Returns:
+        str: 문제가 있으면 오류 메시지, 없으면 None
+    """
+    if job.incremental_sync and job.sync_strategy == 'checksum':
+        # 행 해시를 DB 안에서 계산할 수 없는 DB는 값이 바뀌어도 구간 체크섬이 같을 수 있음
+        # (소스와 타겟에서 같은 구간 체크섬을 계산해 비교하므로 양쪽 모두 지원하는 DB여야 함)
+        for role, server_name in (('소스', job.source_server), ('타겟', job.target_server)):
+            db_type = get_server_config(server_name)['type']
+            if db_type not in RANGE_CHECKSUM_DB_TYPES:
+                return (f"범위 체크섬 전략은 소스와 타겟이 {', '.join(RANGE_CHECKSUM_DB_TYPES)}인 경우만 "
+                        f"사용할 수 있습니다. ({role} '{server_name}': {db_type}, 키 비교 전략을 사용하세요)")
+    if not job.incremental_sync and job.full_sync_method == 'swap':
+        # Altibase는 이름 변경 DDL이 바로 커밋되어 교체 중간에 테이블이 보이지 않는 순간이 생김
+        db_type = get_server_config(job.target_server)['type']
+        if db_type not in SWAP_DB_TYPES:
+            return (f"섀도 테이블 교체는 타겟이 {', '.join(SWAP_DB_TYPES)}인 경우만 사용할 수 있습니다. "
+                    f"(타겟 '{job.target_server}': {db_type}, 삭제 후 적재 방식을 사용하세요)")
+    return None
+
+def reconcile_due(job, now):
+    """삭제 반영 주기가 지났는지 (주기가 비어있거나 한 번도 실행하지 않았으면 True)"""
+    if not job.reconcile_interval_hours or job.last_reconciled_at is None:
+        return True
+    last_reconciled_at = job.last_reconciled_at
+    if last_reconciled_at.tzinfo is None:
+        last_reconciled_at = last_reconciled_at.replace(tzinfo=KST)
+    return now - last_reconciled_at >= timedelta(hours=job.reconcile_interval_hours)
+
+# 소스 키 값의 파이썬 타입별 타겟 DB의 CAST 타입 (문자열 키는 변환하지 않음)
+KEY_CAST_TYPES = {
+    'postgresql': {int: 'BIGINT', Decimal: 'NUMERIC', float: 'DOUBLE PRECISION', datetime: 'TIMESTAMP', date: 'DATE'},
+    'altibase': {int: 'BIGINT', Decimal: 'NUMERIC', float: 'DOUBLE', datetime: 'DATE', date: 'DATE'},
+    'informix': {int: 'BIGINT', Decimal: 'DECIMAL(32)', float: 'FLOAT',
+                 datetime: 'DATETIME YEAR TO FRACTION(5)', date: 'DATE'},
+}
+
+def typed_key_query(db_type, table_name, columns, key_columns, sample_key, where=None):
+    """
+    타겟 테이블을 소스 키 타입으로 변환한 키 순서로 읽는 쿼리
+    
+    타겟은 컬럼을 TEXT/VARCHAR로 만들기 때문에 그대로 읽으면 정수 키가 문자열로 비교되고
+    '10'이 '9'보다 앞에 정렬됩니다. 소스 첫 행의 키 값(sample_key) 타입으로 키 컬럼을 CAST해
+    같은 이름으로 읽고, where와 ORDER BY도 변환한 값에 적용합니다.
+    변환한 키 컬럼이 있으면 타겟에 저장된 원래 키 값을 결과 끝에 덧붙입니다. (삭제할 때 사용)
+    
+    Returns:
+        tuple: (쿼리, 원래 키 값의 위치 또는 None(변환한 키 없음))
+    """
+    cast_types = KEY_CAST_TYPES.get(db_type, {})
+    casts = {}
+    for column, value in zip(key_columns, sample_key or ()):
+        cast_type = cast_types.get(type(value))
+        if cast_type:
+            casts[column] = cast_type
+    
+    if not casts:
+        query = f"SELECT {', '.join(columns)} FROM {table_name}"
+        if where:
+            query += f" WHERE {where}"
+        return query + f" ORDER BY {', '.join(key_columns)}", None
+    
+    select_list = [f"CAST({column} AS {casts[column]}) AS {column}" if column in casts else column
+                   for column in columns]
+    select_list += [f"{column} AS fs_raw_key_{i}" for i, column in enumerate(key_columns)]
+    query = f"SELECT * FROM (SELECT {', '.join(select_list)} FROM {table_name}) typed_tgt"
+    if where:
+        query += f" WHERE {where}"
+    query += f" ORDER BY {', '.join(key_columns)}"
+    return query, list(range(len(columns), len(columns) + len(key_columns)))
+
+def open_diff_target_stream(target_server, table_name, columns, merge_keys, chunk_size=10000, fetch_size=None,
+                            where=None, sample_row=None):
+    """
+    키 비교용 타겟 스트림 열기 (소스와 같은 컬럼을 업서트 키 순서로 읽음, where가 있으면 해당 범위만)
+    
+    sample_row(data_hash가 없는 소스 첫 행)가 있으면 타겟 키 컬럼을 소스 키 타입으로 변환해 읽습니다.
+    
+    Returns:
+        tuple: (청크 스트림, 키 컬럼 위치, 삭제할 원래 키 값의 위치 또는 None) - 타겟 테이블이 없으면 빈 스트림
+    """
+    key_columns, key_indexes = resolve_key_columns(columns, merge_keys)
+    if not target_table_exists(get_server_config(target_server), table_name):
+        print(f"타겟 테이블 {table_name}이 없어 모든 소스 행을 추가로 처리합니다.")
+        return iter(()), key_indexes, None
+    
+    # columns는 data_hash가 앞에 붙은 목록이므로 소스 행에서는 한 칸 앞의 값
+    sample_key = tuple(sample_row[i - 1] for i in key_indexes) if sample_row is not None else None
+    query, delete_key_indexes = typed_key_query(
+        get_server_config(target_server)['type'], table_name, columns, key_columns, sample_key, where
+    )
+    _, chunks, success, error = open_query_stream(target_server, query, chunk_size, fetch_size, with_hash=False)
+    if not success:
+        raise Exception(f"타겟 비교 쿼리 실행 실패: {error}")
+    return chunks, key_indexes, delete_key_indexes
+
+def peek_chunks(chunks):
+    """첫 번째 청크를 미리 확인 (첫 청크와 원래 순서의 청크 이터레이터 반환)"""
+    import itertools
+    
+    chunks = iter(chunks)
+    first_chunk = next(chunks, None)
+    if first_chunk is None:
+        return None, iter(())
+    return first_chunk, itertools.chain([first_chunk], chunks)
+
+def detect_changes(source_data, target_data, key_indexes):
+    """
+    변경사항 감지 (추가, 수정, 삭제)
+    
+    메모리에 있는 두 행 리스트를 키 순서로 정렬한 뒤 merge_diff로 병합 비교합니다.
+    큰 테이블은 DB에서 키 순서로 읽은 청크 스트림을 merge_diff에 직접 넘기세요.
+    
+    Returns:
+        dict: added(소스 행), updated({'old', 'new', 'mask'}), deleted(타겟 행)
+    """
+    def row_key(row):
+        return tuple(row[i] for i in key_indexes)
+    
     changes = {
         'added': [],
         'updated': [],
         'deleted': []
     }
-    
-    # 해시 기반 변경 감지
-    source_dict = {}
-    target_dict = {}
-    
-    # 소스 데이터를 해시로 변환
-    for row in source_data:
-        if len(row) > 0:
-            row_hash = row[0]  # 첫 번째 컬럼이 해시 ID
-            source_dict[row_hash] = row
-    
-    # 타겟 데이터를 해시로 변환
-    for row in target_data:
-        if len(row) > 0:
-            row_hash = row[0]  # 첫 번째 컬럼이 해시 ID
-            target_dict[row_hash] = row
-    
-    # 추가된 항목
-    for row_hash in source_dict:
-        if row_hash not in target_dict:
-            changes['added'].append(source_dict[row_hash])
-    
-    # 삭제된 항목
-    for row_hash in target_dict:
-        if row_hash not in source_dict:
-            changes['deleted'].append(target_dict[row_hash])
-    
-    # 수정된 항목 (해시가 같지만 내용이 다른 경우)
-    for row_hash in source_dict:
-        if row_hash in target_dict:
-            if source_dict[row_hash] != target_dict[row_hash]:
-                changes['updated'].append({
-                    'old': target_dict[row_hash],
-                    'new': source_dict[row_hash]
-                })
+    for change_set in merge_diff([sorted(source_data, key=row_key)], [sorted(target_data, key=row_key)],
+                                 key_indexes, key_indexes):
+        updated_rows = {id(new) for _, new, _ in change_set.updated}
+        changes['added'].extend(row for row in change_set if id(row) not in updated_rows)
+        changes['updated'].extend({'old': old, 'new': new, 'mask': mask} for old, new, mask in change_set.updated)
+        changes['deleted'].extend(change_set.deleted)
     
     return changes
 
@@ -799,6 +1871,8 @@ class ServerConfig(db.Model):
     database = db.Column(db.String(100), nullable=False)
     user = db.Column(db.String(100), nullable=False)
     password = db.Column(db.String(200), nullable=False)
+    pool_min_size = db.Column(db.Integer)  # 연결 풀 최소 연결 수 (비어있으면 기본값)
+    pool_max_size = db.Column(db.Integer)  # 연결 풀 최대 연결 수 (비어있으면 기본값)
     created_at = db.Column(db.DateTime, default=lambda: get_kst_now())
     updated_at = db.Column(db.DateTime, default=lambda: get_kst_now(), onupdate=lambda: get_kst_now())
 
@@ -813,13 +1887,25 @@ class BatchJob(db.Model):
     target_table = db.Column(db.String(100), nullable=False)
     chunk_size = db.Column(db.Integer, default=10000)
     num_workers = db.Column(db.Integer, default=4)
+    fetch_size = db.Column(db.Integer)  # 소스 fetch 크기 (JDBC fetchSize / PostgreSQL itersize, 비어있으면 기본값)
+    partition_column = db.Column(db.String(100))  # 병렬 추출 파티션 컬럼 (비어있으면 sync_key_column)
+    partition_method = db.Column(db.String(20))  # range, modulo (비어있으면 range)
+    hash_filter_mode = db.Column(db.String(20))  # 해시 전략 비교 방식: memory, server, index (비어있으면 memory)
+    checkpoint_enabled = db.Column(db.Boolean, default=False)  # 청크마다 커밋하고 실패 시 이어서 실행
+    full_sync_method = db.Column(db.String(20))  # 전체 동기화 방식: delete, swap (비어있으면 delete)
+    pg_fast_load = db.Column(db.Boolean, default=False)  # PostgreSQL 타겟 빠른 적재 (UNLOGGED 임시 테이블, TRUNCATE, synchronous_commit=off, COPY FREEZE)
+    merge_key_columns = db.Column(db.String(200))  # 업서트 키 컬럼 (증분 동기화 시 키 기준 INSERT/UPDATE, 비어있으면 추가만)
+    reconcile_deletes = db.Column(db.Boolean, default=False)  # 증분 동기화 후 소스에서 삭제된 키를 타겟에서 삭제
+    reconcile_interval_hours = db.Column(db.Integer)  # 삭제 반영 주기 (시간, 비어있으면 매 실행)
+    last_reconciled_at = db.Column(db.DateTime)  # 마지막 삭제 반영 시간
     is_active = db.Column(db.Boolean, default=True)
     
     # 증분 동기화 관련 필드
     incremental_sync = db.Column(db.Boolean, default=False)  # 증분 동기화 사용 여부
     sync_key_column = db.Column(db.String(100))  # 동기화 키 컬럼 (예: updated_at, id)
-    last_sync_value = db.Column(db.String(200))  # 마지막 동기화 값
-    sync_strategy = db.Column(db.String(50), default='timestamp')  # timestamp, sequence, hash
+    last_sync_value = db.Column(db.String(200))  # 마지막 동기화 값 (화면 표시용, 복합 키는 쉼표로 구분)
+    sync_watermark = db.Column(db.Text)  # 구조화된 워터마크 (키 컬럼별 타입과 값, JSON)
+    sync_strategy = db.Column(db.String(50), default='timestamp')  # timestamp, sequence, hash, diff, checksum
     
     created_at = db.Column(db.DateTime, default=lambda: get_kst_now())
     updated_at = db.Column(db.DateTime, default=lambda: get_kst_now(), onupdate=lambda: get_kst_now())
@@ -848,6 +1934,9 @@ class BatchLog(db.Model):
     rows_per_second = db.Column(db.Float)
     mb_per_second = db.Column(db.Float)
     error_message = db.Column(db.Text)
+    extract_seconds = db.Column(db.Float)  # 추출 단계 소요 시간
+    transform_seconds = db.Column(db.Float)  # 변환(해시/필터) 단계 소요 시간
+    load_seconds = db.Column(db.Float)  # 적재 단계 소요 시간
     started_at = db.Column(db.DateTime, default=lambda: get_kst_now())
     completed_at = db.Column(db.DateTime)
     
@@ -869,8 +1958,8 @@ class QueryHistory(db.Model):
 class ConfigManager:
     """설정 파일 관리 클래스"""
     
-    def __init__(self, config_file='/app/db_connection_test/db_servers.ini'):
-        self.config_file = config_file
+    def __init__(self, config_file=None):
+        self.config_file = config_file or server_registry.config_file
     
     def load_config(self):
         """설정 파일 로드"""
@@ -899,8 +1988,17 @@ class ConfigManager:
                 'user': server.user,
                 'password': server.password
             }
+            
+            # 연결 풀 크기는 설정된 경우에만 기록
+            if server.pool_min_size is not None:
+                config[server.name]['pool_min_size'] = str(server.pool_min_size)
+            if server.pool_max_size is not None:
+                config[server.name]['pool_max_size'] = str(server.pool_max_size)
         
         self.save_config(config)
+        
+        # 메모리 레지스트리 교체 (버전 증가)
+        server_registry.update({name: config[name] for name in config.sections()})
     
     def sync_to_database(self):
         """설정 파일에서 데이터베이스로 동기화"""
@@ -920,6 +2018,8 @@ class ConfigManager:
                 existing.database = section['database']
                 existing.user = section['user']
                 existing.password = section['password']
+                existing.pool_min_size = section.getint('pool_min_size', fallback=None)
+                existing.pool_max_size = section.getint('pool_max_size', fallback=None)
             else:
                 # 새로 생성
                 server = ServerConfig(
@@ -929,7 +2029,9 @@ class ConfigManager:
                     port=int(section['port']),
                     database=section['database'],
                     user=section['user'],
-                    password=section['password']
+                    password=section['password'],
+                    pool_min_size=section.getint('pool_min_size', fallback=None),
+                    pool_max_size=section.getint('pool_max_size', fallback=None)
                 )
                 db.session.add(server)
         
@@ -958,162 +2060,409 @@ class BatchExecutor:
         db.session.commit()
         
         try:
-            # 설정 파일 동기화
-            self.config_manager.sync_from_database()
-            
             # 쿼리 실행 (데이터베이스 타입에 따라 적절한 함수 사용)
             start_time = time.time()
             
-            # 작업 디렉토리를 db_connection_test로 변경
-            original_cwd = os.getcwd()
-            os.chdir('/app/db_connection_test')
+            # 서버 설정 가져오기
+            conf = get_server_config(job.source_server)
+            db_type = conf['type']
+            
+            print(f"=== 배치 작업 실행 시작 ===")
+            print(f"작업 ID: {job.id}")
+            print(f"작업명: {job.name}")
+            print(f"소스 서버: {job.source_server} ({db_type})")
+            print(f"타겟 서버: {job.target_server}")
+            print(f"쿼리: {job.query}")
+            print(f"청크 크기: {job.chunk_size}, fetch 크기: {job.fetch_size or '기본값'}")
+            print(f"증분 동기화: {job.incremental_sync}")
+            if job.incremental_sync:
+                print(f"동기화 전략: {job.sync_strategy}")
+                print(f"동기화 키 컬럼: {job.sync_key_column}")
+                print(f"마지막 동기화 값: {job.last_sync_value}")
+            
+            # 타겟 서버 설정 가져오기
+            target_conf = get_server_config(job.target_server)
+            target_db_type = target_conf['type']
+            print(f"타겟 데이터베이스 타입: {target_db_type}")
+            
+            # 타임스탬프/시퀀스 전략은 키 컬럼의 최대값(워터마크)을 적재와 같은 트랜잭션으로 타겟에 기록
+            watermark_sync = (job.incremental_sync and job.sync_strategy in ('timestamp', 'sequence')
+                              and bool(job.sync_key_column))
+            
+            key_columns = parse_sync_key_columns(job.sync_key_column)
+            sync_mode = "incremental" if job.incremental_sync else "full"
+            
+            # 증분 동기화가 활성화된 경우 증분 쿼리 실행
+            source_params = None
+            if job.incremental_sync and job.sync_key_column and job.sync_strategy:
+                print("증분 동기화 모드로 실행 중...")
+                last_sync_value = job.sync_watermark or job.last_sync_value
+                if watermark_sync:
+                    # 타겟에 커밋된 워터마크가 기준 (작업 정보의 값은 사본)
+                    target_watermark = read_sync_state(target_conf, job.id)
+                    if target_watermark is not None:
+                        last_sync_value = target_watermark
+                        print(f"타겟에 기록된 워터마크: {target_watermark}")
+                source_query, source_params = build_incremental_query(
+                    job.query, 
+                    job.sync_key_column, 
+                    last_sync_value, 
+                    job.sync_strategy,
+                    db_type
+                )
+                print(f"증분 동기화 쿼리: {source_query} (파라미터: {source_params})")
+            else:
+                # 일반 쿼리 실행 (전체 동기화)
+                print("전체 동기화 모드로 실행 중...")
+                source_query = job.query
+            
+            # 해시 기반 증분 동기화인 경우 타겟의 기존 해시 조회
+            # (서버 측 비교 모드는 해시를 메모리에 올리지 않고 청크마다 타겟 DB에서 안티 조인,
+            #  로컬 인덱스 모드는 작업별 인덱스 파일을 타겟 행 수/체크섬으로만 검증)
+            target_hashes = None
+            hash_index = None
+            hash_sync = job.incremental_sync and job.sync_strategy == 'hash'
+            if hash_sync and has_legacy_row_hashes(target_conf, job.target_table):
+                # 이전 형식 해시와는 비교할 수 없으므로 이번 한 번만 전체 동기화로 모든 행을 새 지문으로 다시 적재
+                print("⚠️ 타겟의 data_hash가 이전 형식(md5)입니다. 이번 실행은 전체 동기화로 새 지문을 다시 적재합니다.")
+                hash_sync = False
+                sync_mode = "full"
+                source_query = job.query
+            # 키 비교 전략은 소스/타겟을 업서트 키 순서로 병합 조인해 추가/수정/삭제를 반영
+            # (범위 체크섬 전략은 구간별 체크섬이 달라진 키 범위만 같은 방식으로 비교)
+            diff_sync = job.incremental_sync and job.sync_strategy in ('diff', 'checksum')
+            merge_keys = parse_sync_key_columns(job.merge_key_columns)
+            if diff_sync and not merge_keys:
+                raise Exception("키 비교/범위 체크섬 전략은 업서트 키 컬럼이 필요합니다.")
+            
+            range_index = None
+            diff_where = None
+            if diff_sync and job.sync_strategy == 'checksum':
+                range_index, diff_where = self._plan_range_checksum(job, target_conf, source_query, merge_keys[0])
+                if diff_where is not None:
+                    source_query = f"SELECT * FROM ({source_query}) range_src WHERE {diff_where}"
+            server_hash_filter = hash_sync and job.hash_filter_mode == 'server'
+            if hash_sync and job.hash_filter_mode == 'index':
+                try:
+                    hash_index = open_job_hash_index(job, target_conf)
+                except Exception as e:
+                    print(f"해시 인덱스를 사용할 수 없어 타겟 해시를 직접 조회합니다: {e}")
+            if hash_sync and not server_hash_filter and hash_index is None:
+                print("해시 기반 증분 동기화: 타겟 데이터와 비교하여 중복 제거 중...")
+                target_hashes = get_target_data_hashes(target_conf, job.target_table)
+                print(f"타겟 테이블 기존 해시 수: {len(target_hashes)}")
+            
+            # 워커 수만큼 파티션 쿼리로 분할 (파티션별로 독립된 소스 연결에서 병렬 추출)
+            source_queries = [source_query]
+            partition_column = job.partition_column or (key_columns[0] if key_columns else None)
+            num_workers = job.num_workers or 1
             
+            # 파티션마다 소스 연결을 하나씩 사용하므로 연결 풀 크기를 넘지 않도록 제한
+            # (소스와 타겟이 같은 서버면 적재용 연결 하나를 남김)
+            max_source_connections = get_pool(conf).max_size
+            if job.source_server == job.target_server:
+                max_source_connections -= 2 if server_hash_filter else 1
+            num_workers = max(1, min(num_workers, max_source_connections))
+            if diff_sync:
+                # 병합 조인은 키 순서로 정렬된 스트림 하나가 필요하므로 파티션으로 나누지 않음
+                num_workers = 1
+            
+            # 전체 동기화를 섀도 테이블에 적재한 뒤 이름을 바꿔 교체할지 여부
+            swap_full_sync = sync_mode == "full" and job.full_sync_method == 'swap'
+            
+            # 청크 단위 체크포인트 (이전 실행이 실패/중단되었으면 마지막으로 커밋된 청크 다음부터)
+            checkpoint = None
+            if job.checkpoint_enabled and diff_sync:
+                print("⚠️ 키 비교 전략은 타겟 전체와 비교하므로 체크포인트를 사용하지 않습니다.")
+            elif job.checkpoint_enabled and swap_full_sync:
+                print("⚠️ 교체 방식 전체 동기화는 섀도 테이블을 한 번에 교체하므로 체크포인트를 사용하지 않습니다.")
+            elif job.checkpoint_enabled:
+                checkpoint_keys = key_columns or parse_sync_key_columns(job.partition_column)
+                if checkpoint_keys:
+                    checkpoint = RunCheckpoint(job.id, log.id, job.target_table, checkpoint_keys, {
+                        'sync_mode': sync_mode,
+                        'query': fingerprint_row([source_query] + list(source_params or [])),
+                        'keys': checkpoint_keys,
+                        'partition_column': partition_column,
+                        'partition_method': job.partition_method or 'range',
+                        'workers': num_workers,
+                    })
+                    checkpoint.load(target_conf)
+                else:
+                    print("⚠️ 체크포인트를 사용하려면 동기화 키 컬럼이나 파티션 컬럼이 필요합니다.")
+            
+            # 대량 전체 동기화면 보조 인덱스를 적재 후에 생성 (적재 행 수는 이전 성공 실행 기준으로 예상)
+            # (교체 방식은 원래 적재 후 인덱스를 만들고, 체크포인트는 중단되면 인덱스가 없는 채로 남으므로 제외)
+            defer_indexes = False
+            deferral = None
+            index_warning = None
+            if sync_mode == "full" and not swap_full_sync and checkpoint is None and INDEX_DEFER_MIN_ROWS:
+                last_success = db.session.query(BatchLog).filter(
+                    BatchLog.job_id == job.id,
+                    BatchLog.status == 'success'
+                ).order_by(BatchLog.started_at.desc()).first()
+                expected_rows = (last_success.total_rows or 0) if last_success else 0
+                defer_indexes = expected_rows >= INDEX_DEFER_MIN_ROWS
+                if defer_indexes:
+                    print(f"대량 적재 예상 ({expected_rows}행): 보조 인덱스를 적재 후에 생성합니다.")
+                    deferral = IndexDeferral(target_db_type, job.target_table)
+            
+            if num_workers > 1 and partition_column:
+                partition_method = job.partition_method or 'range'
+                bounds = None
+                if partition_method == 'range':
+                    if checkpoint is not None and checkpoint.resumed:
+                        # 이어서 실행할 때는 이전 실행과 같은 파티션 경계 사용
+                        bounds = checkpoint.bounds or (None, None)
+                    else:
+                        bounds = get_partition_bounds(job.source_server, source_query, partition_column, source_params)
+                    print(f"파티션 범위 ({partition_column}): {bounds[0]} ~ {bounds[1]}")
+                if checkpoint is not None:
+                    checkpoint.bounds = bounds
+                source_queries = build_partition_queries(
+                    source_query, partition_column, num_workers, partition_method, bounds
+                )
+            elif watermark_sync and checkpoint is None:
+                # 파티션 없이 읽을 때는 키 컬럼 인덱스 순서로 정렬
+                source_queries = [order_by_sync_keys(source_query, job.sync_key_column)]
+            elif diff_sync:
+                # 타겟 스트림과 같은 업서트 키 순서로 정렬
+                source_queries = [order_by_sync_keys(source_query, job.merge_key_columns)]
+            print(f"병렬 추출 파티션 수: {len(source_queries)}")
+            
+            source_query_params = [source_params] * len(source_queries)
+            if checkpoint is not None:
+                # 파티션마다 키 컬럼 순서로 읽고, 이어서 실행하면 마지막으로 커밋된 청크 이후부터 읽음
+                for i, partition_query in enumerate(source_queries):
+                    after = checkpoint.partition_ends.get(i)
+                    if after is not None:
+                        partition_query, source_query_params[i] = build_resume_query(
+                            partition_query, source_params, checkpoint.key_columns, after, db_type
+                        )
+                    source_queries[i] = order_by_sync_keys(partition_query, ', '.join(checkpoint.key_columns))
+            
+            # 청크 단위 스트림 열기 (컬럼명은 먼저 확인, 해시는 변환 단계에서 계산)
+            columns = None
+            source_streams = []
             try:
-                # 서버 설정 가져오기
-                conf = get_server_config(job.source_server)
-                db_type = conf['type']
-                
-                print(f"=== 배치 작업 실행 시작 ===")
-                print(f"작업 ID: {job.id}")
-                print(f"작업명: {job.name}")
-                print(f"소스 서버: {job.source_server} ({db_type})")
-                print(f"타겟 서버: {job.target_server}")
-                print(f"쿼리: {job.query}")
-                print(f"증분 동기화: {job.incremental_sync}")
-                if job.incremental_sync:
-                    print(f"동기화 전략: {job.sync_strategy}")
-                    print(f"동기화 키 컬럼: {job.sync_key_column}")
-                    print(f"마지막 동기화 값: {job.last_sync_value}")
-                
-                # 증분 동기화가 활성화된 경우 증분 쿼리 실행
-                if job.incremental_sync and job.sync_key_column and job.sync_strategy:
-                    print("증분 동기화 모드로 실행 중...")
-                    columns, source_result, success, error = execute_incremental_query(
-                        job.source_server, 
-                        job.query, 
-                        job.sync_key_column, 
-                        job.last_sync_value, 
-                        job.sync_strategy
+                for partition_query, partition_params in zip(source_queries, source_query_params):
+                    partition_columns, partition_chunks, success, error = open_query_stream(
+                        job.source_server, partition_query, job.chunk_size, job.fetch_size, with_hash=False,
+                        params=partition_params
+                    )
+                    if not success:
+                        raise Exception(f"소스 쿼리 실행 실패: {error}")
+                    columns = columns or partition_columns
+                    source_streams.append(partition_chunks)
+            except Exception:
+                # 이미 연 파티션 연결 정리
+                for partition_chunks in source_streams:
+                    partition_chunks.close()
+                raise
+            
+            print(f"컬럼명: {columns}")
+            
+            # 키 비교용 타겟 스트림 (업서트 키 순서)
+            diff_target = None
+            if diff_sync:
+                try:
+                    # 타겟 키를 소스 키 타입으로 변환해 읽도록 소스 첫 청크를 미리 확인
+                    sample_chunk = source_streams[0].peek()
+                    diff_target, diff_key_indexes, diff_delete_indexes = open_diff_target_stream(
+                        job.target_server, job.target_table, columns, merge_keys, job.chunk_size, job.fetch_size,
+                        diff_where, sample_chunk[0] if sample_chunk is not None else None
                     )
+                except Exception:
+                    for partition_chunks in source_streams:
+                        partition_chunks.close()
+                    raise
+            
+            # 체크포인트 키 컬럼 위치 (청크마다 키 범위 기록)
+            checkpoint_indexes = None
+            if checkpoint is not None:
+                checkpoint_indexes = [find_column_index(columns[1:], column) for column in checkpoint.key_columns]
+                if None in checkpoint_indexes:
+                    for partition_chunks in source_streams:
+                        partition_chunks.close()
+                    raise Exception(f"체크포인트 키 컬럼 '{', '.join(checkpoint.key_columns)}'이 쿼리 결과에 없습니다.")
+                # 파티션 번호를 붙여 변환 단계로 전달
+                source_streams = [PartitionStream(stream, i) for i, stream in enumerate(source_streams)]
+            
+            # 워터마크를 계산할 키 컬럼 위치 (원본 컬럼 기준, data_hash 제외)
+            watermark_indexes = None
+            if watermark_sync:
+                watermark_indexes = [find_column_index(columns[1:], column) for column in key_columns]
+                if None in watermark_indexes:
+                    print(f"⚠️ 동기화 키 컬럼 '{job.sync_key_column}'이 쿼리 결과에 없어 워터마크를 갱신하지 않습니다.")
+                    watermark_indexes = None
+            
+            # 스트림 통계 (소스 행 수, 적재 대상 행 수, 마지막 행, 키 컬럼 최대값)
+            stats = {'source_rows': 0, 'rows': 0, 'last_row': None, 'watermark': None}
+            if checkpoint is not None and checkpoint.resumed and watermark_indexes is not None:
+                # 이전 실행에서 커밋된 청크의 워터마크부터 이어서 계산
+                stats['watermark'] = checkpoint.watermark
+            hash_filter = None
+            loaded_hashes = []  # 로컬 인덱스 모드에서 적재 성공 후 인덱스에 추가할 지문
+            
+            def transform(item):
+                """변환 단계: 컬럼 배치에 해시 ID 추가 및 해시 기반 중복 제거"""
+                if checkpoint is not None:
+                    partition, batch = item
                 else:
-                    # 일반 쿼리 실행 (전체 동기화)
-                    print("전체 동기화 모드로 실행 중...")
-                    columns, source_result, success, error = execute_query_with_columns(job.source_server, job.query)
+                    batch = item
+                stats['source_rows'] += len(batch)
+                if watermark_indexes is not None:
+                    stats['watermark'] = update_watermark(stats['watermark'], batch, watermark_indexes)
+                hashed_batch = hash_rows(batch)
+                if hash_index is not None:
+                    new_batch = filter_new_data_by_index(hashed_batch, hash_index)
+                    loaded_hashes.extend(new_batch.column(0))
+                elif hash_filter is not None:
+                    new_batch = hash_filter.filter(hashed_batch)
+                elif target_hashes is not None:
+                    new_batch = filter_new_data_by_hash(hashed_batch, target_hashes)
+                else:
+                    new_batch = hashed_batch
                 
-                if not success:
-                    raise Exception(f"소스 쿼리 실행 실패: {error}")
+                # 적재될 청크만 키 범위 기록 (빈 청크는 파이프라인에서 건너뜀)
+                if checkpoint is not None and new_batch:
+                    checkpoint.track(partition, batch, checkpoint_indexes)
+                return new_batch
+            
+            def sync_state():
+                """적재 트랜잭션 커밋 직전에 기록할 (작업 ID, 구조화된 워터마크) - 모든 청크를 적재한 뒤 호출됨"""
+                if watermark_indexes is None or stats['watermark'] is None:
+                    return None
+                return job.id, encode_watermark(key_columns, stats['watermark'])
+            
+            # 추출 -> 변환 -> 적재 파이프라인 (추출/변환은 별도 스레드, 적재는 현재 스레드)
+            pipeline = ChunkPipeline(source_streams, transform, name=f"job-{job.id}", parallel=True)
+            written_rows = 0
+            
+            try:
+                if server_hash_filter:
+                    print("해시 기반 증분 동기화: 타겟 DB에서 안티 조인으로 새 데이터 조회 (서버 측 비교)")
+                    hash_filter = ServerHashFilter(target_conf, job.target_table)
                 
-                print(f"컬럼명: {columns}")
-                print(f"데이터 행 수: {len(source_result)}")
-                print(f"첫 번째 행 샘플: {source_result[0] if source_result else 'None'}")
+                chunks = pipeline
+                if diff_target is not None:
+                    # data_hash가 같은 행은 컬럼 비교 없이 건너뛰고, 변경 행은 ChangeSet(업서트 행 + 삭제 키)으로 적재
+                    print("키 비교 동기화: 소스와 타겟을 업서트 키 순서로 병합 비교 중...")
+                    chunks = track_changes(merge_diff(pipeline, diff_target, diff_key_indexes, diff_key_indexes,
+                                                      hash_indexes=(0, 0), batch_size=job.chunk_size or 10000,
+                                                      delete_key_indexes=diff_delete_indexes),
+                                           stats)
+                chunks = track_chunks(chunks, stats)
+                first_chunk, chunks = peek_chunks(chunks)
+                print(f"첫 번째 행 샘플: {first_chunk[0] if first_chunk is not None and len(first_chunk) else 'None'}")
                 
                 # 타겟 데이터베이스에 데이터 저장
-                if source_result and len(source_result) > 0:
-                    # 타겟 서버 설정 가져오기
-                    target_conf = get_server_config(job.target_server)
-                    target_db_type = target_conf['type']
-                    
-                    print(f"타겟 데이터베이스 타입: {target_db_type}")
-                    
-                    # 해시 기반 증분 동기화인 경우 중복 데이터 필터링
-                    if job.incremental_sync and job.sync_strategy == 'hash':
-                        print("해시 기반 증분 동기화: 타겟 데이터와 비교하여 중복 제거 중...")
-                        target_hashes = get_target_data_hashes(target_conf, job.target_table)
-                        print(f"타겟 테이블 기존 해시 수: {len(target_hashes)}")
-                        
-                        # 중복되지 않는 새로운 데이터만 필터링
-                        filtered_result = filter_new_data_by_hash(source_result, target_hashes)
-                        
-                        if filtered_result:
-                            print(f"중복 제거 후 새로운 데이터: {len(filtered_result)}행")
-                            source_result = filtered_result
-                        else:
-                            print("새로운 데이터가 없습니다. 동기화를 건너뜁니다.")
-                            # 로그 업데이트
-                            log.status = 'success'
-                            log.total_rows = 0
-                            log.total_size_mb = 0
-                            log.duration_seconds = time.time() - start_time
-                            log.rows_per_second = 0
-                            log.mb_per_second = 0
-                            log.completed_at = get_kst_now()
-                            db.session.commit()
-                            print("배치 작업 성공적으로 완료 (새로운 데이터 없음)")
-                            return True
-                    
-                    # 동기화 전략에 따른 데이터 저장 방식 결정
-                    sync_mode = "incremental" if job.incremental_sync else "full"
-                    
-                    # 타겟 테이블에 데이터 삽입 (컬럼명 포함)
-                    if target_db_type == 'postgresql':
-                        # PostgreSQL에 저장
-                        target_success, target_error, target_result = self._save_to_postgresql_with_columns(
-                            target_conf, job.target_table, source_result, columns, sync_mode
-                        )
-                    elif target_db_type == 'altibase':
-                        # Altibase에 저장
-                        target_success, target_error, target_result = self._save_to_altibase_with_columns(
-                            target_conf, job.target_table, source_result, columns, sync_mode
-                        )
-                    elif target_db_type == 'informix':
-                        # Informix에 저장
-                        target_success, target_error, target_result = self._save_to_informix_with_columns(
-                            target_conf, job.target_table, source_result, columns, sync_mode
-                        )
-                    else:
-                        raise Exception(f"지원하지 않는 타겟 데이터베이스 타입: {target_db_type}")
+                if first_chunk:
+                    # 타겟 테이블에 데이터 삽입 (컬럼명 포함, 청크 단위)
+                    target_success, target_error, target_result = self._save_chunks(
+                        target_conf, job.target_table, chunks, columns, sync_mode, sync_state, checkpoint, merge_keys,
+                        swap_full_sync, job.pg_fast_load, deferral
+                    )
                     
+                    # 적재 후 다시 만들지 못한 인덱스는 작업 결과에 남김
+                    index_warning = deferral.failure_message() if deferral is not None else None
                     if not target_success:
-                        raise Exception(f"타겟 데이터베이스 저장 실패: {target_error}")
+                        raise Exception(f"타겟 데이터베이스 저장 실패: {target_error}"
+                                        + (f"\n{index_warning}" if index_warning else ""))
+                    elif index_warning:
+                        print(f"⚠️ {index_warning}")
                     else:
-                        print(f"타겟 데이터베이스 저장 성공: {target_db_type}")
+                        written_rows = target_result or 0
+                        print(f"타겟 데이터베이스 저장 성공: {target_db_type} ({written_rows}행)")
                         
-                        # 증분 동기화가 활성화된 경우 마지막 동기화 값 업데이트
-                        if job.incremental_sync and source_result:
-                            # 마지막 행의 동기화 키 값을 업데이트
-                            last_row = source_result[-1]
-                            if job.sync_strategy == 'hash':
-                                # 해시 전략인 경우 data_hash 사용
-                                job.last_sync_value = last_row[0]  # 첫 번째 컬럼이 data_hash
-                                print(f"마지막 동기화 값 업데이트 (해시): {job.last_sync_value}")
-                            elif job.sync_key_column in last_row:
-                                job.last_sync_value = str(last_row[job.sync_key_column])
-                                print(f"마지막 동기화 값 업데이트: {job.last_sync_value}")
+                        # 대량 적재 후 통계 갱신 (autovacuum을 기다리지 않고 바로 실행 계획에 반영)
+                        if ANALYZE_MIN_ROWS and written_rows >= ANALYZE_MIN_ROWS:
+                            try:
+                                update_statistics(target_conf, job.target_table)
+                            except Exception as e:
+                                print(f"통계 갱신 실패: {e}")
+                        
+                        # 적재한 지문을 로컬 인덱스에 추가 (다음 실행의 행 수/체크섬 검증 기준)
+                        if hash_index is not None:
+                            hash_index.add(loaded_hashes, rows=written_rows)
+                        
+                        # 워터마크는 적재와 함께 타겟에 커밋되었으므로 작업 정보에도 반영 (화면 표시용)
+                        state = sync_state()
+                        if state is not None:
+                            job.sync_watermark = state[1]
+                            job.last_sync_value = format_watermark(stats['watermark'])
+                            print(f"마지막 동기화 값 업데이트: {job.last_sync_value}")
+                elif checkpoint is not None and checkpoint.resumed:
+                    # 이전 실행이 모든 청크를 커밋하고 마지막 커밋 직전에 중단된 경우 (타겟을 다시 비우지 않음)
+                    print("이전 실행에서 모든 청크가 적재되었습니다. 체크포인트를 정리합니다.")
+                    checkpoint.complete(target_conf, sync_state)
+                    state = sync_state()
+                    if state is not None:
+                        job.sync_watermark = state[1]
+                        job.last_sync_value = format_watermark(stats['watermark'])
+                        print(f"마지막 동기화 값 업데이트: {job.last_sync_value}")
+                elif (target_hashes is not None or hash_filter is not None or hash_index is not None
+                      or diff_target is not None):
+                    print("새로운 데이터가 없습니다. 동기화를 건너뜁니다.")
                 else:
                     print("저장할 데이터가 없습니다.")
                     # 데이터가 없는 경우에도 전체 동기화 모드에서는 기존 데이터 삭제
-                    if not job.incremental_sync:
+                    if sync_mode == "full":
                         print("전체 동기화 모드: 기존 데이터 삭제 수행")
-                        target_conf = get_server_config(job.target_server)
-                        target_db_type = target_conf['type']
-                        
-                        if target_db_type == 'postgresql':
-                            self._clear_postgresql_table(target_conf, job.target_table)
-                        elif target_db_type == 'altibase':
-                            self._clear_altibase_table(target_conf, job.target_table)
-                        elif target_db_type == 'informix':
-                            self._clear_informix_table(target_conf, job.target_table)
-                
-                end_time = time.time()
-                print(f"배치 작업 완료: {end_time - start_time:.2f}초")
-                
-                # 로그 업데이트
-                log.status = 'success'
-                log.total_rows = len(source_result) if source_result else 0
-                log.total_size_mb = len(source_result) * 0.001 if source_result else 0  # 대략적인 크기
-                log.duration_seconds = end_time - start_time
-                log.rows_per_second = len(source_result) / (end_time - start_time) if source_result and (end_time - start_time) > 0 else 0
-                log.mb_per_second = log.total_size_mb / (end_time - start_time) if (end_time - start_time) > 0 else 0
-                log.completed_at = get_kst_now()
-                
-                print("로그 업데이트 중...")
-                db.session.commit()
-                print("배치 작업 성공적으로 완료")
-                return True
-                
+                        self._clear_table(target_conf, job.target_table, truncate=job.pg_fast_load)
             finally:
-                # 작업 디렉토리 복원
-                os.chdir(original_cwd)
+                pipeline.close()
+                if hash_filter is not None:
+                    hash_filter.close()
+                if hash_index is not None:
+                    hash_index.close()
+                if diff_target is not None:
+                    close_target = getattr(diff_target, 'close', None)
+                    if close_target is not None:
+                        close_target()
+                    print(f"키 비교 결과: 추가 {stats.get('added', 0)}행, 수정 {stats.get('updated', 0)}행, "
+                          f"삭제 {stats.get('deleted', 0)}행, 동일 {stats.get('unchanged', 0)}행")
+                
+                # 단계별 소요 시간 기록
+                log.extract_seconds = pipeline.timings['extract']
+                log.transform_seconds = pipeline.timings['transform']
+                log.load_seconds = pipeline.timings['load']
+                print(f"단계별 소요 시간: 추출 {log.extract_seconds:.2f}초, "
+                      f"변환 {log.transform_seconds:.2f}초, 적재 {log.load_seconds:.2f}초")
+            
+            # 적재가 성공했으므로 이번에 계산한 구간별 체크섬을 다음 실행의 비교 기준으로 기록
+            if range_index is not None:
+                range_index.save()
+            
+            # 소스에서 삭제된 키를 타겟에서 삭제 (키 비교 전략은 적재하면서 이미 삭제함)
+            if sync_mode == "incremental" and job.reconcile_deletes and not diff_sync:
+                if not merge_keys:
+                    print("⚠️ 삭제 반영을 사용하려면 업서트 키 컬럼이 필요합니다.")
+                elif reconcile_due(job, get_kst_now()):
+                    self._reconcile_deletes(job, target_conf, merge_keys)
+                    job.last_reconciled_at = get_kst_now()
+                else:
+                    print(f"삭제 반영 건너뜀: 마지막 실행 {job.last_reconciled_at}, 주기 {job.reconcile_interval_hours}시간")
+            
+            end_time = time.time()
+            elapsed = end_time - start_time
+            print(f"배치 작업 완료: {elapsed:.2f}초 (소스 {stats['source_rows']}행, 저장 {written_rows}행)")
+            
+            # 로그 업데이트
+            log.status = 'success'
+            log.total_rows = written_rows
+            log.total_size_mb = written_rows * 0.001  # 대략적인 크기
+            log.duration_seconds = elapsed
+            log.rows_per_second = written_rows / elapsed if elapsed > 0 else 0
+            log.mb_per_second = log.total_size_mb / elapsed if elapsed > 0 else 0
+            log.completed_at = get_kst_now()
+            if index_warning:
+                log.error_message = index_warning
+            
+            print("로그 업데이트 중...")
+            db.session.commit()
+            print("배치 작업 성공적으로 완료")
+            return True
             
         except Exception as e:
             # 에러 로그
@@ -1123,29 +2472,213 @@ class BatchExecutor:
             db.session.commit()
             return False
 
-    def _save_to_postgresql(self, conf, table_name, data):
-        """PostgreSQL에 데이터 저장"""
-        import psycopg2
-        from psycopg2 import OperationalError
+    def _plan_range_checksum(self, job, target_conf, source_query, key_column):
+        """
+        구간별 체크섬을 소스와 타겟에서 각각 계산하고 비교해 달라진 키 범위 찾기
+        
+        구간 체크섬은 각 DB에서 GROUP BY로 계산하므로 구간 수만큼의 행만 전송됩니다.
+        타겟 키 컬럼은 TEXT이므로 NUMERIC으로 바꿔 같은 구간으로 나눕니다.
+        구간 기준값/폭은 기록해 두고 재사용하며, 기록이 없거나 키 컬럼이 바뀌면 소스 키 범위로 새로 정합니다.
+        
+        Returns:
+            tuple: (RangeChecksumIndex, 소스/타겟에 적용할 WHERE 조건 또는 None(전체 비교))
+        """
+        error = validate_job_config(job)
+        if error:
+            raise Exception(error)
+        db_type = get_server_config(job.source_server)['type']
+        range_index = RangeChecksumIndex.for_job(job.id)
+        
+        if not (range_index.load() and range_index.key_column == key_column):
+            _, rows = fetch_query_rows(
+                job.source_server, f"SELECT MIN({key_column}), MAX({key_column}), COUNT(*) FROM ({source_query}) range_src"
+            )
+            min_value, max_value, row_count = rows[0]
+            for value in (min_value, max_value):
+                if value is not None and (not isinstance(value, (int, float, Decimal)) or isinstance(value, bool)
+                                          or value != int(value)):
+                    raise Exception(f"범위 체크섬 전략은 정수 키 컬럼이 필요합니다: {key_column} = {value}")
+            range_index.plan(key_column, min_value, max_value, int(row_count))
+        
+        # 행 체크섬 식에 쓸 소스 컬럼명 (타겟도 같은 순서로 계산)
+        columns, _ = fetch_query_rows(job.source_server, f"SELECT * FROM ({source_query}) range_src WHERE 1=0")
+        _, buckets = fetch_query_rows(job.source_server, bucket_query(
+            source_query, key_column, range_index.base, range_index.width, db_type, columns
+        ))
+        
+        if not target_table_exists(target_conf, job.target_table):
+            range_index.compare(buckets)
+            print(f"타겟 테이블이 없어 전체를 키 비교합니다. (구간 {len(buckets)}개)")
+            return range_index, None
+        
+        key_index = find_column_index(columns, key_column)
+        if key_index is None:
+            raise Exception(f"범위 체크섬 키 컬럼 '{key_column}'이 쿼리 결과에 없습니다.")
+        target_columns = [f"CAST({column} AS NUMERIC) AS {column}" if i == key_index else column
+                          for i, column in enumerate(columns)]
+        _, target_buckets = fetch_query_rows(job.target_server, bucket_query(
+            f"SELECT {', '.join(target_columns)} FROM {job.target_table}",
+            key_column, range_index.base, range_index.width, target_conf['type'], columns
+        ))
+        changed = range_index.compare(buckets, target_buckets)
+        
+        ranges = range_index.ranges(changed)
+        print(f"범위 체크섬 비교: 구간 {len(buckets)}개(타겟 {len(target_buckets)}개) 중 {len(changed)}개 변경, "
+              f"키 범위 {len(ranges)}개 비교")
+        return range_index, range_index.predicate(ranges)
+    
+    def reconcile_job(self, job_id):
+        """
+        배치 작업의 삭제 반영만 실행 (주기와 관계없이 즉시)
+        
+        Returns:
+            tuple: (성공 여부, 삭제한 행 수 또는 오류 메시지)
+        """
+        job = db.session.get(BatchJob, job_id)
+        if not job:
+            return False, "배치 작업을 찾을 수 없습니다."
+        
+        merge_keys = parse_sync_key_columns(job.merge_key_columns)
+        if not merge_keys:
+            return False, "삭제 반영을 사용하려면 업서트 키 컬럼이 필요합니다."
         
         try:
-            print(f"PostgreSQL 저장 시작: {conf['host']}:{conf['port']}/{conf['database']}")
-            print(f"테이블명: {table_name}, 데이터 행 수: {len(data)}")
-            
-            conn = psycopg2.connect(
-                host=conf['host'],
-                port=conf['port'],
-                database=conf['database'],
-                user=conf['user'],
-                password=conf['password']
+            deleted_rows = self._reconcile_deletes(job, get_server_config(job.target_server), merge_keys)
+        except Exception as e:
+            print(f"삭제 반영 실패: {e}")
+            return False, str(e)
+        
+        job.last_reconciled_at = get_kst_now()
+        db.session.commit()
+        return True, deleted_rows
+    
+    def _reconcile_deletes(self, job, target_conf, key_columns):
+        """
+        소스에서 삭제된 키를 타겟에서 삭제 (삭제한 행 수 반환)
+        
+        작업 쿼리(증분 조건 없이 전체)와 타겟 테이블의 키 컬럼만 키 순서로 청크 단위로 읽어 병합 비교하고,
+        타겟에만 있는 키를 청크마다 배치 DELETE 후 커밋합니다. 두 쪽 모두 청크 하나 분량만 메모리에 둡니다.
+        타겟 키는 소스 키 타입으로 변환해 비교하고, 삭제는 타겟에 저장된 원래 값으로 합니다.
+        """
+        table_name = job.target_table
+        if not target_table_exists(target_conf, table_name):
+            print(f"타겟 테이블 {table_name}이 없어 삭제 반영을 건너뜁니다.")
+            return 0
+        
+        key_list = ', '.join(key_columns)
+        key_indexes = list(range(len(key_columns)))
+        chunk_size = job.chunk_size or 10000
+        print(f"삭제 반영 시작: {table_name} (키: {key_list}, 청크 크기: {chunk_size})")
+        
+        _, source_keys, success, error = open_query_stream(
+            job.source_server, f"SELECT {key_list} FROM ({job.query}) reconcile_src ORDER BY {key_list}",
+            chunk_size, job.fetch_size, with_hash=False
+        )
+        if not success:
+            raise Exception(f"소스 키 조회 실패: {error}")
+        target_keys = None
+        try:
+            sample_chunk = source_keys.peek()
+            target_query, delete_key_indexes = typed_key_query(
+                target_conf['type'], table_name, key_columns, key_columns,
+                sample_chunk[0] if sample_chunk is not None else None
             )
-            conn.autocommit = False  # 트랜잭션 수동 관리
+            _, target_keys, success, error = open_query_stream(
+                job.target_server, target_query, chunk_size, job.fetch_size, with_hash=False
+            )
+            if not success:
+                target_keys = None
+                raise Exception(f"타겟 키 조회 실패: {error}")
             
-            cursor = conn.cursor()
+            deleted_rows = 0
+            checked_chunks = 0
+            with pooled_connection(target_conf) as conn:
+                if target_conf['type'] != 'postgresql':
+                    conn.jconn.setAutoCommit(False)
+                cursor = conn.cursor() if target_conf['type'] == 'postgresql' else None
+                
+                # 키만 비교하므로 소스에만 있는 키(아직 적재 전)는 무시하고 타겟에만 있는 키만 삭제
+                for changes in merge_diff(source_keys, target_keys, key_indexes, key_indexes, compare_indexes=[],
+                                          batch_size=chunk_size, delete_key_indexes=delete_key_indexes):
+                    checked_chunks += 1
+                    if not changes.deleted_keys:
+                        continue
+                    if cursor is not None:
+                        deleted_rows += self._delete_postgresql_keys(cursor, table_name, key_columns, changes.deleted_keys)
+                        conn.commit()
+                    else:
+                        deleted_rows += self._delete_jdbc_keys(conn.jconn, table_name, key_columns, changes.deleted_keys)
+                        conn.jconn.commit()
+                
+                if cursor is not None:
+                    cursor.close()
             
-            # 테이블 존재 여부 확인 및 생성
-            cursor.execute(f"""
-                SELECT EXISTS (
+            print(f"삭제 반영 완료: {table_name} {deleted_rows}행 삭제 (변경 묶음 {checked_chunks}개)")
+            return deleted_rows
+        finally:
+            source_keys.close()
+            if target_keys is not None:
+                target_keys.close()
+    
+    def _save_chunks(self, target_conf, table_name, chunks, columns, sync_mode, sync_state=None, checkpoint=None,
+                     merge_keys=None, swap=False, fast_load=False, deferral=None):
+        """
+        타겟 데이터베이스 타입에 맞는 저장 함수로 청크 스트림 저장
+        
+        sync_state는 (작업 ID, 워터마크) 또는 None을 반환하는 함수로, 저장 함수가 커밋 직전에 호출해
+        워터마크를 적재와 같은 트랜잭션으로 기록합니다.
+        checkpoint(RunCheckpoint)가 있으면 청크마다 체크포인트와 함께 커밋합니다.
+        merge_keys가 있으면 증분 동기화를 키 기준 업서트로 적재합니다.
+        swap이면 전체 동기화를 섀도 테이블에 적재한 뒤 기존 테이블과 교체합니다.
+        fast_load면 PostgreSQL 타겟에 WAL/fsync를 줄이는 빠른 적재 방식을 사용합니다. (다른 타겟은 무시)
+        deferral(IndexDeferral)이 있으면 전체 동기화 전에 보조 인덱스를 삭제하고 적재가 끝난 뒤 다시 생성합니다.
+        (다시 만들지 못한 인덱스는 deferral.failed에 남음)
+        """
+        target_db_type = target_conf['type']
+        
+        if target_db_type == 'postgresql':
+            # PostgreSQL에 저장
+            return self._save_to_postgresql_with_columns(target_conf, table_name, chunks, columns, sync_mode, sync_state,
+                                                         checkpoint, merge_keys, swap, fast_load, deferral)
+        elif target_db_type == 'altibase':
+            # Altibase에 저장
+            return self._save_to_altibase_with_columns(target_conf, table_name, chunks, columns, sync_mode, sync_state,
+                                                       checkpoint, merge_keys, swap, deferral)
+        elif target_db_type == 'informix':
+            # Informix에 저장
+            return self._save_to_informix_with_columns(target_conf, table_name, chunks, columns, sync_mode, sync_state,
+                                                       checkpoint, merge_keys, swap, deferral)
+        raise Exception(f"지원하지 않는 타겟 데이터베이스 타입: {target_db_type}")
+    
+    def _clear_table(self, target_conf, table_name, truncate=False):
+        """타겟 데이터베이스 타입에 맞는 함수로 테이블 데이터 삭제 (truncate면 PostgreSQL은 TRUNCATE)"""
+        target_db_type = target_conf['type']
+        
+        if target_db_type == 'postgresql':
+            return self._clear_postgresql_table(target_conf, table_name, truncate)
+        elif target_db_type == 'altibase':
+            return self._clear_altibase_table(target_conf, table_name)
+        elif target_db_type == 'informix':
+            return self._clear_informix_table(target_conf, table_name)
+        return False
+
+    def _save_to_postgresql(self, conf, table_name, data):
+        """PostgreSQL에 데이터 저장"""
+        import psycopg2
+        from psycopg2 import OperationalError
+        
+        try:
+            print(f"PostgreSQL 저장 시작: {conf['host']}:{conf['port']}/{conf['database']}")
+            print(f"테이블명: {table_name}, 데이터 행 수: {len(data)}")
+            
+            conn = connect_pooled(conf)
+            conn.autocommit = False  # 트랜잭션 수동 관리
+            
+            cursor = conn.cursor()
+            
+            # 테이블 존재 여부 확인 및 생성
+            cursor.execute(f"""
+                SELECT EXISTS (
                     SELECT FROM information_schema.tables 
                     WHERE table_schema = 'public' AND table_name = '{table_name}'
                 );
@@ -1201,48 +2734,11 @@ class BatchExecutor:
                 conn.commit()
                 print(f"테이블 {table_name}이 생성되었습니다.")
             
-            # 배치 처리를 위한 준비
-            batch_size = 1000
-            total_rows = len(data)
-            print(f"배치 처리 시작: 총 {total_rows}행, 배치 크기: {batch_size}")
-            
-            # 데이터 삽입 (배치 처리)
-            for i in range(0, total_rows, batch_size):
-                batch_data = data[i:i + batch_size]
-                print(f"배치 {i//batch_size + 1} 처리 중: {i+1}~{min(i + batch_size, total_rows)}행")
-                
-                if isinstance(batch_data[0], (list, tuple)):
-                    # 튜플/리스트 형태인 경우
-                    values = []
-                    for row in batch_data:
-                        placeholders = ', '.join(['%s'] * len(row))
-                        values.append(cursor.mogrify(f"({placeholders})", row).decode('utf-8'))
-                    
-                    if values:
-                        # 컬럼명을 동적으로 생성
-                        column_names = [f"col_{i}" for i in range(len(batch_data[0]))]
-                        column_list = ', '.join(column_names)
-                        
-                        insert_sql = f"""
-                            INSERT INTO {table_name} ({column_list}) 
-                            VALUES {','.join(values)};
-                        """
-                        print(f"INSERT SQL 실행: {len(values)}행")
-                        cursor.execute(insert_sql)
-                else:
-                    # 딕셔너리 형태인 경우
-                    values = []
-                    for row in batch_data:
-                        values.append(cursor.mogrify("(%s)", (json.dumps(row, ensure_ascii=False),)).decode('utf-8'))
-                    
-                    if values:
-                        cursor.execute(f"""
-                            INSERT INTO {table_name} (data) VALUES {','.join(values)};
-                        """)
-                
-                # 배치마다 커밋
+            # COPY로 한 번에 적재 (컬럼명은 테이블 생성 때와 같은 col_0, col_1, ...)
+            if data:
+                column_names = [f"col_{i}" for i in range(len(data[0]))] if isinstance(data[0], (list, tuple)) else None
+                self._insert_postgresql_data(cursor, table_name, data, column_names)
                 conn.commit()
-                print(f"배치 처리 완료: {min(i + batch_size, total_rows)}/{total_rows}")
             
             print("PostgreSQL 저장 완료")
             return True, None, None
@@ -1262,199 +2758,174 @@ class BatchExecutor:
 
     def _save_to_altibase(self, conf, table_name, data):
         """Altibase에 데이터 저장"""
-        import jaydebeapi
-        
         try:
-            # 작업 디렉토리를 db_connection_test로 변경
-            original_cwd = os.getcwd()
-            os.chdir('/app/db_connection_test')
+            conn = connect_pooled(conf)
+            conn.autocommit = False  # 트랜잭션 수동 관리
             
+            cursor = conn.jconn.createStatement()
+            
+            # 테이블 존재 여부 확인 및 생성
             try:
-                url = f"jdbc:Altibase://{conf['host']}:{conf['port']}/{conf['database']}"
-                jar = "/app/db_connection_test/Altibase.jar"
-                
-                conn = jaydebeapi.connect(
-                    "com.altibase.jdbc.driver.AltibaseDriver",
-                    url,
-                    [conf['user'], conf['password']],
-                    jar
-                )
-                conn.autocommit = False  # 트랜잭션 수동 관리
-                
-                cursor = conn.jconn.createStatement()
-                
-                # 테이블 존재 여부 확인 및 생성
-                try:
-                    cursor.execute(f"""
-                        SELECT COUNT(*) FROM {table_name}
-                    """)
-                    table_exists = True
-                except:
-                    table_exists = False
-                
-                if not table_exists:
-                    # 원본 데이터의 구조를 기반으로 테이블 생성
-                    if data and len(data) > 0:
-                        first_row = data[0]
-                        if isinstance(first_row, (list, tuple)) and len(first_row) <= 10:  # Altibase는 컬럼 수 제한이 있을 수 있음
-                            # 튜플/리스트 형태인 경우 (컬럼 수가 적을 때만)
-                            columns = []
-                            for i, value in enumerate(first_row):
-                                if isinstance(value, int):
-                                    columns.append(f"col_{i} INTEGER")
-                                elif isinstance(value, float):
-                                    columns.append(f"col_{i} NUMERIC")
-                                elif isinstance(value, bool):
-                                    columns.append(f"col_{i} SMALLINT")  # Altibase에서 BOOLEAN 대신 SMALLINT 사용
-                                else:
-                                    columns.append(f"col_{i} VARCHAR(1000)")
-                            
-                            create_sql = f"""
-                                CREATE TABLE {table_name} (
-                                    id INTEGER PRIMARY KEY,
-                                    {', '.join(columns)}
-                                );
-                            """
-                        else:
-                            # 컬럼이 많거나 복잡한 경우 JSON 형태로 저장
-                            create_sql = f"""
-                                CREATE TABLE {table_name} (
-                                    id INTEGER PRIMARY KEY,
-                                    data VARCHAR(4000)
-                                );
-                            """
+                cursor.execute(f"""
+                    SELECT COUNT(*) FROM {table_name}
+                """)
+                table_exists = True
+            except:
+                table_exists = False
+            
+            if not table_exists:
+                # 원본 데이터의 구조를 기반으로 테이블 생성
+                if data and len(data) > 0:
+                    first_row = data[0]
+                    if isinstance(first_row, (list, tuple)) and len(first_row) <= 10:  # Altibase는 컬럼 수 제한이 있을 수 있음
+                        # 튜플/리스트 형태인 경우 (컬럼 수가 적을 때만)
+                        columns = []
+                        for i, value in enumerate(first_row):
+                            if isinstance(value, int):
+                                columns.append(f"col_{i} INTEGER")
+                            elif isinstance(value, float):
+                                columns.append(f"col_{i} NUMERIC")
+                            elif isinstance(value, bool):
+                                columns.append(f"col_{i} SMALLINT")  # Altibase에서 BOOLEAN 대신 SMALLINT 사용
+                            else:
+                                columns.append(f"col_{i} VARCHAR(1000)")
+                        
+                        create_sql = f"""
+                            CREATE TABLE {table_name} (
+                                id INTEGER PRIMARY KEY,
+                                {', '.join(columns)}
+                            );
+                        """
                     else:
-                        # 기본 구조
+                        # 컬럼이 많거나 복잡한 경우 JSON 형태로 저장
                         create_sql = f"""
                             CREATE TABLE {table_name} (
                                 id INTEGER PRIMARY KEY,
                                 data VARCHAR(4000)
                             );
                         """
-                    
-                    cursor.execute(create_sql)
-                    conn.jconn.commit()
-                    print(f"테이블 {table_name}이 생성되었습니다.")
+                else:
+                    # 기본 구조
+                    create_sql = f"""
+                        CREATE TABLE {table_name} (
+                            id INTEGER PRIMARY KEY,
+                            data VARCHAR(4000)
+                        );
+                    """
                 
-                # 배치 처리를 위한 준비
-                batch_size = 1000
-                total_rows = len(data)
+                cursor.execute(create_sql)
+                conn.jconn.commit()
+                print(f"테이블 {table_name}이 생성되었습니다.")
+            
+            # 배치 처리를 위한 준비
+            batch_size = 1000
+            total_rows = len(data)
+            
+            # 데이터 삽입 (배치 처리)
+            for i in range(0, total_rows, batch_size):
+                batch_data = data[i:i + batch_size]
                 
-                # 데이터 삽입 (배치 처리)
-                for i in range(0, total_rows, batch_size):
-                    batch_data = data[i:i + batch_size]
+                for j, row in enumerate(batch_data):
+                    row_id = i + j + 1  # 고유한 ID 생성
                     
-                    for j, row in enumerate(batch_data):
-                        row_id = i + j + 1  # 고유한 ID 생성
+                    # 테이블 구조에 따라 적절한 INSERT 사용
+                    if isinstance(row, (list, tuple)) and len(row) <= 10:
+                        # 컬럼별 저장
+                        placeholders = ', '.join(['?'] * len(row))
+                        column_names = [f"col_{k}" for k in range(len(row))]
+                        column_list = ', '.join(column_names)
                         
-                        # 테이블 구조에 따라 적절한 INSERT 사용
-                        if isinstance(row, (list, tuple)) and len(row) <= 10:
-                            # 컬럼별 저장
-                            placeholders = ', '.join(['?'] * len(row))
-                            column_names = [f"col_{k}" for k in range(len(row))]
-                            column_list = ', '.join(column_names)
-                            
-                            cursor.execute(f"""
-                                INSERT INTO {table_name} (id, {column_list}) VALUES (?, {placeholders});
-                            """, [row_id] + list(row))
-                        else:
-                            # JSON 형태로 저장
-                            row_data = json.dumps(row, ensure_ascii=False)[:3990]  # Altibase VARCHAR 제한
-                            
-                            cursor.execute(f"""
-                                INSERT INTO {table_name} (id, data) VALUES (?, ?);
-                            """, (row_id, row_data))
-                    
-                    # 배치마다 커밋
-                    conn.jconn.commit()
-                    print(f"배치 처리 완료: {min(i + batch_size, total_rows)}/{total_rows}")
-                
-                return True, None, None
+                        cursor.execute(f"""
+                            INSERT INTO {table_name} (id, {column_list}) VALUES (?, {placeholders});
+                        """, [row_id] + list(row))
+                    else:
+                        # JSON 형태로 저장
+                        row_data = json.dumps(row, ensure_ascii=False)[:3990]  # Altibase VARCHAR 제한
+                        
+                        cursor.execute(f"""
+                            INSERT INTO {table_name} (id, data) VALUES (?, ?);
+                        """, (row_id, row_data))
                 
-            finally:
-                # 작업 디렉토리 복원
-                os.chdir(original_cwd)
+                # 배치마다 커밋
+                conn.jconn.commit()
+                print(f"배치 처리 완료: {min(i + batch_size, total_rows)}/{total_rows}")
+            
+            return True, None, None
                 
         except Exception as e:
             return False, f"Altibase 데이터베이스 저장 중 예외 발생: {e}", None
 
     def _save_to_informix(self, conf, table_name, data):
         """Informix에 데이터 저장"""
-        import jaydebeapi
-        
         try:
-            # 작업 디렉토리를 db_connection_test로 변경
-            original_cwd = os.getcwd()
-            os.chdir('/app/db_connection_test')
+            conn = connect_pooled(conf)
+            conn.autocommit = True # 자동 커밋 활성화
             
-            try:
-                url = f"jdbc:informix-sqli://{conf['host']}:{conf['port']}/{conf['database']}:NEWCODESET=EUC-KR,cp1252,819"
-                jar = "/app/db_connection_test/ifxjdbc.jar"
-                
-                conn = jaydebeapi.connect(
-                    "com.informix.jdbc.IfxDriver",
-                    url,
-                    [conf['user'], conf['password']],
-                    jar
-                )
-                conn.autocommit = True # 자동 커밋 활성화
-                
-                cursor = conn.jconn.createStatement()
-                
-                # 테이블 존재 여부 확인 및 생성
+            cursor = conn.jconn.createStatement()
+            
+            # 테이블 존재 여부 확인 및 생성
+            cursor.execute(f"""
+                SELECT EXISTS (
+                    SELECT FROM DUAL
+                    WHERE EXISTS (
+                        SELECT FROM sysmaster:sys_tables WHERE table_name = '{table_name}'
+                    )
+                );
+            """)
+            table_exists = cursor.fetchone()[0]
+            
+            if not table_exists:
                 cursor.execute(f"""
-                    SELECT EXISTS (
-                        SELECT FROM DUAL
-                        WHERE EXISTS (
-                            SELECT FROM sysmaster:sys_tables WHERE table_name = '{table_name}'
-                        )
+                    CREATE TABLE {table_name} (
+                        id INTEGER PRIMARY KEY,
+                        data JSONB NOT NULL
                     );
                 """)
-                table_exists = cursor.fetchone()[0]
-                
-                if not table_exists:
-                    cursor.execute(f"""
-                        CREATE TABLE {table_name} (
-                            id INTEGER PRIMARY KEY,
-                            data JSONB NOT NULL
-                        );
-                    """)
-                    conn.jconn.commit()
-                    print(f"테이블 {table_name}이 생성되었습니다.")
-                
-                # 데이터 삽입
-                for row in data:
-                    cursor.execute(f"""
-                        INSERT INTO {table_name} (id, data) VALUES (?, ?);
-                    """, (len(data) + 1, json.dumps(row))) # Informix는 자동 증가 키 사용
-                
                 conn.jconn.commit()
-                return True, None, None
-                
-            finally:
-                # 작업 디렉토리 복원
-                os.chdir(original_cwd)
+                print(f"테이블 {table_name}이 생성되었습니다.")
+            
+            # 데이터 삽입
+            for row in data:
+                cursor.execute(f"""
+                    INSERT INTO {table_name} (id, data) VALUES (?, ?);
+                """, (len(data) + 1, json.dumps(row))) # Informix는 자동 증가 키 사용
+            
+            conn.jconn.commit()
+            return True, None, None
                 
         except Exception as e:
             return False, f"Informix 데이터베이스 저장 중 예외 발생: {e}", None
 
-    def _save_to_postgresql_with_columns(self, conf, table_name, data, columns, sync_mode="full"):
-        """PostgreSQL에 데이터 저장 (컬럼명 포함) - 동기화 전략 적용"""
+    def _save_to_postgresql_with_columns(self, conf, table_name, chunks, columns, sync_mode="full", sync_state=None,
+                                   checkpoint=None, merge_keys=None, swap=False, fast_load=False,
+                                   deferral=None):
+        """
+        PostgreSQL에 데이터 저장 (컬럼명 포함, 청크 스트림) - 동기화 전략 적용
+        
+        fast_load면 공유 타겟 클러스터의 WAL/fsync 부담을 줄이는 방식으로 적재합니다.
+        - 적재 세션은 synchronous_commit=off
+        - 전체 동기화는 DELETE 대신 TRUNCATE (적재가 커밋될 때까지 테이블을 읽을 수 없음)
+        - 같은 트랜잭션에서 비우거나 만든 테이블(TRUNCATE, 섀도 테이블)에는 COPY FREEZE
+        - 증분 동기화의 임시 테이블은 UNLOGGED
+        """
         import psycopg2
         from psycopg2 import OperationalError
         
         try:
             print(f"PostgreSQL 저장 시작: {conf['host']}:{conf['port']}/{conf['database']}")
-            print(f"테이블명: {table_name}, 데이터 행 수: {len(data)}, 동기화 모드: {sync_mode}")
+            print(f"테이블명: {table_name}, 동기화 모드: {sync_mode}")
             
-            conn = psycopg2.connect(
-                host=conf['host'],
-                port=conf['port'],
-                database=conf['database'],
-                user=conf['user'],
-                password=conf['password']
-            )
+            shadow = None
+            
+            # 첫 번째 청크로 데이터 구조 확인
+            first_chunk, chunks = peek_chunks(chunks)
+            written_rows = 0
+            
+            conn = connect_pooled(conf)
             conn.autocommit = False  # 트랜잭션 수동 관리
+            if fast_load:
+                print("빠른 적재: synchronous_commit=off")
+                set_synchronous_commit(conn, False)
             
             cursor = conn.cursor()
             
@@ -1470,9 +2941,9 @@ class BatchExecutor:
             
             if not table_exists:
                 # 원본 데이터의 구조를 기반으로 테이블 생성
-                if data and len(data) > 0:
+                if first_chunk:
                     # 첫 번째 행의 구조를 분석
-                    first_row = data[0]
+                    first_row = first_chunk[0]
                     print(f"첫 번째 행 타입: {type(first_row)}, 길이: {len(first_row) if isinstance(first_row, (list, tuple)) else 'N/A'}")
                     
                     if isinstance(first_row, (list, tuple)):
@@ -1480,7 +2951,7 @@ class BatchExecutor:
                         create_sql = f"""
                             CREATE TABLE {table_name} (
                                 id SERIAL PRIMARY KEY,
-                                {', '.join([f'{col} TEXT' for col in columns])}
+                                {', '.join([column_definition(col, 'TEXT') for col in columns])}
                             );
                         """
                         print(f"생성할 테이블 SQL: {create_sql}")
@@ -1506,36 +2977,76 @@ class BatchExecutor:
                 print(f"테이블 {table_name}이 생성되었습니다.")
             
             # 동기화 모드에 따른 처리
-            if sync_mode == "full":
+            if sync_mode == "full" and swap and table_exists:
+                # 전체 동기화 (교체): 인덱스 없는 섀도 테이블에 적재하고 인덱스를 만든 뒤 이름을 바꿔 교체
+                # (적재하는 동안 기존 테이블은 그대로 읽을 수 있고 삭제된 행이 남지 않음)
+                print("전체 동기화 전략 적용: 섀도 테이블 적재 후 교체")
+                shadow = ShadowTable('postgresql', cursor, table_name)
+                shadow.create()
+                written_rows = self._insert_postgresql_chunks(cursor, shadow.shadow_name, chunks, columns, freeze=fast_load)
+                shadow.build_indexes()
+                shadow.swap()
+                print(f"PostgreSQL 전체 동기화 완료 (교체): 삽입 {written_rows}행")
+            
+            elif sync_mode == "full":
                 # 전체 동기화: 기존 데이터 삭제 후 새 데이터 삽입
                 print("전체 동기화 전략 적용: 기존 데이터 삭제 후 새 데이터 삽입")
                 
-                # 기존 데이터 삭제
-                cursor.execute(f"DELETE FROM {table_name}")
-                deleted_count = cursor.rowcount
-                print(f"기존 데이터 삭제 완료: {deleted_count}행")
+                if deferral is not None:
+                    # 대량 적재: 행마다 인덱스를 갱신하지 않도록 보조 인덱스를 먼저 삭제
+                    # (적재와 같은 트랜잭션에서 다시 생성하므로 적재가 실패하면 삭제도 롤백됨)
+                    deferral.drop(cursor)
                 
-                # 새 데이터 삽입
-                if data and len(data) > 0:
-                    self._insert_postgresql_data(cursor, table_name, data, columns)
-                    print(f"PostgreSQL 전체 동기화 완료: 삭제 {deleted_count}행, 삽입 {len(data)}행")
+                truncated = False
+                if checkpoint is not None and checkpoint.resumed:
+                    # 이전 실행이 이미 비우고 일부 적재했으므로 삭제하지 않고 이어서 적재
+                    deleted_count = 0
+                    print(f"체크포인트에서 이어서 적재: 이전 실행에서 {checkpoint.rows}행 적재됨")
+                elif fast_load:
+                    # 행마다 삭제 기록(WAL, dead tuple)을 남기지 않고 파일 단위로 비움
+                    cursor.execute(f"TRUNCATE {table_name}")
+                    deleted_count = 0
+                    truncated = True
+                    print("기존 데이터 삭제 완료: TRUNCATE")
                 else:
-                    print(f"PostgreSQL 전체 동기화 완료: 삭제 {deleted_count}행, 삽입 0행")
+                    # 기존 데이터 삭제
+                    cursor.execute(f"DELETE FROM {table_name}")
+                    deleted_count = cursor.rowcount
+                    print(f"기존 데이터 삭제 완료: {deleted_count}행")
+                
+                if checkpoint is not None:
+                    # 삭제와 실행 계획을 먼저 커밋하고 이후 청크마다 커밋
+                    checkpoint.begin(conn, 'postgresql')
+                    conn.commit()
+                
+                # 새 데이터 삽입 (청크 단위, TRUNCATE와 같은 트랜잭션에서 한 번에 적재하면 COPY FREEZE)
+                written_rows = self._insert_postgresql_chunks(cursor, table_name, chunks, columns, checkpoint,
+                                                              freeze=truncated and checkpoint is None)
+                if deferral is not None:
+                    deferral.rebuild_in_transaction(cursor)
+                print(f"PostgreSQL 전체 동기화 완료: 삭제 {deleted_count}행, 삽입 {written_rows}행")
                     
             elif sync_mode == "incremental":
                 # 증분 동기화: 새 데이터만 추가 (삭제된 데이터는 별도 처리 필요)
                 print("증분 동기화 전략 적용: 새 데이터만 추가")
                 
-                if data and len(data) > 0:
+                if first_chunk and merge_keys:
+                    # 키 기준 업서트 (새 키는 추가, 기존 키는 갱신)
+                    print(f"업서트 키: {', '.join(merge_keys)}")
+                    if checkpoint is not None:
+                        checkpoint.begin(conn, 'postgresql')
+                    written_rows = self._upsert_postgresql_chunks(cursor, table_name, chunks, columns, merge_keys, checkpoint)
+                    print(f"PostgreSQL 업서트 완료: {written_rows}행")
+                elif first_chunk:
                     # 중복 제거를 위한 임시 테이블 사용
                     temp_table = f"{table_name}_temp_{int(time.time())}"
                     
-                    # 임시 테이블 생성 및 데이터 삽입
-                    cursor.execute(f"CREATE TABLE {temp_table} AS SELECT * FROM {table_name} WHERE 1=0")
-                    self._insert_postgresql_data(cursor, temp_table, data, columns)
+                    # 임시 테이블 생성 (빠른 적재면 WAL을 쓰지 않는 UNLOGGED)
+                    unlogged = "UNLOGGED " if fast_load else ""
+                    cursor.execute(f"CREATE {unlogged}TABLE {temp_table} AS SELECT * FROM {table_name} WHERE 1=0")
                     
                     # 기존 테이블과 병합 (중복 제거)
-                    if isinstance(data[0], (list, tuple)) and len(columns) > 0:
+                    if isinstance(first_chunk[0], (list, tuple)) and len(columns) > 0:
                         # 컬럼 기반 중복 제거
                         merge_sql = f"""
                             INSERT INTO {table_name} ({', '.join(columns)})
@@ -1550,8 +3061,17 @@ class BatchExecutor:
                             ON CONFLICT DO NOTHING;
                         """
                     
-                    cursor.execute(merge_sql)
-                    inserted_count = cursor.rowcount
+                    if checkpoint is None:
+                        self._insert_postgresql_chunks(cursor, temp_table, chunks, columns)
+                        cursor.execute(merge_sql)
+                        inserted_count = cursor.rowcount
+                    else:
+                        # 청크마다 임시 테이블을 거쳐 병합하고 체크포인트와 함께 커밋
+                        checkpoint.begin(conn, 'postgresql')
+                        inserted_count = self._merge_chunks(
+                            cursor, self._insert_postgresql_data, temp_table, table_name, chunks, columns, merge_sql, checkpoint
+                        )
+                    written_rows = inserted_count
                     
                     # 임시 테이블 삭제
                     cursor.execute(f"DROP TABLE {temp_table}")
@@ -1560,8 +3080,19 @@ class BatchExecutor:
                 else:
                     print("PostgreSQL 증분 동기화 완료: 새로운 데이터 없음")
             
+            # 워터마크를 적재와 같은 트랜잭션으로 기록
+            state = sync_state() if sync_state else None
+            if state is not None:
+                write_sync_state(conn, 'postgresql', state[0], table_name, state[1])
+            if checkpoint is not None:
+                # 모든 청크를 적재했으므로 체크포인트 삭제 (워터마크와 함께 커밋)
+                checkpoint.finish()
+            
             conn.commit()
-            return True, None, None
+            if shadow is not None:
+                # 교체가 커밋되었으므로 기존 테이블은 별도 스레드에서 삭제
+                shadow.drop_retired_async(conf)
+            return True, None, written_rows
             
         except OperationalError as e:
             error_msg = f"PostgreSQL 데이터베이스 저장 중 오류: {e}"
@@ -1574,63 +3105,249 @@ class BatchExecutor:
             return False, error_msg, None
         finally:
             if 'conn' in locals() and conn:
+                if fast_load:
+                    # 풀에 반납하기 전에 세션 설정을 기본값으로 (실패한 트랜잭션은 먼저 롤백)
+                    try:
+                        conn.rollback()
+                        set_synchronous_commit(conn, True)
+                    except Exception as e:
+                        print(f"synchronous_commit 복원 실패: {e}")
+                        conn.invalidate()
                 conn.close()
     
-    def _insert_postgresql_data(self, cursor, table_name, data, columns):
-        """PostgreSQL에 데이터 삽입 (헬퍼 함수)"""
-        # 배치 처리를 위한 준비
-        batch_size = 1000
-        total_rows = len(data)
-        print(f"배치 처리 시작: 총 {total_rows}행, 배치 크기: {batch_size}")
-        
-        # 데이터 삽입 (배치 처리)
-        for i in range(0, total_rows, batch_size):
-            batch_data = data[i:i + batch_size]
-            print(f"배치 {i//batch_size + 1} 처리 중: {i+1}~{min(i + batch_size, total_rows)}행")
-            
-            if isinstance(batch_data[0], (list, tuple)):
-                # 튜플/리스트 형태인 경우
-                values = []
-                for row in batch_data:
-                    placeholders = ', '.join(['%s'] * len(row))
-                    values.append(cursor.mogrify(f"({placeholders})", row).decode('utf-8'))
-                
-                if values:
-                    # 컬럼명을 동적으로 생성
-                    column_list = ', '.join(columns)
+    def _insert_postgresql_chunks(self, cursor, table_name, chunks, columns, checkpoint=None, freeze=False):
+        """
+        PostgreSQL에 청크 스트림 삽입 (삽입한 총 행 수 반환, checkpoint가 있으면 청크마다 커밋)
+        
+        freeze면 COPY FREEZE로 적재합니다. (같은 트랜잭션에서 만들거나 TRUNCATE한 테이블에 한 번에 적재할 때만)
+        """
+        loader = CopyLoader(cursor, table_name, columns, freeze=freeze and checkpoint is None)
+        if checkpoint is None:
+            # 청크 스트림 전체를 COPY 한 번으로 적재
+            total_rows = loader.copy(chunks)
+            print(f"COPY 적재 완료 ({loader.copy_format}): {total_rows}행")
+            return total_rows
+        
+        total_rows = 0
+        for chunk in chunks:
+            chunk_rows = loader.copy([chunk])
+            total_rows += chunk_rows
+            checkpoint.commit_chunk(chunk_rows)
+        return total_rows
+    
+    def _upsert_postgresql_chunks(self, cursor, table_name, chunks, columns, merge_keys, checkpoint=None):
+        """
+        PostgreSQL 키 기준 업서트 (업서트한 총 행 수 반환)
+        
+        청크마다 임시(TEMP) 스테이징 테이블에 COPY로 넣고 INSERT ... ON CONFLICT (키) DO UPDATE 한 문장으로 반영합니다.
+        ON CONFLICT에 필요한 키 유니크 인덱스는 없으면 생성하고(타겟에 중복 키가 있으면 예외), data_hash가 같은 행은 갱신하지 않습니다.
+        임시 테이블은 이 연결에서만 보이므로 같은 타겟에 동시에 실행되는 다른 적재와 겹치지 않습니다.
+        """
+        key_columns, key_indexes = resolve_key_columns(columns, merge_keys)
+        stage_table = stage_table_name(table_name, 'ms')
+        column_list = ', '.join(columns)
+        key_list = ', '.join(key_columns)
+        
+        print(f"업서트 키 인덱스 확인: {table_name} ({key_list})")
+        ensure_unique_key_index('postgresql', cursor, table_name, key_columns, f"{table_name}_merge_key_idx")
+        
+        # 스테이징 테이블은 WAL을 쓰지 않는 세션 임시 테이블, 타겟과 같은 컬럼 타입 (제약 조건 없음)
+        # (청크마다 커밋해도 유지되고, 연결이 끊기면 DB가 삭제)
+        cursor.execute(f"CREATE TEMP TABLE {stage_table} AS SELECT {column_list} FROM {table_name} WHERE 1=0")
+        
+        update_columns = [column for column in columns if column not in key_columns]
+        if update_columns:
+            conflict_action = "DO UPDATE SET " + ', '.join(f"{column} = EXCLUDED.{column}" for column in update_columns)
+            if 'data_hash' in update_columns:
+                # 내용이 같은 행은 갱신하지 않음 (불필요한 행 버전/WAL 방지)
+                conflict_action += f" WHERE {table_name}.data_hash IS DISTINCT FROM EXCLUDED.data_hash"
+        else:
+            conflict_action = "DO NOTHING"
+        upsert_sql = f"""
+            INSERT INTO {table_name} ({column_list})
+            SELECT {column_list} FROM {stage_table}
+            ON CONFLICT ({key_list}) {conflict_action}
+        """
+        
+        stage_loader = CopyLoader(cursor, stage_table, columns)
+        total_rows = 0
+        try:
+            for chunk in chunks:
+                chunk_rows = 0
+                deleted_keys = getattr(chunk, 'deleted_keys', None)
+                if deleted_keys:
+                    # 키 비교 결과(ChangeSet)의 삭제 행
+                    chunk_rows += self._delete_postgresql_keys(cursor, table_name, key_columns, deleted_keys)
+                if len(chunk):
+                    chunk = dedupe_by_key(chunk, key_indexes)
+                    cursor.execute(f"TRUNCATE {stage_table}")
+                    stage_loader.copy([chunk])
+                    cursor.execute(upsert_sql)
+                    chunk_rows += cursor.rowcount
+                    print(f"업서트: {len(chunk)}행 중 {cursor.rowcount}행 추가/갱신")
+                total_rows += chunk_rows
+                if checkpoint is not None:
+                    checkpoint.commit_chunk(chunk_rows)
+        except Exception:
+            # 중단된 트랜잭션에서는 테이블을 삭제할 수 없으므로 실패한 적재를 먼저 롤백
+            cursor.connection.rollback()
+            raise
+        finally:
+            # 이전 청크를 커밋한 뒤 실패했으면 임시 테이블이 남아 있으므로 풀에 반납하기 전에 삭제
+            try:
+                cursor.execute(f"DROP TABLE IF EXISTS {stage_table}")
+            except Exception as e:
+                print(f"스테이징 테이블 삭제 실패: {stage_table} ({e})")
+        return total_rows
+    
+    def _delete_postgresql_keys(self, cursor, table_name, key_columns, keys, batch_size=1000):
+        """PostgreSQL에서 키 튜플 목록에 해당하는 행 삭제 (삭제한 행 수 반환)"""
+        row_template = '(' + ', '.join(['%s'] * len(key_columns)) + ')'
+        deleted_rows = 0
+        for i in range(0, len(keys), batch_size):
+            values = ','.join(cursor.mogrify(row_template, key).decode('utf-8') for key in keys[i:i + batch_size])
+            cursor.execute(f"DELETE FROM {table_name} WHERE ({', '.join(key_columns)}) IN (VALUES {values})")
+            deleted_rows += cursor.rowcount
+        print(f"삭제: {len(keys)}행 중 {deleted_rows}행")
+        return deleted_rows
+    
+    def _delete_jdbc_keys(self, jconn, table_name, key_columns, keys):
+        """Altibase/Informix에서 키 튜플 목록에 해당하는 행을 배치 DELETE로 삭제 (삭제한 행 수 반환)"""
+        delete_stmt = jconn.prepareStatement(
+            f"DELETE FROM {table_name} WHERE {' AND '.join(f'{column} = ?' for column in key_columns)}"
+        )
+        try:
+            for key in keys:
+                set_statement_params(delete_stmt, list(key))
+                delete_stmt.addBatch()
+            # 드라이버가 행 수 대신 SUCCESS_NO_INFO(-2)를 돌려주면 0으로 계산
+            deleted_rows = sum(max(int(count), 0) for count in delete_stmt.executeBatch())
+        finally:
+            delete_stmt.close()
+        print(f"삭제: {len(keys)}행 중 {deleted_rows}행")
+        return deleted_rows
+    
+    def _merge_jdbc_chunks(self, conn, db_type, table_name, chunks, columns, merge_keys, checkpoint=None):
+        """
+        Altibase/Informix 키 기준 MERGE INTO (병합한 총 행 수 반환)
+        
+        청크마다 스테이징 테이블에 배치 INSERT로 넣고 MERGE 한 문장으로 추가/갱신합니다.
+        키 유니크 인덱스는 없으면 생성합니다. (타겟에 중복 키가 있으면 예외) Altibase 테이블의 id는 기본값이 없으므로
+        청크마다 타겟 테이블을 잠근 뒤 스테이징 테이블에서 현재 최대값 다음 번호를 매겨 넣습니다. (Informix는 SERIAL)
+        잠금은 청크가 커밋될 때까지 유지되므로 같은 테이블에 쓰는 다른 작업과 id가 겹치지 않습니다.
+        스테이징 테이블은 실행마다 다른 이름으로 만들고 끝나면(실패해도) 삭제합니다.
+        """
+        key_columns, key_indexes = resolve_key_columns(columns, merge_keys)
+        stage_table = stage_table_name(table_name, 'ms')
+        with_id = db_type == 'altibase'
+        stage_columns = (['id'] if with_id else []) + list(columns)
+        update_columns = [column for column in columns if column not in key_columns]
+        
+        merge_sql = f"""
+            MERGE INTO {table_name} t
+            USING {stage_table} s
+            ON ({' AND '.join(f"t.{column} = s.{column}" for column in key_columns)})
+        """
+        if update_columns:
+            merge_sql += f"""
+            WHEN MATCHED THEN UPDATE SET {', '.join(f"{column} = s.{column}" for column in update_columns)}
+            """
+        merge_sql += f"""
+            WHEN NOT MATCHED THEN INSERT ({', '.join(stage_columns)})
+            VALUES ({', '.join(f"s.{column}" for column in stage_columns)})
+        """
+        
+        jconn = conn.jconn
+        stmt = jconn.createStatement()
+        stage_writer = None
+        stage_created = False
+        try:
+            print(f"업서트 키 인덱스 확인: {table_name} ({', '.join(key_columns)})")
+            ensure_unique_key_index(db_type, stmt, table_name, key_columns, f"{table_name}_merge_key_idx")
+            
+            # 타겟과 같은 타입의 스테이징 테이블 생성
+            stmt.execute(f"CREATE TABLE {stage_table} AS SELECT {', '.join(stage_columns)} FROM {table_name} WHERE 1=0")
+            stage_created = True
+            
+            # 스테이징 적재와 MERGE가 같은 트랜잭션(같은 잠금)에 있도록 writer는 커밋하지 않음
+            stage_writer = JdbcBatchWriter(jconn, stage_table, columns, commit_interval=0,
+                                           id_start=1 if with_id else None)
+            
+            total_rows = 0
+            for chunk in chunks:
+                chunk_rows = 0
+                deleted_keys = getattr(chunk, 'deleted_keys', None)
+                if deleted_keys:
+                    # 키 비교 결과(ChangeSet)의 삭제 행
+                    chunk_rows += self._delete_jdbc_keys(jconn, table_name, key_columns, deleted_keys)
+                if len(chunk):
+                    chunk = dedupe_by_key(chunk, key_indexes)
+                    if with_id:
+                        # 커밋할 때까지 다른 쓰기를 막고 현재 최대값 다음 번호부터 매김
+                        stmt.execute(f"LOCK TABLE {table_name} IN EXCLUSIVE MODE")
+                        result_set = stmt.executeQuery(f"SELECT MAX(id) FROM {table_name}")
+                        result_set.next()
+                        stage_writer.next_id = int(result_set.getLong(1)) + 1
+                        result_set.close()
+                    stmt.executeUpdate(f"DELETE FROM {stage_table}")
+                    stage_writer.write(chunk)
                     
-                    insert_sql = f"""
-                        INSERT INTO {table_name} ({column_list}) 
-                        VALUES {','.join(values)};
-                    """
-                    print(f"INSERT SQL 실행: {len(values)}행")
-                    cursor.execute(insert_sql)
-            else:
-                # 딕셔너리 형태인 경우
-                values = []
-                for row in batch_data:
-                    values.append(cursor.mogrify("(%s)", (json.dumps(row, ensure_ascii=False),)).decode('utf-8'))
-                
-                if values:
-                    cursor.execute(f"""
-                        INSERT INTO {table_name} (data) VALUES {','.join(values)};
-                    """)
+                    merged_rows = int(stmt.executeUpdate(merge_sql))
+                    chunk_rows += merged_rows
+                    print(f"MERGE: {len(chunk)}행 중 {merged_rows}행 추가/갱신")
+                total_rows += chunk_rows
+                if checkpoint is not None:
+                    checkpoint.commit_chunk(chunk_rows)
             
-            print(f"배치 처리 완료: {min(i + batch_size, total_rows)}/{total_rows}")
+            return total_rows
+        except Exception:
+            # 스테이징 테이블을 삭제하기 전에 실패한 적재를 롤백 (Altibase는 DDL이 트랜잭션을 커밋함)
+            jconn.rollback()
+            raise
+        finally:
+            if stage_writer is not None:
+                stage_writer.close()
+            if stage_created:
+                try:
+                    stmt.execute(f"DROP TABLE {stage_table}")
+                except Exception as e:
+                    print(f"스테이징 테이블 삭제 실패: {stage_table} ({e})")
+            stmt.close()
     
-    def _clear_postgresql_table(self, conf, table_name):
-        """PostgreSQL 테이블의 모든 데이터 삭제"""
+    def _merge_chunks(self, cursor, insert_data, temp_table, table_name, chunks, columns, merge_sql, checkpoint):
+        """청크마다 임시 테이블에 넣고 타겟 테이블에 병합한 뒤 체크포인트와 함께 커밋 (병합한 총 행 수 반환)"""
+        merged_rows = 0
+        for chunk in chunks:
+            insert_data(cursor, temp_table, chunk, columns)
+            cursor.execute(merge_sql)
+            chunk_rows = cursor.rowcount
+            cursor.execute(f"DELETE FROM {temp_table}")
+            merged_rows += chunk_rows
+            checkpoint.commit_chunk(chunk_rows)
+        print(f"{table_name} 병합 완료: {merged_rows}행")
+        return merged_rows
+    
+    def _insert_postgresql_data(self, cursor, table_name, data, columns):
+        """PostgreSQL에 데이터 삽입 (헬퍼 함수, COPY ... FROM STDIN)"""
+        total_rows = len(data)
+        if not total_rows:
+            return
+        
+        if isinstance(data, ColumnBatch) or isinstance(data[0], (list, tuple)):
+            # 튜플/리스트 형태인 경우
+            copy_rows(cursor, table_name, columns, [data])
+        else:
+            # 딕셔너리 형태인 경우
+            copy_rows(cursor, table_name, ['data'], [[(json.dumps(row, ensure_ascii=False),) for row in data]])
+        print(f"COPY 적재 완료: {total_rows}행")
+    
+    def _clear_postgresql_table(self, conf, table_name, truncate=False):
+        """PostgreSQL 테이블의 모든 데이터 삭제 (truncate면 DELETE 대신 TRUNCATE)"""
         import psycopg2
         from psycopg2 import OperationalError
         
         try:
-            conn = psycopg2.connect(
-                host=conf['host'],
-                port=conf['port'],
-                database=conf['database'],
-                user=conf['user'],
-                password=conf['password']
-            )
+            conn = connect_pooled(conf)
             conn.autocommit = False
             
             cursor = conn.cursor()
@@ -1644,7 +3361,11 @@ class BatchExecutor:
             """)
             table_exists = cursor.fetchone()[0]
             
-            if table_exists:
+            if table_exists and truncate:
+                cursor.execute(f"TRUNCATE {table_name}")
+                conn.commit()
+                print(f"PostgreSQL 테이블 {table_name} 데이터 삭제 완료: TRUNCATE")
+            elif table_exists:
                 cursor.execute(f"DELETE FROM {table_name}")
                 deleted_count = cursor.rowcount
                 conn.commit()
@@ -1661,454 +3382,539 @@ class BatchExecutor:
             if 'conn' in locals() and conn:
                 conn.close()
 
-    def _save_to_altibase_with_columns(self, conf, table_name, data, columns, sync_mode="full"):
-        """Altibase에 데이터 저장 (컬럼명 포함) - 동기화 전략 적용"""
-        import jaydebeapi
-        
+    def _save_to_altibase_with_columns(self, conf, table_name, chunks, columns, sync_mode="full", sync_state=None,
+                                   checkpoint=None, merge_keys=None, swap=False,
+                                   deferral=None):
+        """Altibase에 데이터 저장 (컬럼명 포함, 청크 스트림) - 동기화 전략 적용"""
         try:
-            # 작업 디렉토리를 db_connection_test로 변경
-            original_cwd = os.getcwd()
-            os.chdir('/app/db_connection_test')
+            print(f"Altibase 저장 시작: {conf['host']}:{conf['port']}/{conf['database']}")
+            print(f"테이블명: {table_name}, 동기화 모드: {sync_mode}")
             
-            try:
-                print(f"Altibase 저장 시작: {conf['host']}:{conf['port']}/{conf['database']}")
-                print(f"테이블명: {table_name}, 데이터 행 수: {len(data)}, 동기화 모드: {sync_mode}")
-                
-                url = f"jdbc:Altibase://{conf['host']}:{conf['port']}/{conf['database']}"
-                jar = "/app/db_connection_test/Altibase.jar"
-                
-                conn = jaydebeapi.connect(
-                    "Altibase.jdbc.driver.AltibaseDriver",
-                    url,
-                    [conf['user'], conf['password']],
-                    jar
-                )
-                conn.autocommit = False  # 트랜잭션 수동 관리
-                
-                cursor = conn.jconn.createStatement()
-                
-                # 테이블 존재 여부 확인 및 생성
-                cursor.execute(f"""
-                    SELECT COUNT(*) FROM SYSTEM_.SYS_TABLES_ WHERE TABLE_NAME = '{table_name}'
-                """)
-                table_exists = cursor.fetchone()[0] > 0
-                print(f"테이블 존재 여부: {table_exists}")
-                
-                if not table_exists:
-                    # 테이블 생성
-                    if data and len(data) > 0:
-                        # 첫 번째 행의 구조를 분석
-                        first_row = data[0]
-                        if isinstance(first_row, (list, tuple)) and len(first_row) <= 10:
-                            # 컬럼별 저장 (컬럼 수가 적을 때만)
-                            columns = []
-                            for i, value in enumerate(first_row):
-                                if isinstance(value, int):
-                                    columns.append(f"col_{i} INTEGER")
-                                elif isinstance(value, float):
-                                    columns.append(f"col_{i} NUMERIC")
-                                elif isinstance(value, bool):
-                                    columns.append(f"col_{i} SMALLINT")  # Altibase에서 BOOLEAN 대신 SMALLINT 사용
-                                else:
-                                    columns.append(f"col_{i} VARCHAR(1000)")
-                            
-                            create_sql = f"""
-                                CREATE TABLE {table_name} (
-                                    id INTEGER PRIMARY KEY,
-                                    {', '.join(columns)}
-                                );
-                            """
-                        else:
-                            # JSON 형태로 저장
-                            create_sql = f"""
-                                CREATE TABLE {table_name} (
-                                    id INTEGER PRIMARY KEY,
-                                    data VARCHAR(4000)
-                                );
-                            """
+            shadow = None
+            
+            # 첫 번째 청크로 데이터 구조 확인
+            first_chunk, chunks = peek_chunks(chunks)
+            written_rows = 0
+            
+            conn = connect_pooled(conf)
+            conn.autocommit = False  # 트랜잭션 수동 관리
+            conn.jconn.setAutoCommit(False)  # JDBC 연결은 jconn에서 설정해야 적용됨
+            
+            cursor = conn.jconn.createStatement()
+            
+            # 테이블 존재 여부 확인 및 생성
+            cursor.execute(f"""
+                SELECT COUNT(*) FROM SYSTEM_.SYS_TABLES_ WHERE TABLE_NAME = '{table_name}'
+            """)
+            table_exists = cursor.fetchone()[0] > 0
+            print(f"테이블 존재 여부: {table_exists}")
+            
+            if table_exists:
+                # 이전 실행이 대량 적재 중에 종료되어 남은 인덱스 삭제 기록이 있으면 먼저 복구
+                restore_deferred_indexes('altibase', cursor, table_name)
+            
+            if not table_exists:
+                # 테이블 생성
+                if first_chunk:
+                    # 첫 번째 행의 구조를 분석
+                    first_row = first_chunk[0]
+                    if isinstance(first_row, (list, tuple)) and len(first_row) <= 10:
+                        # 컬럼별 저장 (컬럼 수가 적을 때만, INSERT와 같은 컬럼명 사용)
+                        column_defs = []
+                        for col, value in zip(columns, first_row):
+                            if col == 'data_hash':
+                                column_defs.append(column_definition(col, 'BIGINT'))
+                            elif isinstance(value, bool):
+                                column_defs.append(f"{col} SMALLINT")  # Altibase에서 BOOLEAN 대신 SMALLINT 사용
+                            elif isinstance(value, int):
+                                column_defs.append(f"{col} BIGINT")
+                            elif isinstance(value, float):
+                                column_defs.append(f"{col} NUMERIC")
+                            else:
+                                column_defs.append(f"{col} VARCHAR(1000)")
+                        
+                        create_sql = f"""
+                            CREATE TABLE {table_name} (
+                                id INTEGER PRIMARY KEY,
+                                {', '.join(column_defs)}
+                            );
+                        """
                     else:
-                        # 기본 구조
+                        # JSON 형태로 저장
                         create_sql = f"""
                             CREATE TABLE {table_name} (
                                 id INTEGER PRIMARY KEY,
                                 data VARCHAR(4000)
                             );
                         """
-                    
-                    cursor.execute(create_sql)
+                else:
+                    # 기본 구조
+                    create_sql = f"""
+                        CREATE TABLE {table_name} (
+                            id INTEGER PRIMARY KEY,
+                            data VARCHAR(4000)
+                        );
+                    """
+                
+                cursor.execute(create_sql)
+                conn.jconn.commit()
+                print(f"테이블 {table_name}이 생성되었습니다.")
+            
+            # 동기화 모드에 따른 처리
+            if sync_mode == "full" and swap and table_exists:
+                # 전체 동기화 (교체): 인덱스 없는 섀도 테이블에 적재하고 인덱스를 만든 뒤 이름을 바꿔 교체
+                # (적재하는 동안 기존 테이블은 그대로 읽을 수 있고 삭제된 행이 남지 않음)
+                print("전체 동기화 전략 적용: 섀도 테이블 적재 후 교체")
+                shadow = ShadowTable('altibase', cursor, table_name)
+                shadow.create()
+                written_rows = self._insert_altibase_chunks(cursor, shadow.shadow_name, chunks, columns)
+                shadow.build_indexes()
+                shadow.swap()
+                print(f"Altibase 전체 동기화 완료 (교체): 삽입 {written_rows}행")
+            
+            elif sync_mode == "full":
+                # 전체 동기화: 기존 데이터 삭제 후 새 데이터 삽입
+                print("전체 동기화 전략 적용: 기존 데이터 삭제 후 새 데이터 삽입")
+                
+                if deferral is not None:
+                    # 대량 적재: 행마다 인덱스를 갱신하지 않도록 보조 인덱스를 먼저 삭제 (적재 후 다시 생성)
+                    # (DDL이 바로 커밋되므로 삭제한 인덱스는 타겟에 기록해 두고 비정상 종료되면 다음 실행이 복구)
+                    deferral.drop(cursor)
                     conn.jconn.commit()
-                    print(f"테이블 {table_name}이 생성되었습니다.")
                 
-                # 동기화 모드에 따른 처리
-                if sync_mode == "full":
-                    # 전체 동기화: 기존 데이터 삭제 후 새 데이터 삽입
-                    print("전체 동기화 전략 적용: 기존 데이터 삭제 후 새 데이터 삽입")
-                    
+                if checkpoint is not None and checkpoint.resumed:
+                    # 이전 실행이 이미 비우고 일부 적재했으므로 삭제하지 않고 이어서 적재
+                    deleted_count = 0
+                    print(f"체크포인트에서 이어서 적재: 이전 실행에서 {checkpoint.rows}행 적재됨")
+                else:
                     # 기존 데이터 삭제
                     cursor.execute(f"DELETE FROM {table_name}")
                     deleted_count = cursor.rowcount
                     print(f"기존 데이터 삭제 완료: {deleted_count}행")
+                
+                if checkpoint is not None:
+                    # 삭제와 실행 계획을 먼저 커밋하고 이후 청크마다 커밋
+                    checkpoint.begin(conn, 'altibase')
+                    conn.jconn.commit()
+                
+                # 새 데이터 삽입 (청크 단위)
+                written_rows = self._insert_altibase_chunks(cursor, table_name, chunks, columns, checkpoint)
+                print(f"Altibase 전체 동기화 완료: 삭제 {deleted_count}행, 삽입 {written_rows}행")
                     
-                    # 새 데이터 삽입
-                    if data and len(data) > 0:
-                        self._insert_altibase_data(cursor, table_name, data, columns)
-                        print(f"Altibase 전체 동기화 완료: 삭제 {deleted_count}행, 삽입 {len(data)}행")
+            elif sync_mode == "incremental":
+                # 증분 동기화: 새 데이터만 추가 (중복 제거)
+                print("증분 동기화 전략 적용: 새 데이터만 추가")
+                
+                if first_chunk and merge_keys:
+                    # 키 기준 업서트 (새 키는 추가, 기존 키는 갱신)
+                    print(f"업서트 키: {', '.join(merge_keys)}")
+                    if checkpoint is not None:
+                        checkpoint.begin(conn, 'altibase')
+                    written_rows = self._merge_jdbc_chunks(conn, 'altibase', table_name, chunks, columns, merge_keys, checkpoint)
+                    print(f"Altibase 업서트 완료: {written_rows}행")
+                elif first_chunk:
+                    # 중복 제거를 위한 임시 테이블 사용
+                    temp_table = f"{table_name}_temp_{int(time.time())}"
+                    
+                    # 임시 테이블 생성
+                    cursor.execute(f"CREATE TABLE {temp_table} AS SELECT * FROM {table_name} WHERE 1=0")
+                    
+                    # 기존 테이블과 병합 (중복 제거)
+                    if isinstance(first_chunk[0], (list, tuple)) and len(columns) > 0:
+                        # 컬럼 기반 중복 제거
+                        merge_sql = f"""
+                            INSERT INTO {table_name} ({', '.join(columns)})
+                            SELECT {', '.join(columns)} FROM {temp_table}
+                            WHERE NOT EXISTS (
+                                SELECT 1 FROM {table_name} t2 
+                                WHERE t2.{columns[0]} = {temp_table}.{columns[0]}
+                            );
+                        """
                     else:
-                        print(f"Altibase 전체 동기화 완료: 삭제 {deleted_count}행, 삽입 0행")
-                        
-                elif sync_mode == "incremental":
-                    # 증분 동기화: 새 데이터만 추가 (중복 제거)
-                    print("증분 동기화 전략 적용: 새 데이터만 추가")
+                        # JSON 기반 중복 제거
+                        merge_sql = f"""
+                            INSERT INTO {table_name} (data)
+                            SELECT data FROM {temp_table}
+                            WHERE NOT EXISTS (
+                                SELECT 1 FROM {table_name} t2 
+                                WHERE t2.data = {temp_table}.data
+                            );
+                        """
                     
-                    if data and len(data) > 0:
-                        # 중복 제거를 위한 임시 테이블 사용
-                        temp_table = f"{table_name}_temp_{int(time.time())}"
-                        
-                        # 임시 테이블 생성
-                        cursor.execute(f"CREATE TABLE {temp_table} AS SELECT * FROM {table_name} WHERE 1=0")
-                        self._insert_altibase_data(cursor, temp_table, data, columns)
-                        
-                        # 기존 테이블과 병합 (중복 제거)
-                        if isinstance(data[0], (list, tuple)) and len(columns) > 0:
-                            # 컬럼 기반 중복 제거
-                            merge_sql = f"""
-                                INSERT INTO {table_name} ({', '.join(columns)})
-                                SELECT {', '.join(columns)} FROM {temp_table}
-                                WHERE NOT EXISTS (
-                                    SELECT 1 FROM {table_name} t2 
-                                    WHERE t2.{columns[0]} = {temp_table}.{columns[0]}
-                                );
-                            """
-                        else:
-                            # JSON 기반 중복 제거
-                            merge_sql = f"""
-                                INSERT INTO {table_name} (data)
-                                SELECT data FROM {temp_table}
-                                WHERE NOT EXISTS (
-                                    SELECT 1 FROM {table_name} t2 
-                                    WHERE t2.data = {temp_table}.data
-                                );
-                            """
-                        
+                    if checkpoint is None:
+                        self._insert_altibase_chunks(cursor, temp_table, chunks, columns)
                         cursor.execute(merge_sql)
                         inserted_count = cursor.rowcount
-                        
-                        # 임시 테이블 삭제
-                        cursor.execute(f"DROP TABLE {temp_table}")
-                        
-                        print(f"Altibase 증분 동기화 완료: 추가 {inserted_count}행")
                     else:
-                        print("Altibase 증분 동기화 완료: 새로운 데이터 없음")
-                
-                conn.jconn.commit()
-                return True, None, None
-                
-            finally:
-                # 작업 디렉토리 복원
-                os.chdir(original_cwd)
+                        # 청크마다 임시 테이블을 거쳐 병합하고 체크포인트와 함께 커밋
+                        checkpoint.begin(conn, 'altibase')
+                        inserted_count = self._merge_chunks(
+                            cursor, self._insert_altibase_data, temp_table, table_name, chunks, columns, merge_sql, checkpoint
+                        )
+                    written_rows = inserted_count
+                    
+                    # 임시 테이블 삭제
+                    cursor.execute(f"DROP TABLE {temp_table}")
+                    
+                    print(f"Altibase 증분 동기화 완료: 추가 {inserted_count}행")
+                else:
+                    print("Altibase 증분 동기화 완료: 새로운 데이터 없음")
+            
+            # 워터마크를 적재와 같은 트랜잭션으로 기록
+            state = sync_state() if sync_state else None
+            if state is not None:
+                write_sync_state(conn, 'altibase', state[0], table_name, state[1])
+            if checkpoint is not None:
+                # 모든 청크를 적재했으므로 체크포인트 삭제 (워터마크와 함께 커밋)
+                checkpoint.finish()
+            
+            conn.jconn.commit()
+            if shadow is not None:
+                # 교체가 커밋되었으므로 기존 테이블은 별도 스레드에서 삭제
+                shadow.drop_retired_async(conf)
+            return True, None, written_rows
                 
         except Exception as e:
             import traceback
             error_msg = f"Altibase 데이터베이스 저장 중 예외 발생: {e}\n{traceback.format_exc()}"
             print(error_msg)
             return False, error_msg, None
+        finally:
+            if 'conn' in locals() and conn:
+                # 풀에 반납 (커밋되지 않은 적재 트랜잭션은 반납할 때 롤백되어 잠금이 풀림)
+                conn.close()
+            if deferral is not None:
+                # 적재 연결을 반납한 뒤 삭제했던 인덱스를 다시 생성 (실패한 경우에도)
+                deferral.rebuild(conf)
+    
+    def _insert_altibase_chunks(self, cursor, table_name, chunks, columns, checkpoint=None):
+        """Altibase에 청크 스트림 삽입 (삽입한 총 행 수 반환, checkpoint가 있으면 청크마다 커밋)"""
+        # 이어서 실행하면 이전 실행에서 적재한 행 다음 번호부터
+        first_id = (checkpoint.rows if checkpoint is not None else 0) + 1
+        if len(columns) > 10:
+            # 컬럼이 많은 테이블은 JSON 형태로 저장 (청크마다 id가 이어지도록 시작 번호 전달)
+            total_rows = 0
+            for chunk in chunks:
+                self._insert_altibase_data(cursor, table_name, chunk, columns, start_id=first_id + total_rows)
+                total_rows += len(chunk)
+                if checkpoint is not None:
+                    checkpoint.commit_chunk(len(chunk))
+            return total_rows
+        
+        # INSERT는 한 번만 준비하고 청크마다 배치로 바인딩 (id는 writer가 이어서 매김)
+        total_rows = 0
+        with JdbcBatchWriter(cursor.getConnection(), table_name, columns, id_start=first_id) as writer:
+            for chunk in chunks:
+                chunk_rows = writer.write(chunk)
+                total_rows += chunk_rows
+                if checkpoint is not None:
+                    checkpoint.commit_chunk(chunk_rows)
+        print(f"배치 INSERT 완료: {total_rows}행")
+        return total_rows
     
-    def _insert_altibase_data(self, cursor, table_name, data, columns):
-        """Altibase에 데이터 삽입 (헬퍼 함수)"""
-        # 배치 처리를 위한 준비
-        batch_size = 1000
+    def _insert_altibase_data(self, cursor, table_name, data, columns, start_id=1):
+        """Altibase에 데이터 삽입 (헬퍼 함수, 준비된 INSERT를 addBatch/executeBatch로 실행)"""
         total_rows = len(data)
-        print(f"배치 처리 시작: 총 {total_rows}행, 배치 크기: {batch_size}")
-        
-        # 데이터 삽입 (배치 처리)
-        for i in range(0, total_rows, batch_size):
-            batch_data = data[i:i + batch_size]
-            print(f"배치 {i//batch_size + 1} 처리 중: {i+1}~{min(i + batch_size, total_rows)}행")
-            
-            for row_id, row in enumerate(batch_data, i + 1):
-                # 테이블 구조에 따라 적절한 INSERT 사용
-                if isinstance(row, (list, tuple)) and len(row) <= 10:
-                    # 컬럼별 저장
-                    placeholders = ', '.join(['?'] * len(row))
-                    column_list = ', '.join(columns)
-                    
-                    cursor.execute(f"""
-                        INSERT INTO {table_name} (id, {column_list}) VALUES (?, {placeholders});
-                    """, [row_id] + list(row))
-                else:
-                    # JSON 형태로 저장
-                    row_data = json.dumps(row, ensure_ascii=False)[:3990]  # Altibase VARCHAR 제한
-                    
-                    cursor.execute(f"""
-                        INSERT INTO {table_name} (id, data) VALUES (?, ?);
-                    """, (row_id, row_data))
+        if not total_rows:
+            return
+        
+        # 테이블 구조에 따라 적절한 INSERT 사용
+        if (isinstance(data, ColumnBatch) or isinstance(data[0], (list, tuple))) and len(data[0]) <= 10:
+            # 컬럼별 저장
+            insert_columns, rows = columns, data
+        else:
+            # JSON 형태로 저장
+            insert_columns = ['data']
+            rows = [(json.dumps(row, ensure_ascii=False)[:3990],) for row in data]  # Altibase VARCHAR 제한
+        
+        with JdbcBatchWriter(cursor.getConnection(), table_name, insert_columns, id_start=start_id) as writer:
+            writer.write(rows)
+        print(f"배치 INSERT 완료: {total_rows}행")
+    
+    def _clear_altibase_table(self, conf, table_name):
+        """Altibase 테이블의 모든 데이터 삭제"""
+        try:
+            conn = connect_pooled(conf)
+            conn.autocommit = False
+            
+            cursor = conn.jconn.createStatement()
+            
+            # 테이블 존재 여부 확인
+            cursor.execute(f"""
+                SELECT COUNT(*) FROM SYSTEM_.SYS_TABLES_ WHERE TABLE_NAME = '{table_name}'
+            """)
+            table_exists = cursor.fetchone()[0] > 0
             
-            print(f"배치 처리 완료: {min(i + batch_size, total_rows)}/{total_rows}")
-    
-    def _clear_altibase_table(self, conf, table_name):
-        """Altibase 테이블의 모든 데이터 삭제"""
-        import jaydebeapi
-        
-        try:
-            # 작업 디렉토리를 db_connection_test로 변경
-            original_cwd = os.getcwd()
-            os.chdir('/app/db_connection_test')
+            if table_exists:
+                cursor.execute(f"DELETE FROM {table_name}")
+                deleted_count = cursor.rowcount
+                conn.jconn.commit()
+                print(f"Altibase 테이블 {table_name} 데이터 삭제 완료: {deleted_count}행")
+            else:
+                print(f"Altibase 테이블 {table_name}이 존재하지 않습니다.")
             
-            try:
-                url = f"jdbc:Altibase://{conf['host']}:{conf['port']}/{conf['database']}"
-                jar = "/app/db_connection_test/Altibase.jar"
-                
-                conn = jaydebeapi.connect(
-                    "Altibase.jdbc.driver.AltibaseDriver",
-                    url,
-                    [conf['user'], conf['password']],
-                    jar
-                )
-                conn.autocommit = False
-                
-                cursor = conn.jconn.createStatement()
-                
-                # 테이블 존재 여부 확인
-                cursor.execute(f"""
-                    SELECT COUNT(*) FROM SYSTEM_.SYS_TABLES_ WHERE TABLE_NAME = '{table_name}'
-                """)
-                table_exists = cursor.fetchone()[0] > 0
-                
-                if table_exists:
-                    cursor.execute(f"DELETE FROM {table_name}")
-                    deleted_count = cursor.rowcount
-                    conn.jconn.commit()
-                    print(f"Altibase 테이블 {table_name} 데이터 삭제 완료: {deleted_count}행")
-                else:
-                    print(f"Altibase 테이블 {table_name}이 존재하지 않습니다.")
-                
-                return True
-                
-            finally:
-                # 작업 디렉토리 복원
-                os.chdir(original_cwd)
+            return True
                 
         except Exception as e:
             print(f"Altibase 테이블 삭제 중 오류: {e}")
             return False
+        finally:
+            if 'conn' in locals() and conn:
+                conn.close()
 
-    def _save_to_informix_with_columns(self, conf, table_name, data, columns, sync_mode="full"):
-        """Informix에 데이터 저장 (컬럼명 포함) - 동기화 전략 적용"""
-        import jaydebeapi
-        
+    def _save_to_informix_with_columns(self, conf, table_name, chunks, columns, sync_mode="full", sync_state=None,
+                                   checkpoint=None, merge_keys=None, swap=False,
+                                   deferral=None):
+        """Informix에 데이터 저장 (컬럼명 포함, 청크 스트림) - 동기화 전략 적용"""
         try:
-            # 작업 디렉토리를 db_connection_test로 변경
-            original_cwd = os.getcwd()
-            os.chdir('/app/db_connection_test')
+            print(f"Informix 저장 시작: {conf['host']}:{conf['port']}/{conf['database']}")
+            print(f"테이블명: {table_name}, 동기화 모드: {sync_mode}")
             
-            try:
-                print(f"Informix 저장 시작: {conf['host']}:{conf['port']}/{conf['database']}")
-                print(f"테이블명: {table_name}, 데이터 행 수: {len(data)}, 동기화 모드: {sync_mode}")
-                
-                url = f"jdbc:informix-sqli://{conf['host']}:{conf['port']}/{conf['database']}:NEWCODESET=EUC-KR,cp1252,819"
-                jar = "/app/db_connection_test/ifxjdbc.jar"
-                
-                conn = jaydebeapi.connect(
-                    "com.informix.jdbc.IfxDriver",  # 올바른 드라이버 클래스명 사용
-                    url,
-                    [conf['user'], conf['password']],
-                    jar
-                )
-                conn.autocommit = False  # 트랜잭션 수동 관리
-                
-                cursor = conn.jconn.createStatement()
-                
-                # 테이블 존재 여부 확인 및 생성
-                cursor.execute(f"""
-                    SELECT COUNT(*) FROM sysmaster:sys_tables WHERE tabname = '{table_name}'
-                """)
-                table_exists = cursor.fetchone()[0] > 0
-                print(f"테이블 존재 여부: {table_exists}")
-                
-                if not table_exists:
-                    # 테이블 생성
-                    if data and len(data) > 0:
-                        # 첫 번째 행의 구조를 분석
-                        first_row = data[0]
-                        if isinstance(first_row, (list, tuple)):
-                            # 튜플/리스트 형태인 경우
-                            create_sql = f"""
-                                CREATE TABLE {table_name} (
-                                    id SERIAL PRIMARY KEY,
-                                    {', '.join([f'{col} VARCHAR(1000)' for col in columns])}
-                                );
-                            """
-                        else:
-                            # 딕셔너리 형태인 경우
-                            create_sql = f"""
-                                CREATE TABLE {table_name} (
-                                    id SERIAL PRIMARY KEY,
-                                    data TEXT
-                                );
-                            """
+            shadow = None
+            
+            # 첫 번째 청크로 데이터 구조 확인
+            first_chunk, chunks = peek_chunks(chunks)
+            written_rows = 0
+            
+            conn = connect_pooled(conf)
+            conn.autocommit = False  # 트랜잭션 수동 관리
+            conn.jconn.setAutoCommit(False)  # JDBC 연결은 jconn에서 설정해야 적용됨
+            
+            cursor = conn.jconn.createStatement()
+            
+            # 테이블 존재 여부 확인 및 생성
+            cursor.execute(f"""
+                SELECT COUNT(*) FROM sysmaster:sys_tables WHERE tabname = '{table_name}'
+            """)
+            table_exists = cursor.fetchone()[0] > 0
+            print(f"테이블 존재 여부: {table_exists}")
+            
+            if table_exists:
+                # 이전 실행이 대량 적재 중에 종료되어 남은 인덱스 삭제 기록이 있으면 먼저 복구
+                restore_deferred_indexes('informix', cursor, table_name)
+            
+            if not table_exists:
+                # 테이블 생성
+                if first_chunk:
+                    # 첫 번째 행의 구조를 분석
+                    first_row = first_chunk[0]
+                    if isinstance(first_row, (list, tuple)):
+                        # 튜플/리스트 형태인 경우
+                        create_sql = f"""
+                            CREATE TABLE {table_name} (
+                                id SERIAL PRIMARY KEY,
+                                {', '.join([column_definition(col, 'VARCHAR(1000)') for col in columns])}
+                            );
+                        """
                     else:
-                        # 기본 구조
+                        # 딕셔너리 형태인 경우
                         create_sql = f"""
                             CREATE TABLE {table_name} (
                                 id SERIAL PRIMARY KEY,
                                 data TEXT
                             );
                         """
-                    
-                    cursor.execute(create_sql)
+                else:
+                    # 기본 구조
+                    create_sql = f"""
+                        CREATE TABLE {table_name} (
+                            id SERIAL PRIMARY KEY,
+                            data TEXT
+                        );
+                    """
+                
+                cursor.execute(create_sql)
+                conn.jconn.commit()
+                print(f"테이블 {table_name}이 생성되었습니다.")
+            
+            # 동기화 모드에 따른 처리
+            if sync_mode == "full" and swap and table_exists:
+                # 전체 동기화 (교체): 인덱스 없는 섀도 테이블에 적재하고 인덱스를 만든 뒤 이름을 바꿔 교체
+                # (적재하는 동안 기존 테이블은 그대로 읽을 수 있고 삭제된 행이 남지 않음)
+                print("전체 동기화 전략 적용: 섀도 테이블 적재 후 교체")
+                shadow = ShadowTable('informix', cursor, table_name)
+                shadow.create()
+                written_rows = self._insert_informix_chunks(cursor, shadow.shadow_name, chunks, columns)
+                shadow.build_indexes()
+                shadow.swap()
+                print(f"Informix 전체 동기화 완료 (교체): 삽입 {written_rows}행")
+            
+            elif sync_mode == "full":
+                # 전체 동기화: 기존 데이터 삭제 후 새 데이터 삽입
+                print("전체 동기화 전략 적용: 기존 데이터 삭제 후 새 데이터 삽입")
+                
+                if deferral is not None:
+                    # 대량 적재: 행마다 인덱스를 갱신하지 않도록 보조 인덱스를 먼저 삭제 (적재 후 다시 생성)
+                    # (DDL이 바로 커밋되므로 삭제한 인덱스는 타겟에 기록해 두고 비정상 종료되면 다음 실행이 복구)
+                    deferral.drop(cursor)
                     conn.jconn.commit()
-                    print(f"테이블 {table_name}이 생성되었습니다.")
                 
-                # 동기화 모드에 따른 처리
-                if sync_mode == "full":
-                    # 전체 동기화: 기존 데이터 삭제 후 새 데이터 삽입
-                    print("전체 동기화 전략 적용: 기존 데이터 삭제 후 새 데이터 삽입")
-                    
+                if checkpoint is not None and checkpoint.resumed:
+                    # 이전 실행이 이미 비우고 일부 적재했으므로 삭제하지 않고 이어서 적재
+                    deleted_count = 0
+                    print(f"체크포인트에서 이어서 적재: 이전 실행에서 {checkpoint.rows}행 적재됨")
+                else:
                     # 기존 데이터 삭제
                     cursor.execute(f"DELETE FROM {table_name}")
                     deleted_count = cursor.rowcount
                     print(f"기존 데이터 삭제 완료: {deleted_count}행")
+                
+                if checkpoint is not None:
+                    # 삭제와 실행 계획을 먼저 커밋하고 이후 청크마다 커밋
+                    checkpoint.begin(conn, 'informix')
+                    conn.jconn.commit()
+                
+                # 새 데이터 삽입 (청크 단위)
+                written_rows = self._insert_informix_chunks(cursor, table_name, chunks, columns, checkpoint)
+                print(f"Informix 전체 동기화 완료: 삭제 {deleted_count}행, 삽입 {written_rows}행")
+                    
+            elif sync_mode == "incremental":
+                # 증분 동기화: 새 데이터만 추가 (중복 제거)
+                print("증분 동기화 전략 적용: 새 데이터만 추가")
+                
+                if first_chunk and merge_keys:
+                    # 키 기준 업서트 (새 키는 추가, 기존 키는 갱신)
+                    print(f"업서트 키: {', '.join(merge_keys)}")
+                    if checkpoint is not None:
+                        checkpoint.begin(conn, 'informix')
+                    written_rows = self._merge_jdbc_chunks(conn, 'informix', table_name, chunks, columns, merge_keys, checkpoint)
+                    print(f"Informix 업서트 완료: {written_rows}행")
+                elif first_chunk:
+                    # 중복 제거를 위한 임시 테이블 사용
+                    temp_table = f"{table_name}_temp_{int(time.time())}"
+                    
+                    # 임시 테이블 생성
+                    cursor.execute(f"CREATE TABLE {temp_table} AS SELECT * FROM {table_name} WHERE 1=0")
                     
-                    # 새 데이터 삽입
-                    if data and len(data) > 0:
-                        self._insert_informix_data(cursor, table_name, data, columns)
-                        print(f"Informix 전체 동기화 완료: 삭제 {deleted_count}행, 삽입 {len(data)}행")
+                    # 기존 테이블과 병합 (중복 제거)
+                    if isinstance(first_chunk[0], (list, tuple)) and len(columns) > 0:
+                        # 컬럼 기반 중복 제거
+                        merge_sql = f"""
+                            INSERT INTO {table_name} ({', '.join(columns)})
+                            SELECT {', '.join(columns)} FROM {temp_table}
+                            WHERE NOT EXISTS (
+                                SELECT 1 FROM {table_name} t2 
+                                WHERE t2.{columns[0]} = {temp_table}.{columns[0]}
+                            );
+                        """
                     else:
-                        print(f"Informix 전체 동기화 완료: 삭제 {deleted_count}행, 삽입 0행")
-                        
-                elif sync_mode == "incremental":
-                    # 증분 동기화: 새 데이터만 추가 (중복 제거)
-                    print("증분 동기화 전략 적용: 새 데이터만 추가")
+                        # JSON 기반 중복 제거
+                        merge_sql = f"""
+                            INSERT INTO {table_name} (data)
+                            SELECT data FROM {temp_table}
+                            WHERE NOT EXISTS (
+                                SELECT 1 FROM {table_name} t2 
+                                WHERE t2.data = {temp_table}.data
+                            );
+                        """
                     
-                    if data and len(data) > 0:
-                        # 중복 제거를 위한 임시 테이블 사용
-                        temp_table = f"{table_name}_temp_{int(time.time())}"
-                        
-                        # 임시 테이블 생성
-                        cursor.execute(f"CREATE TABLE {temp_table} AS SELECT * FROM {table_name} WHERE 1=0")
-                        self._insert_informix_data(cursor, temp_table, data, columns)
-                        
-                        # 기존 테이블과 병합 (중복 제거)
-                        if isinstance(data[0], (list, tuple)) and len(columns) > 0:
-                            # 컬럼 기반 중복 제거
-                            merge_sql = f"""
-                                INSERT INTO {table_name} ({', '.join(columns)})
-                                SELECT {', '.join(columns)} FROM {temp_table}
-                                WHERE NOT EXISTS (
-                                    SELECT 1 FROM {table_name} t2 
-                                    WHERE t2.{columns[0]} = {temp_table}.{columns[0]}
-                                );
-                            """
-                        else:
-                            # JSON 기반 중복 제거
-                            merge_sql = f"""
-                                INSERT INTO {table_name} (data)
-                                SELECT data FROM {temp_table}
-                                WHERE NOT EXISTS (
-                                    SELECT 1 FROM {table_name} t2 
-                                    WHERE t2.data = {temp_table}.data
-                                );
-                            """
-                        
+                    if checkpoint is None:
+                        self._insert_informix_chunks(cursor, temp_table, chunks, columns)
                         cursor.execute(merge_sql)
                         inserted_count = cursor.rowcount
-                        
-                        # 임시 테이블 삭제
-                        cursor.execute(f"DROP TABLE {temp_table}")
-                        
-                        print(f"Informix 증분 동기화 완료: 추가 {inserted_count}행")
                     else:
-                        print("Informix 증분 동기화 완료: 새로운 데이터 없음")
+                        # 청크마다 임시 테이블을 거쳐 병합하고 체크포인트와 함께 커밋
+                        checkpoint.begin(conn, 'informix')
+                        inserted_count = self._merge_chunks(
+                            cursor, self._insert_informix_data, temp_table, table_name, chunks, columns, merge_sql, checkpoint
+                        )
+                    written_rows = inserted_count
                     
-                conn.jconn.commit()
-                return True, None, None
-                
-            finally:
-                # 작업 디렉토리 복원
-                os.chdir(original_cwd)
+                    # 임시 테이블 삭제
+                    cursor.execute(f"DROP TABLE {temp_table}")
+                    
+                    print(f"Informix 증분 동기화 완료: 추가 {inserted_count}행")
+                else:
+                    print("Informix 증분 동기화 완료: 새로운 데이터 없음")
+            
+            # 워터마크를 적재와 같은 트랜잭션으로 기록
+            state = sync_state() if sync_state else None
+            if state is not None:
+                write_sync_state(conn, 'informix', state[0], table_name, state[1])
+            if checkpoint is not None:
+                # 모든 청크를 적재했으므로 체크포인트 삭제 (워터마크와 함께 커밋)
+                checkpoint.finish()
+            
+            conn.jconn.commit()
+            if shadow is not None:
+                # 교체가 커밋되었으므로 기존 테이블은 별도 스레드에서 삭제
+                shadow.drop_retired_async(conf)
+            return True, None, written_rows
                 
         except Exception as e:
             import traceback
             error_msg = f"Informix 데이터베이스 저장 중 예외 발생: {e}\n{traceback.format_exc()}"
             print(error_msg)
             return False, error_msg, None
+        finally:
+            if 'conn' in locals() and conn:
+                # 풀에 반납 (커밋되지 않은 적재 트랜잭션은 반납할 때 롤백되어 잠금이 풀림)
+                conn.close()
+            if deferral is not None:
+                # 적재 연결을 반납한 뒤 삭제했던 인덱스를 다시 생성 (실패한 경우에도)
+                deferral.rebuild(conf)
+    
+    def _insert_informix_chunks(self, cursor, table_name, chunks, columns, checkpoint=None):
+        """Informix에 청크 스트림 삽입 (삽입한 총 행 수 반환, checkpoint가 있으면 청크마다 커밋)"""
+        # INSERT는 한 번만 준비하고 청크마다 배치로 바인딩
+        total_rows = 0
+        with JdbcBatchWriter(cursor.getConnection(), table_name, columns) as writer:
+            for chunk in chunks:
+                chunk_rows = writer.write(chunk)
+                total_rows += chunk_rows
+                if checkpoint is not None:
+                    checkpoint.commit_chunk(chunk_rows)
+        print(f"배치 INSERT 완료: {total_rows}행")
+        return total_rows
     
     def _insert_informix_data(self, cursor, table_name, data, columns):
-        """Informix에 데이터 삽입 (헬퍼 함수)"""
-        # 배치 처리를 위한 준비
-        batch_size = 1000
+        """Informix에 데이터 삽입 (헬퍼 함수, 준비된 INSERT를 addBatch/executeBatch로 실행)"""
         total_rows = len(data)
-        print(f"배치 처리 시작: 총 {total_rows}행, 배치 크기: {batch_size}")
-        
-        # 데이터 삽입 (배치 처리)
-        for i in range(0, total_rows, batch_size):
-            batch_data = data[i:i + batch_size]
-            print(f"배치 {i//batch_size + 1} 처리 중: {i+1}~{min(i + batch_size, total_rows)}행")
-            
-            for row in batch_data:
-                if isinstance(row, (list, tuple)):
-                    # 튜플/리스트 형태인 경우
-                    placeholders = ', '.join(['?'] * len(row))
-                    column_list = ', '.join(columns)
-                    
-                    cursor.execute(f"""
-                        INSERT INTO {table_name} ({column_list}) VALUES ({placeholders});
-                    """, list(row))
-                else:
-                    # 딕셔너리 형태인 경우
-                    row_data = json.dumps(row, ensure_ascii=False)
-                    cursor.execute(f"""
-                        INSERT INTO {table_name} (data) VALUES (?);
-                    """, (row_data,))
-            
-            print(f"배치 처리 완료: {min(i + batch_size, total_rows)}/{total_rows}")
+        if not total_rows:
+            return
+        
+        if isinstance(data, ColumnBatch) or isinstance(data[0], (list, tuple)):
+            # 튜플/리스트 형태인 경우
+            insert_columns, rows = columns, data
+        else:
+            # 딕셔너리 형태인 경우
+            insert_columns = ['data']
+            rows = [(json.dumps(row, ensure_ascii=False),) for row in data]
+        
+        with JdbcBatchWriter(cursor.getConnection(), table_name, insert_columns) as writer:
+            writer.write(rows)
+        print(f"배치 INSERT 완료: {total_rows}행")
     
     def _clear_informix_table(self, conf, table_name):
         """Informix 테이블의 모든 데이터 삭제"""
-        import jaydebeapi
-        
         try:
-            # 작업 디렉토리를 db_connection_test로 변경
-            original_cwd = os.getcwd()
-            os.chdir('/app/db_connection_test')
+            conn = connect_pooled(conf)
+            conn.autocommit = False
             
-            try:
-                url = f"jdbc:informix-sqli://{conf['host']}:{conf['port']}/{conf['database']}:NEWCODESET=EUC-KR,cp1252,819"
-                jar = "/app/db_connection_test/ifxjdbc.jar"
-                
-                conn = jaydebeapi.connect(
-                    "com.informix.jdbc.IfxDriver",
-                    url,
-                    [conf['user'], conf['password']],
-                    jar
-                )
-                conn.autocommit = False
-                
-                cursor = conn.jconn.createStatement()
-                
-                # 테이블 존재 여부 확인
-                cursor.execute(f"""
-                    SELECT COUNT(*) FROM sysmaster:sys_tables WHERE tabname = '{table_name}'
-                """)
-                table_exists = cursor.fetchone()[0] > 0
-                
-                if table_exists:
-                    cursor.execute(f"DELETE FROM {table_name}")
-                    deleted_count = cursor.rowcount
-                    conn.jconn.commit()
-                    print(f"Informix 테이블 {table_name} 데이터 삭제 완료: {deleted_count}행")
-                else:
-                    print(f"Informix 테이블 {table_name}이 존재하지 않습니다.")
-                
-                return True
-                
-            finally:
-                # 작업 디렉토리 복원
-                os.chdir(original_cwd)
+            cursor = conn.jconn.createStatement()
+            
+            # 테이블 존재 여부 확인
+            cursor.execute(f"""
+                SELECT COUNT(*) FROM sysmaster:sys_tables WHERE tabname = '{table_name}'
+            """)
+            table_exists = cursor.fetchone()[0] > 0
+            
+            if table_exists:
+                cursor.execute(f"DELETE FROM {table_name}")
+                deleted_count = cursor.rowcount
+                conn.jconn.commit()
+                print(f"Informix 테이블 {table_name} 데이터 삭제 완료: {deleted_count}행")
+            else:
+                print(f"Informix 테이블 {table_name}이 존재하지 않습니다.")
+            
+            return True
                 
         except Exception as e:
             print(f"Informix 테이블 삭제 중 오류: {e}")
             return False
+        finally:
+            if 'conn' in locals() and conn:
+                conn.close()
 
 # 라우트
 @app.context_processor
@@ -2166,7 +3972,9 @@ def add_server():
             port=int(data['port']),
             database=data['database'],
             user=data['user'],
-            password=data['password']
+            password=data['password'],
+            pool_min_size=int(data['pool_min_size']) if data.get('pool_min_size') else None,
+            pool_max_size=int(data['pool_max_size']) if data.get('pool_max_size') else None
         )
         
         db.session.add(server)
@@ -2196,6 +4004,8 @@ def edit_server(server_id):
         server.database = data['database']
         server.user = data['user']
         server.password = data['password']
+        server.pool_min_size = int(data['pool_min_size']) if data.get('pool_min_size') else None
+        server.pool_max_size = int(data['pool_max_size']) if data.get('pool_max_size') else None
         
         db.session.commit()
         
@@ -2234,45 +4044,33 @@ def execute_query():
     data = request.json
     
     try:
-        # 설정 파일 동기화
-        config_manager = ConfigManager()
-        config_manager.sync_from_database()
+        # 쿼리 실행 (원래 db_query.py의 execute_query 사용)
+        start_time = time.time()
+        result, success, error = db_execute_query(data['server'], data['query'])
+        end_time = time.time()
         
-        # 작업 디렉토리를 db_connection_test로 변경
-        original_cwd = os.getcwd()
-        os.chdir('/app/db_connection_test')
+        if not success:
+            raise Exception(f"쿼리 실행 실패: {error}")
         
-        try:
-            # 쿼리 실행 (원래 db_query.py의 execute_query 사용)
-            start_time = time.time()
-            result, success, error = db_execute_query(data['server'], data['query'])
-            end_time = time.time()
-            
-            if not success:
-                raise Exception(f"쿼리 실행 실패: {error}")
-            
-            # 히스토리 저장
-            history = QueryHistory(
-                server_name=data['server'],
-                query=data['query'],
-                result_count=len(result) if result else 0,
-                execution_time=end_time - start_time,
-                status='success'
-            )
-            db.session.add(history)
-            db.session.commit()
-            
-            return jsonify({
-                'success': True,
-                'result': {
-                    'columns': [],  # 원래 execute_query는 컬럼명을 반환하지 않음
-                    'rows': result,
-                    'row_count': len(result) if result else 0
-                }
-            })
-        finally:
-            # 작업 디렉토리 복원
-            os.chdir(original_cwd)
+        # 히스토리 저장
+        history = QueryHistory(
+            server_name=data['server'],
+            query=data['query'],
+            result_count=len(result) if result else 0,
+            execution_time=end_time - start_time,
+            status='success'
+        )
+        db.session.add(history)
+        db.session.commit()
+        
+        return jsonify({
+            'success': True,
+            'result': {
+                'columns': [],  # 원래 execute_query는 컬럼명을 반환하지 않음
+                'rows': result,
+                'row_count': len(result) if result else 0
+            }
+        })
         
     except Exception as e:
         # 에러 히스토리 저장
@@ -2311,6 +4109,16 @@ def add_job():
             target_table=data['target_table'],
             chunk_size=int(data['chunk_size']),
             num_workers=int(data['num_workers']),
+            fetch_size=int(data['fetch_size']) if data.get('fetch_size') else None,
+            partition_column=data.get('partition_column', '').strip() or None,
+            partition_method=data.get('partition_method', 'range'),
+            hash_filter_mode=data.get('hash_filter_mode', 'memory'),
+            checkpoint_enabled='checkpoint_enabled' in data,
+            full_sync_method=data.get('full_sync_method', 'delete'),
+            pg_fast_load='pg_fast_load' in data,
+            merge_key_columns=data.get('merge_key_columns', '').strip() or None,
+            reconcile_deletes='reconcile_deletes' in data,
+            reconcile_interval_hours=int(data['reconcile_interval_hours']) if data.get('reconcile_interval_hours') else None,
             is_active='is_active' in data,
             # 증분 동기화 관련 필드 추가
             incremental_sync='incremental_sync' in data,
@@ -2319,6 +4127,12 @@ def add_job():
             sync_strategy=data.get('sync_strategy', 'timestamp')
         )
         
+        error = validate_job_config(job)
+        if error:
+            flash(error, 'error')
+            servers = db.session.query(ServerConfig).all()
+            return render_template('add_job.html', servers=servers)
+        
         db.session.add(job)
         db.session.commit()
         
@@ -2346,16 +4160,48 @@ def edit_job(job_id):
         job.target_table = data['target_table']
         job.chunk_size = int(data['chunk_size'])
         job.num_workers = int(data['num_workers'])
+        job.fetch_size = int(data['fetch_size']) if data.get('fetch_size') else None
+        job.partition_column = data.get('partition_column', '').strip() or None
+        job.partition_method = data.get('partition_method', 'range')
+        job.hash_filter_mode = data.get('hash_filter_mode', 'memory')
+        job.checkpoint_enabled = 'checkpoint_enabled' in data
+        job.full_sync_method = data.get('full_sync_method', 'delete')
+        job.pg_fast_load = 'pg_fast_load' in data
+        job.merge_key_columns = data.get('merge_key_columns', '').strip() or None
+        job.reconcile_deletes = 'reconcile_deletes' in data
+        job.reconcile_interval_hours = int(data['reconcile_interval_hours']) if data.get('reconcile_interval_hours') else None
         job.is_active = 'is_active' in data
         
         # 증분 동기화 관련 필드 추가
         job.incremental_sync = 'incremental_sync' in data
         job.sync_key_column = data.get('sync_key_column', '')
+        previous_sync_value = job.last_sync_value
         job.last_sync_value = data.get('last_sync_value', '')
         job.sync_strategy = data.get('sync_strategy', 'timestamp')
         
+        error = validate_job_config(job)
+        if error:
+            # 변경 내용을 버리고 다시 수정 화면으로
+            db.session.rollback()
+            flash(error, 'error')
+            servers = db.session.query(ServerConfig).all()
+            return render_template('edit_job.html', job=job, servers=servers)
+        
         db.session.commit()
         
+        # 마지막 동기화 값을 직접 바꾼 경우 타겟에 기록된 워터마크도 변경 (다음 실행의 기준값)
+        if (job.incremental_sync and job.sync_strategy in ('timestamp', 'sequence')
+                and (job.last_sync_value or '') != (previous_sync_value or '')):
+            key_columns = parse_sync_key_columns(job.sync_key_column)
+            values = decode_watermark(job.last_sync_value, key_columns, job.sync_strategy)
+            job.sync_watermark = encode_watermark(key_columns, values) if values else None
+            db.session.commit()
+            try:
+                store_sync_state(get_server_config(job.target_server), job.id, job.target_table,
+                                 job.sync_watermark)
+            except Exception as e:
+                flash(f'타겟의 워터마크를 변경하지 못했습니다: {e}', 'warning')
+        
         flash('배치 작업이 수정되었습니다.', 'success')
         return redirect(url_for('jobs'))
     
@@ -2372,6 +4218,9 @@ def delete_job(job_id):
     db.session.delete(job)
     db.session.commit()
     
+    # 작업별 해시 인덱스 파일 삭제
+    JobHashIndex.for_job(job_id).delete()
+    
     flash('배치 작업이 삭제되었습니다.', 'success')
     return redirect(url_for('jobs'))
 
@@ -2392,6 +4241,23 @@ def execute_job(job_id):
     
     return redirect(url_for('jobs'))
 
+@app.route('/jobs/<int:job_id>/reconcile', methods=['POST'])
+def reconcile_job(job_id):
+    """배치 작업의 삭제 반영 실행"""
+    job = db.session.get(BatchJob, job_id)
+    if not job:
+        abort(404)
+    
+    executor = BatchExecutor()
+    success, result = executor.reconcile_job(job_id)
+    
+    if success:
+        flash(f'삭제 반영이 완료되었습니다. ({result}행 삭제)', 'success')
+    else:
+        flash(f'삭제 반영 중 오류가 발생했습니다: {result}', 'error')
+    
+    return redirect(url_for('jobs'))
+
 @app.route('/schedules')
 def schedules():
     """스케줄 관리 페이지"""
@@ -2675,60 +4541,48 @@ def test_connection(server_name):
             encoding='utf-8'
         )
         
-        # 설정 파일 동기화
-        config_manager = ConfigManager()
-        config_manager.sync_from_database()
-        
         # 연결 테스트 (원래 db_query.py의 함수들 사용)
         logging.info(f"=== {server_name} 연결 테스트 시작 ===")
         
-        # 작업 디렉토리를 db_connection_test로 변경
-        original_cwd = os.getcwd()
-        os.chdir('/app/db_connection_test')
+        conf = get_server_config(server_name)
+        db_type = conf['type']
         
-        try:
-            conf = get_server_config(server_name)
-            db_type = conf['type']
-            
-            logging.info(f"서버 정보: {db_type}://{conf['host']}:{conf['port']}/{conf['database']}")
-            
-            # 간단한 테스트 쿼리
-            if db_type == 'postgresql':
-                test_query = "SELECT 1 as test"
-            elif db_type == 'altibase':
-                test_query = "SELECT 1 FROM DUAL"
-            elif db_type == 'informix':
-                test_query = "SELECT 1 FROM DUAL" # Informix는 간단한 쿼리로 테스트
-            else:
-                test_query = "SELECT 1 FROM DUAL" # 기본 쿼리
-            
-            logging.info(f"테스트 쿼리: {test_query}")
-            
-            if db_type == 'altibase':
-                result, success, error = test_altibase_connection(conf, test_query)
-            elif db_type == 'informix':
-                result, success, error = test_informix_connection(conf, test_query)
-            else:
-                result, success, error = db_execute_query(server_name, test_query)
-            
-            if success:
-                logging.info(f"✅ {server_name} ({db_type}) 연결 성공")
-                logging.info(f"테스트 결과: {result}")
-                return jsonify({
-                    "success": True,
-                    "message": f"{db_type} 연결 성공",
-                    "test_result": result
-                })
-            else:
-                logging.error(f"❌ {server_name} ({db_type}) 연결 실패")
-                logging.error(f"오류: {error}")
-                return jsonify({
-                    "success": False,
-                    "error": error
-                })
-        finally:
-            # 작업 디렉토리 복원
-            os.chdir(original_cwd)
+        logging.info(f"서버 정보: {db_type}://{conf['host']}:{conf['port']}/{conf['database']}")
+        
+        # 간단한 테스트 쿼리
+        if db_type == 'postgresql':
+            test_query = "SELECT 1 as test"
+        elif db_type == 'altibase':
+            test_query = "SELECT 1 FROM DUAL"
+        elif db_type == 'informix':
+            test_query = "SELECT 1 FROM DUAL" # Informix는 간단한 쿼리로 테스트
+        else:
+            test_query = "SELECT 1 FROM DUAL" # 기본 쿼리
+        
+        logging.info(f"테스트 쿼리: {test_query}")
+        
+        if db_type == 'altibase':
+            result, success, error = test_altibase_connection(conf, test_query)
+        elif db_type == 'informix':
+            result, success, error = test_informix_connection(conf, test_query)
+        else:
+            result, success, error = db_execute_query(server_name, test_query)
+        
+        if success:
+            logging.info(f"✅ {server_name} ({db_type}) 연결 성공")
+            logging.info(f"테스트 결과: {result}")
+            return jsonify({
+                "success": True,
+                "message": f"{db_type} 연결 성공",
+                "test_result": result
+            })
+        else:
+            logging.error(f"❌ {server_name} ({db_type}) 연결 실패")
+            logging.error(f"오류: {error}")
+            return jsonify({
+                "success": False,
+                "error": error
+            })
         
     except Exception as e:
         logging.error(f"❌ {server_name} 연결 테스트 중 예외 발생: {str(e)}")
@@ -2749,6 +4603,9 @@ def api_logs():
             'status': log.status,
             'total_rows': log.total_rows,
             'duration_seconds': log.duration_seconds,
+            'extract_seconds': log.extract_seconds,
+            'transform_seconds': log.transform_seconds,
+            'load_seconds': log.load_seconds,
             'started_at': format_kst_time(log.started_at) if log.started_at else None,
             'completed_at': format_kst_time(log.completed_at) if log.completed_at else None,
             'error_message': log.error_message
@@ -2792,6 +4649,16 @@ def diagnose_jar(jar_name):
         'error': 'JAR 진단 기능은 원래 db_query.py에 없데 기능입니다.'
     })
 
+@app.route('/api/jvm-status')
+def api_jvm_status():
+    """JVM 상태 API (준비 여부, 클래스패스, 기동 시간)"""
+    return jsonify(jvm_status())
+
+@app.route('/api/pool-status')
+def api_pool_status():
+    """서버별 연결 풀 상태 API (유휴/사용 중 연결 수)"""
+    return jsonify(pool_status())
+
 @app.route('/api/scheduler-status')
 def api_scheduler_status():
     """스케줄러 상태 확인 API"""
@@ -3022,6 +4889,25 @@ def restore_schedules_from_database():
         db.session.rollback()
         return 0, 0
 
+def ensure_model_columns():
+    """기존 테이블에 모델에 새로 추가된 컬럼 반영 (db.create_all은 컬럼을 추가하지 않음)"""
+    from sqlalchemy import inspect, text
+    
+    inspector = inspect(db.engine)
+    for table in db.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        
+        existing_columns = {column['name'] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing_columns:
+                continue
+            
+            column_type = column.type.compile(dialect=db.engine.dialect)
+            with db.engine.begin() as conn:
+                conn.execute(text(f'ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}'))
+            print(f"✅ 컬럼 추가: {table.name}.{column.name} ({column_type})")
+
 # 초기화 함수
 def init_app():
     """애플리케이션 초기화"""
@@ -3029,6 +4915,9 @@ def init_app():
         # 데이터베이스 생성
         db.create_all()
         
+        # 기존 테이블에 새 컬럼 추가
+        ensure_model_columns()
+        
         # 설정 파일에서 데이터베이스로 동기화
         config_manager = ConfigManager()
         config_manager.sync_to_database()
@@ -3047,6 +4936,9 @@ def init_app():
             db.session.add(local_server)
             db.session.commit()
         
+        # 데이터베이스의 서버 설정으로 설정 파일과 메모리 레지스트리 갱신
+        config_manager.sync_from_database()
+        
         # 데이터베이스의 활성 스케줄을 스케줄러에 복원
         try:
             print("🔄 데이터베이스에서 스케줄 복원 중...")
@@ -3085,6 +4977,9 @@ def main():
     print(f"📍 서버 주소: http://{args.host}:{args.port}")
     print(f"🗄️ 데이터베이스: {database_url}")
     
+    # JVM 백그라운드 시작 (첫 Informix/Altibase 쿼리가 JVM 기동 시간을 기다리지 않도록)
+    start_jvm_async()
+    
     # PostgreSQL 연결 대기
     if not wait_for_postgres():
         print("❌ PostgreSQL 연결 실패로 애플리케이션을 종료합니다.")
@@ -6,6 +6,43 @@ Database Connection Test Module
 
 # 원래 db_query.py의 함수들을 직접 import
 from .db_query import get_server_config, connect_informix, connect_altibase, connect_postgresql, execute_query
+from .jdbc_fetch import DEFAULT_FETCH_SIZE, JdbcBlockReader, create_fetch_statement, open_block_reader
+from .converters import build_column_converters, convert_java_value, register_type_converter, set_statement_params
+from .pipeline import ChunkPipeline, DEFAULT_QUEUE_SIZE
+from .batch import ColumnBatch
+from .jvm import (connect_jdbc, discover_driver_jars, is_jvm_ready, jvm_status, start_jvm, start_jvm_async,
+                  wait_for_jvm)
+from .pool import (ConnectionPool, PoolTimeoutError, close_all_pools, connect_pooled, get_pool, pool_status,
+                   pooled_connection)
+from .registry import ServerRegistry, make_server_conf, server_registry
+from .fingerprint import encode_value, fingerprint_columns, fingerprint_row, fingerprint_rows
+from .hash_index import JobHashIndex
+from .diff import ChangeSet, merge_diff
+from .range_checksum import RANGE_CHECKSUM_DB_TYPES, RangeChecksumIndex, bucket_query, row_checksum_sql
+from .jdbc_batch import JdbcBatchWriter
+from .shadow_table import SWAP_DB_TYPES, ShadowTable, drop_table, suffixed_name
+from .table_indexes import (ANALYZE_MIN_ROWS, INDEX_DEFER_MIN_ROWS, IndexDeferral, ensure_unique_key_index,
+                            find_duplicate_key, find_index, index_create_sql, list_indexes,
+                            restore_deferred_indexes, unique_key_index, update_statistics)
+from .pg_copy import COPY_FORMATS, CopyLoader, CopyStream, copy_rows, encode_binary, encode_csv, text_value
 
-__all__ = ['get_server_config', 'connect_informix', 'connect_altibase', 'connect_postgresql', 'execute_query']
+__all__ = ['get_server_config', 'connect_informix', 'connect_altibase', 'connect_postgresql', 'execute_query',
+           'DEFAULT_FETCH_SIZE', 'JdbcBlockReader', 'create_fetch_statement', 'open_block_reader',
+           'build_column_converters', 'convert_java_value', 'register_type_converter', 'set_statement_params',
+           'ChunkPipeline', 'DEFAULT_QUEUE_SIZE', 'ColumnBatch',
+           'connect_jdbc', 'discover_driver_jars', 'is_jvm_ready', 'jvm_status', 'start_jvm', 'start_jvm_async',
+           'wait_for_jvm',
+           'ConnectionPool', 'PoolTimeoutError', 'close_all_pools', 'connect_pooled', 'get_pool', 'pool_status',
+           'pooled_connection',
+           'ServerRegistry', 'make_server_conf', 'server_registry',
+           'encode_value', 'fingerprint_columns', 'fingerprint_row', 'fingerprint_rows',
+           'JobHashIndex',
+           'ChangeSet', 'merge_diff',
+           'RANGE_CHECKSUM_DB_TYPES', 'RangeChecksumIndex', 'bucket_query', 'row_checksum_sql',
+           'JdbcBatchWriter',
+           'SWAP_DB_TYPES', 'ShadowTable', 'drop_table', 'suffixed_name',
+           'ANALYZE_MIN_ROWS', 'INDEX_DEFER_MIN_ROWS', 'IndexDeferral', 'ensure_unique_key_index',
+           'find_duplicate_key', 'find_index', 'index_create_sql', 'list_indexes',
+           'restore_deferred_indexes', 'unique_key_index', 'update_statistics',
+           'COPY_FORMATS', 'CopyLoader', 'CopyStream', 'copy_rows', 'encode_binary', 'encode_csv', 'text_value']
 __version__ = '1.0.0' 
\ No newline at end of file
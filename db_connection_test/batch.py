@@ -0,0 +1,82 @@
+"""
+컬럼 배치 모듈
+
+추출 -> 변환 -> 적재 단계 사이에서 주고받는 컬럼 단위(columnar) 배치를 제공합니다.
+값은 컬럼별 리스트로 보관하고, 행이 필요한 곳(INSERT 등)에서만 zip으로 튜플을 만듭니다.
+행 리스트와 같은 방식(len, 인덱스, 슬라이스, 반복)으로도 사용할 수 있습니다.
+"""
+
+from itertools import compress
+
+class ColumnBatch:
+    """컬럼별 값 리스트로 구성된 배치"""
+    
+    __slots__ = ('names', 'columns', 'num_rows')
+    
+    def __init__(self, names, columns, num_rows=None):
+        """
+        Args:
+            names: 컬럼명 목록
+            columns: 컬럼별 값 리스트 (names와 같은 순서)
+            num_rows: 행 수 (None이면 첫 컬럼 길이)
+        """
+        self.names = list(names)
+        self.columns = columns
+        if num_rows is None:
+            num_rows = len(columns[0]) if columns else 0
+        self.num_rows = num_rows
+    
+    @classmethod
+    def from_rows(cls, names, rows):
+        """행(튜플) 리스트를 컬럼 배치로 변환"""
+        if not rows:
+            return cls(names, [[] for _ in names], 0)
+        return cls(names, [list(column) for column in zip(*rows)], len(rows))
+    
+    def __len__(self):
+        return self.num_rows
+    
+    def __bool__(self):
+        return self.num_rows > 0
+    
+    def __iter__(self):
+        """행 튜플을 차례로 반환"""
+        return zip(*self.columns)
+    
+    def __getitem__(self, index):
+        """정수 인덱스는 행 튜플, 슬라이스는 같은 컬럼 구성의 배치 반환"""
+        if isinstance(index, slice):
+            columns = [column[index] for column in self.columns]
+            return ColumnBatch(self.names, columns, len(range(*index.indices(self.num_rows))))
+        return tuple(column[index] for column in self.columns)
+    
+    def __repr__(self):
+        return f"ColumnBatch(columns={self.names}, rows={self.num_rows})"
+    
+    def rows(self):
+        """행 튜플 리스트로 변환"""
+        return list(zip(*self.columns))
+    
+    def column(self, key):
+        """컬럼명 또는 위치로 컬럼 값 리스트 조회"""
+        if isinstance(key, int):
+            return self.columns[key]
+        return self.columns[self.names.index(key)]
+    
+    def prepend_column(self, name, values):
+        """맨 앞에 컬럼을 추가한 새 배치 반환 (기존 컬럼 리스트는 복사하지 않음)"""
+        return ColumnBatch([name] + self.names, [list(values)] + self.columns, self.num_rows)
+    
+    def filter(self, mask):
+        """mask가 참인 행만 남긴 새 배치 반환"""
+        mask = list(mask)
+        columns = [list(compress(column, mask)) for column in self.columns]
+        return ColumnBatch(self.names, columns, sum(1 for keep in mask if keep))
+    
+    def to_arrow(self):
+        """pyarrow RecordBatch로 변환 (pyarrow가 설치된 경우에만 사용 가능)"""
+        try:
+            import pyarrow
+        except ImportError:
+            raise ImportError("to_arrow()를 사용하려면 pyarrow를 설치하세요: pip install pyarrow")
+        return pyarrow.RecordBatch.from_arrays([pyarrow.array(column) for column in self.columns], names=self.names)
@@ -0,0 +1,258 @@
+"""
+JDBC 값 변환 모듈
+
+ResultSetMetaData.getColumnType()을 쿼리마다 한 번 읽어 컬럼별 변환 함수를 미리 만들어 둡니다.
+값마다 타입을 추측하지 않으므로 변환 비용은 함수 호출 한 번이며, NUMERIC은 Decimal로 정밀도를 유지합니다.
+"""
+
+from datetime import date, datetime, time
+from decimal import Decimal
+
+# java.sql.Types 상수
+BIT = -7
+TINYINT = -6
+SMALLINT = 5
+INTEGER = 4
+BIGINT = -5
+FLOAT = 6
+REAL = 7
+DOUBLE = 8
+NUMERIC = 2
+DECIMAL = 3
+CHAR = 1
+VARCHAR = 12
+LONGVARCHAR = -1
+NCHAR = -15
+NVARCHAR = -9
+LONGNVARCHAR = -16
+DATE = 91
+TIME = 92
+TIMESTAMP = 93
+TIMESTAMP_WITH_TIMEZONE = 2014
+BINARY = -2
+VARBINARY = -3
+LONGVARBINARY = -4
+BLOB = 2004
+CLOB = 2005
+NCLOB = 2011
+BOOLEAN = 16
+
+def _to_int(value):
+    if value is None:
+        return None
+    return int(value)
+
+def _to_float(value):
+    if value is None:
+        return None
+    return float(value)
+
+def _to_str(value):
+    if value is None:
+        return None
+    return str(value)
+
+def _to_bool(value):
+    if value is None:
+        return None
+    return bool(value)
+
+def _bigdecimal_to_int(value):
+    if value is None:
+        return None
+    return int(str(value.toPlainString()))
+
+def _bigdecimal_to_decimal(value):
+    if value is None:
+        return None
+    return Decimal(str(value.toPlainString()))
+
+def _bigdecimal_to_number(value):
+    """스케일을 알 수 없는 NUMERIC (정수면 int, 아니면 Decimal)"""
+    if value is None:
+        return None
+    text = str(value.toPlainString())
+    if '.' in text:
+        return Decimal(text)
+    return int(text)
+
+def _java_date_to_date(value):
+    if value is None:
+        return None
+    return date.fromisoformat(str(value))
+
+def _java_time_to_time(value):
+    if value is None:
+        return None
+    return time.fromisoformat(str(value))
+
+def _parse_timestamp(text):
+    """java.sql.Timestamp.toString() 결과(yyyy-mm-dd hh:mm:ss.fffffffff) 파싱"""
+    if '.' in text:
+        base, fraction = text.split('.', 1)
+        micro = int((fraction + '000000')[:6])
+    else:
+        base, micro = text, 0
+    return datetime.strptime(base, '%Y-%m-%d %H:%M:%S').replace(microsecond=micro)
+
+def _java_timestamp_to_datetime(value):
+    if value is None:
+        return None
+    return _parse_timestamp(str(value))
+
+def _java_bytes_to_bytes(value):
+    if value is None:
+        return None
+    return bytes(value)
+
+def _java_blob_to_bytes(value):
+    if value is None:
+        return None
+    return bytes(value.getBytes(1, int(value.length())))
+
+def _java_clob_to_str(value):
+    if value is None:
+        return None
+    return str(value.getSubString(1, int(value.length())))
+
+# Java 클래스명 -> 변환 함수 (타입 정보가 없을 때 사용)
+_JAVA_CLASS_CONVERTERS = {
+    'java.lang.String': _to_str,
+    'java.lang.Integer': _to_int,
+    'java.lang.Long': _to_int,
+    'java.lang.Short': _to_int,
+    'java.lang.Byte': _to_int,
+    'java.math.BigInteger': _to_int,
+    'java.lang.Double': _to_float,
+    'java.lang.Float': _to_float,
+    'java.lang.Boolean': _to_bool,
+    'java.math.BigDecimal': _bigdecimal_to_number,
+    'java.sql.Date': _java_date_to_date,
+    'java.sql.Time': _java_time_to_time,
+    'java.sql.Timestamp': _java_timestamp_to_datetime,
+    '[B': _java_bytes_to_bytes,
+}
+
+# 파이썬 타입별 변환 함수 캐시 (값의 타입마다 한 번만 결정)
+_converter_cache = {}
+
+def _identity(value):
+    return value
+
+def _resolve_converter(value_type, value):
+    """값의 타입에 맞는 변환 함수 결정"""
+    if value_type in (int, float, str, bool, bytes, Decimal, date, datetime, time):
+        return _identity
+    
+    try:
+        class_name = str(value.getClass().getName())
+    except Exception:
+        return _identity
+    
+    converter = _JAVA_CLASS_CONVERTERS.get(class_name)
+    if converter is not None:
+        return converter
+    if hasattr(value, 'getSubString'):
+        return _java_clob_to_str
+    if hasattr(value, 'getBytes') and hasattr(value, 'length'):
+        return _java_blob_to_bytes
+    return _to_str
+
+def convert_java_value(value):
+    """컬럼 타입 정보 없이 단일 Java 값을 Python 값으로 변환 (타입별 캐시 사용)"""
+    if value is None:
+        return None
+    
+    value_type = type(value)
+    converter = _converter_cache.get(value_type)
+    if converter is None:
+        converter = _resolve_converter(value_type, value)
+        _converter_cache[value_type] = converter
+    return converter(value)
+
+def _numeric_converter(precision, scale):
+    """NUMERIC/DECIMAL 컬럼 변환 함수 선택"""
+    if scale == 0 and 0 < precision <= 38:
+        return _bigdecimal_to_int
+    if scale > 0:
+        return _bigdecimal_to_decimal
+    # 정밀도/스케일이 지정되지 않은 NUMBER 등
+    return _bigdecimal_to_number
+
+# java.sql.Types -> 변환 함수
+TYPE_CONVERTERS = {
+    BIT: _to_bool,
+    BOOLEAN: _to_bool,
+    TINYINT: _to_int,
+    SMALLINT: _to_int,
+    INTEGER: _to_int,
+    BIGINT: _to_int,
+    FLOAT: _to_float,
+    REAL: _to_float,
+    DOUBLE: _to_float,
+    CHAR: _to_str,
+    VARCHAR: _to_str,
+    LONGVARCHAR: _to_str,
+    NCHAR: _to_str,
+    NVARCHAR: _to_str,
+    LONGNVARCHAR: _to_str,
+    DATE: _java_date_to_date,
+    TIME: _java_time_to_time,
+    TIMESTAMP: _java_timestamp_to_datetime,
+    BINARY: _java_bytes_to_bytes,
+    VARBINARY: _java_bytes_to_bytes,
+    LONGVARBINARY: _java_bytes_to_bytes,
+    BLOB: _java_blob_to_bytes,
+    CLOB: _java_clob_to_str,
+    NCLOB: _java_clob_to_str,
+}
+
+def register_type_converter(sql_type, converter):
+    """java.sql.Types 코드에 대한 변환 함수 등록 (드라이버별 타입 코드 대응용)"""
+    TYPE_CONVERTERS[sql_type] = converter
+
+def build_column_converter(sql_type, precision=0, scale=0):
+    """단일 컬럼의 변환 함수 생성"""
+    if sql_type in (NUMERIC, DECIMAL):
+        return _numeric_converter(precision, scale)
+    return TYPE_CONVERTERS.get(sql_type, convert_java_value)
+
+def build_column_converters(meta_data):
+    """ResultSetMetaData에서 컬럼별 변환 함수 목록 생성 (쿼리당 한 번 호출)"""
+    converters = []
+    for i in range(1, meta_data.getColumnCount() + 1):
+        sql_type = int(meta_data.getColumnType(i))
+        try:
+            precision = int(meta_data.getPrecision(i))
+            scale = int(meta_data.getScale(i))
+        except Exception:
+            precision, scale = 0, -1
+        converters.append(build_column_converter(sql_type, precision, scale))
+    return converters
+
+def set_statement_params(prep_stmt, params):
+    """PreparedStatement에 Python 값을 타입에 맞는 setter로 바인딩 (None은 setNull)"""
+    import jpype
+    
+    for index, value in enumerate(params or (), 1):
+        if value is None:
+            prep_stmt.setNull(index, jpype.JClass('java.sql.Types').NULL)
+        elif isinstance(value, bool):
+            prep_stmt.setBoolean(index, value)
+        elif isinstance(value, int):
+            prep_stmt.setLong(index, value)
+        elif isinstance(value, float):
+            prep_stmt.setDouble(index, value)
+        elif isinstance(value, Decimal):
+            prep_stmt.setBigDecimal(index, jpype.JClass('java.math.BigDecimal')(str(value)))
+        elif isinstance(value, datetime):
+            prep_stmt.setTimestamp(index, jpype.JClass('java.sql.Timestamp').valueOf(value.strftime('%Y-%m-%d %H:%M:%S.%f')))
+        elif isinstance(value, date):
+            prep_stmt.setDate(index, jpype.JClass('java.sql.Date').valueOf(value.isoformat()))
+        elif isinstance(value, time):
+            prep_stmt.setTime(index, jpype.JClass('java.sql.Time').valueOf(value.strftime('%H:%M:%S')))
+        elif isinstance(value, (bytes, bytearray)):
+            prep_stmt.setBytes(index, jpype.JArray(jpype.JByte)(bytes(value)))
+        else:
+            prep_stmt.setString(index, str(value))
+
@@ -1,30 +1,31 @@
-import jaydebeapi
 import psycopg2
 import configparser
 import sys
 
+try:
+    from .converters import convert_java_value
+    from .jdbc_fetch import open_block_reader
+    from .jvm import connect_jdbc
+    from .pool import connect_pooled
+    from .registry import server_registry
+except ImportError:
+    # 스크립트로 직접 실행하는 경우
+    from converters import convert_java_value
+    from jdbc_fetch import open_block_reader
+    from jvm import connect_jdbc
+    from pool import connect_pooled
+    from registry import server_registry
+
 def get_server_config(server_name):
-    """서버 설정 정보 가져오기"""
-    config = configparser.ConfigParser()
-    config.read('db_servers.ini')
-    if server_name not in config:
-        raise Exception(f"서버 '{server_name}' 설정이 없습니다.")
-    section = config[server_name]
-    return {
-        "type": section["type"],
-        "host": section["host"],
-        "port": section["port"],
-        "database": section["database"],
-        "user": section["user"],
-        "password": section["password"]
-    }
+    """서버 설정 정보 가져오기 (메모리 레지스트리에서 조회, 작업 디렉토리와 무관)"""
+    return server_registry.get(server_name)
 
 def connect_informix(conf):
     """Informix 데이터베이스 연결"""
     url = f"jdbc:informix-sqli://{conf['host']}:{conf['port']}/{conf['database']}:NEWCODESET=EUC-KR,cp1252,819"
     driver = "com.informix.jdbc.IfxDriver"
     jar = "ifxjdbc.jar"
-    return jaydebeapi.connect(driver, url, [conf['user'], conf['password']], jar)
+    return connect_jdbc(driver, url, [conf['user'], conf['password']], jar)
 
 def connect_altibase(conf):
     """Altibase 데이터베이스 연결"""
@@ -32,7 +33,7 @@ def connect_altibase(conf):
     url = f"jdbc:Altibase://{conf['host']}:{conf['port']}/{conf['database']}"
     jar = "Altibase.jar"
     
-    conn = jaydebeapi.connect(driver, url, [conf['user'], conf['password']], jar)
+    conn = connect_jdbc(driver, url, [conf['user'], conf['password']], jar)
     conn.autocommit = False
     return conn
 
@@ -42,96 +43,54 @@ def connect_postgresql(conf):
     return psycopg2.connect(conn_string)
 
 def convert_java_to_python(value):
-    """Java 객체를 Python 객체로 변환"""
-    if value is None:
-        return None
-    
-    # java.math.BigDecimal -> Python float/int
-    if hasattr(value, 'doubleValue'):
-        try:
-            str_val = str(value)
-            if '.' in str_val:
-                double_val = value.doubleValue()
-                return int(double_val) if double_val.is_integer() else double_val
-            else:
-                return int(str_val)
-        except:
-            return float(str(value))
-    
-    # java.lang.String -> Python str
-    elif hasattr(value, 'toString'):
-        return str(value)
-    
-    # java.lang.Integer/Long -> Python int
-    elif hasattr(value, 'intValue'):
-        return int(value)
-    elif hasattr(value, 'longValue'):
-        return int(value)
-    
-    # PostgreSQL Decimal -> Python float
-    elif str(type(value)).startswith("<class 'decimal.Decimal'>"):
-        return float(value)
-    
-    # 기타 Java 객체는 문자열로 변환
-    elif str(type(value)).startswith("<java object"):
-        return str(value)
-    
-    return value
+    """Java 객체를 Python 객체로 변환 (컬럼 타입 정보가 없을 때 사용)"""
+    return convert_java_value(value)
 
-def execute_query(server_name, query):
+def execute_query(server_name, query, fetch_size=None):
     """서버에 연결하여 쿼리 실행"""
     conf = get_server_config(server_name)
     db_type = conf['type']
     
     try:
-        # 데이터베이스 연결
-        if db_type == 'informix':
-            conn = connect_informix(conf)
-        elif db_type == 'altibase':
-            conn = connect_altibase(conf)
-        elif db_type == 'postgresql':
-            conn = connect_postgresql(conf)
+        # 데이터베이스 연결 (서버별 연결 풀에서 빌리고 close()로 반납)
+        if db_type in ('informix', 'altibase', 'postgresql'):
+            conn = connect_pooled(conf)
         else:
             return None, False, f"지원하지 않는 데이터베이스 타입: {db_type}"
         
-        # Altibase의 경우 Java 레벨에서 직접 접근
-        if db_type == 'altibase':
+        # Altibase/Informix의 경우 Java 레벨에서 블록 단위로 직접 접근
+        if db_type in ('altibase', 'informix'):
+            java_stmt = None
             try:
-                java_conn = conn.jconn
-                java_stmt = java_conn.createStatement()
-                java_stmt.setQueryTimeout(30)
-                java_result_set = java_stmt.executeQuery(query)
+                java_stmt, reader = open_block_reader(conn.jconn, query, fetch_size, convert=True)
                 
-                # 결과 가져오기
+                # 결과 가져오기 (메타데이터와 컬럼별 변환 함수는 리더 생성 시 한 번만 준비)
                 rows = []
-                while java_result_set.next():
-                    meta_data = java_result_set.getMetaData()
-                    column_count = meta_data.getColumnCount()
-                    
-                    row = []
-                    for i in range(1, column_count + 1):
-                        value = java_result_set.getObject(i)
-                        row.append(convert_java_to_python(value))
-                    
-                    rows.append(tuple(row))
+                for block in reader:
+                    rows.extend(block)
                 
                 # 자원 반납
-                java_result_set.close()
+                reader.close()
                 java_stmt.close()
                 conn.close()
                 return rows, True, None
                 
             except Exception as e:
-                java_stmt.close()
-                conn.close()
+                if java_stmt is not None:
+                    java_stmt.close()
+                conn.invalidate()
                 return None, False, str(e)
         
-        # PostgreSQL과 Informix는 일반 방식
+        # PostgreSQL은 일반 방식
         else:
-            curs = conn.cursor()
-            curs.execute(query)
-            rows = curs.fetchall()
-            curs.close()
+            try:
+                curs = conn.cursor()
+                curs.execute(query)
+                rows = curs.fetchall()
+                curs.close()
+            except Exception:
+                conn.invalidate()
+                raise
             conn.close()
             return rows, True, None
             
@@ -143,7 +102,7 @@ def execute_query(server_name, query):
 def list_servers():
     """사용 가능한 서버 목록 출력"""
     config = configparser.ConfigParser()
-    config.read('db_servers.ini')
+    config.read(server_registry.config_file)
     
     print("=" * 60)
     print("연결 가능한 서버 목록")
@@ -0,0 +1,151 @@
+"""
+정렬 병합 조인 변경 감지 모듈
+
+업무 키 순서로 정렬된 소스/타겟 청크 스트림을 한 행씩 앞으로 나아가며 비교(merge join)해서
+추가/수정/삭제된 행을 ChangeSet 단위로 반환합니다. 양쪽 모두 청크 하나 분량만 메모리에 두므로
+수천만 행도 한쪽 전체를 딕셔너리로 올리지 않고 비교할 수 있습니다.
+
+- 같은 키의 행은 data_hash(두 쪽 모두 있으면)로 먼저 비교하고, 다르면 컬럼별 변경 마스크를 만듭니다.
+  (해시만 다르고 컬럼이 모두 같으면 - 이전 형식 해시나 타겟의 문자열 저장 등 - 같은 행)
+- 양쪽 스트림은 같은 키 순서(파이썬 비교 기준)로 정렬되어 있어야 하며,
+  순서가 어긋나거나 키가 중복/NULL이면 잘못된 결과를 내는 대신 예외를 발생시킵니다.
+  (문자열 키는 DB 정렬 규칙(collation)에 따라 순서가 다를 수 있으므로 숫자/날짜 키 권장)
+"""
+
+# 한 ChangeSet에 모으는 최대 변경 행 수 (적재 함수가 한 번의 업서트/삭제로 처리하는 단위)
+DEFAULT_BATCH_SIZE = 10000
+
+class ChangeSet(list):
+    """
+    변경 묶음 (키 순서)
+    
+    리스트 자체는 업서트할 소스 행(추가 + 수정)이므로 기존 청크 적재 경로에 그대로 넘길 수 있습니다.
+    
+    Attributes:
+        added_count: 추가된 행 수 (리스트의 앞쪽이 아니라 키 순서로 섞여 있음)
+        updated: (이전 타겟 행, 새 소스 행, 변경 마스크) 리스트
+        deleted: 소스에 없는 타겟 행 리스트
+        deleted_keys: 삭제할 행의 키 튜플 리스트
+        unchanged_count: 같은 내용이라 건너뛴 행 수
+    """
+    
+    def __init__(self):
+        super().__init__()
+        self.added_count = 0
+        self.updated = []
+        self.deleted = []
+        self.deleted_keys = []
+        self.unchanged_count = 0
+    
+    def __bool__(self):
+        return len(self) > 0 or bool(self.deleted)
+    
+    @property
+    def change_count(self):
+        """추가 + 수정 + 삭제 행 수"""
+        return len(self) + len(self.deleted)
+    
+    def __repr__(self):
+        return (f"ChangeSet(added={self.added_count}, updated={len(self.updated)}, "
+                f"deleted={len(self.deleted)}, unchanged={self.unchanged_count})")
+
+def _values_equal(source_value, target_value):
+    """값 비교 (타겟이 문자열 컬럼에 저장한 경우를 위해 타입이 다르면 문자열로 비교)"""
+    if source_value == target_value:
+        return True
+    if source_value is None or target_value is None or type(source_value) is type(target_value):
+        return False
+    return str(source_value) == str(target_value)
+
+def _keyed_rows(chunks, key_indexes, side):
+    """청크 스트림을 (키, 행)으로 펼치면서 키가 엄격하게 증가하는지 확인"""
+    previous = None
+    for chunk in chunks:
+        for row in chunk:
+            key = tuple(row[i] for i in key_indexes)
+            if None in key:
+                raise Exception(f"{side} 행의 키가 NULL입니다: {key}")
+            if previous is not None:
+                try:
+                    ordered = previous < key
+                except TypeError:
+                    ordered = False
+                if not ordered:
+                    raise Exception(
+                        f"{side} 스트림이 키 순서로 정렬되어 있지 않거나 키가 중복됩니다: {previous} 다음 {key} "
+                        f"(DB의 정렬 규칙이 다른 문자열 키는 사용할 수 없음)"
+                    )
+            previous = key
+            yield key, row
+
+def merge_diff(source_chunks, target_chunks, source_key_indexes, target_key_indexes,
+               compare_indexes=None, hash_indexes=None, batch_size=DEFAULT_BATCH_SIZE, delete_key_indexes=None):
+    """
+    키 순서로 정렬된 소스/타겟 청크 스트림을 병합 조인해 ChangeSet을 차례로 반환
+    
+    Args:
+        source_chunks: 소스 청크(행 리스트 또는 ColumnBatch) 스트림
+        target_chunks: 타겟 청크 스트림
+        source_key_indexes: 소스 행의 키 컬럼 위치
+        target_key_indexes: 타겟 행의 키 컬럼 위치
+        compare_indexes: 비교할 (소스 위치, 타겟 위치) 리스트 (None이면 키와 해시를 제외한 같은 위치끼리)
+        hash_indexes: (소스 위치, 타겟 위치) - 두 쪽의 data_hash가 같으면 컬럼 비교 없이 같은 행,
+            다르면 compare_indexes의 컬럼을 비교
+        batch_size: ChangeSet 하나에 모을 최대 변경 행 수
+        delete_key_indexes: deleted_keys에 담을 타겟 행의 키 위치 (None이면 target_key_indexes,
+            타겟 키를 소스 타입으로 변환해 비교할 때 타겟에 저장된 원래 값으로 삭제하기 위해 사용)
+    
+    Yields:
+        ChangeSet: 추가/수정/삭제 묶음 (마지막 묶음 뒤에 남은 동일 행이 있으면 그 수만 담은 빈 ChangeSet도 반환,
+            빈 ChangeSet은 거짓이므로 적재할 때는 건너뜀)
+    """
+    source_rows = _keyed_rows(source_chunks, source_key_indexes, '소스')
+    target_rows = _keyed_rows(target_chunks, target_key_indexes, '타겟')
+    
+    source = next(source_rows, None)
+    target = next(target_rows, None)
+    if compare_indexes is None and (source is not None or target is not None):
+        width = len((source or target)[1])
+        skipped = set(source_key_indexes) | ({hash_indexes[0]} if hash_indexes is not None else set())
+        compare_indexes = [(i, i) for i in range(width) if i not in skipped]
+    
+    changes = ChangeSet()
+    unchanged_count = 0
+    while source is not None or target is not None:
+        if target is None or (source is not None and source[0] < target[0]):
+            # 소스에만 있음: 추가
+            changes.append(source[1])
+            changes.added_count += 1
+            source = next(source_rows, None)
+        elif source is None or target[0] < source[0]:
+            # 타겟에만 있음: 삭제
+            changes.deleted.append(target[1])
+            if delete_key_indexes is None:
+                changes.deleted_keys.append(target[0])
+            else:
+                changes.deleted_keys.append(tuple(target[1][i] for i in delete_key_indexes))
+            target = next(target_rows, None)
+        else:
+            source_row, target_row = source[1], target[1]
+            if hash_indexes is not None and source_row[hash_indexes[0]] == target_row[hash_indexes[1]]:
+                same = True
+            else:
+                mask = [not _values_equal(source_row[s], target_row[t]) for s, t in compare_indexes]
+                same = not any(mask)
+            
+            if same:
+                unchanged_count += 1
+            else:
+                changes.append(source_row)
+                changes.updated.append((target_row, source_row, mask))
+            source = next(source_rows, None)
+            target = next(target_rows, None)
+        
+        if changes.change_count >= batch_size:
+            changes.unchanged_count, unchanged_count = unchanged_count, 0
+            yield changes
+            changes = ChangeSet()
+    
+    if changes or unchanged_count:
+        changes.unchanged_count = unchanged_count
+        yield changes
@@ -0,0 +1,229 @@
+"""
+행 지문(fingerprint) 모듈
+
+행 데이터를 타입별 정규 바이너리 형식으로 직렬화한 뒤 64비트 비암호화 해시로 요약합니다.
+str(row)를 거치지 않으므로 repr 비용이 없고, 드라이버에 따라 값 표현이 달라도
+(Java BigDecimal -> Decimal, 정수 값의 NUMERIC/float 등) 같은 값이면 같은 지문이 나옵니다.
+
+- 해시 함수: xxhash(xxh3_64)가 설치되어 있으면 사용, 없으면 hashlib.blake2b(8바이트)
+- 결과: 부호 있는 64비트 정수 (PostgreSQL/Altibase/Informix BIGINT 컬럼에 그대로 저장)
+- 직렬화 함수는 컬럼마다 첫 값의 타입으로 한 번만 고르고 컬럼 단위로 적용
+- 병렬 처리: 환경변수 FINGERPRINT_WORKERS(기본값 0)가 2 이상이면 큰 청크를 프로세스 풀에 나눠서 계산
+
+형식이 바뀌면 기존 지문과 비교할 수 없으므로 FINGERPRINT_VERSION을 올리고 전체 동기화를 한 번 수행해야 합니다.
+"""
+
+import hashlib
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, time
+from decimal import Decimal
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+FINGERPRINT_VERSION = 1
+FINGERPRINT_WORKERS = int(os.environ.get('FINGERPRINT_WORKERS', '0'))
+# 이보다 작은 청크는 프로세스 간 전송 비용이 더 크므로 현재 프로세스에서 계산
+PARALLEL_MIN_ROWS = int(os.environ.get('FINGERPRINT_PARALLEL_MIN_ROWS', '50000'))
+
+# 값 태그 (같은 바이트열이라도 타입이 다르면 다른 지문)
+# 숫자/날짜는 ';'로 끝나고 문자열/바이너리는 길이를 앞에 붙여 인접한 값의 경계가 섞이지 않도록 함
+_NULL = b'n'
+_TRUE = b't1;'
+_FALSE = b't0;'
+_INF = float('inf')
+
+if xxhash is not None:
+    _xxh3_64_intdigest = xxhash.xxh3_64_intdigest
+    
+    def _hash_buffers(buffers):
+        return [h - 0x10000000000000000 if h >= 0x8000000000000000 else h
+                for h in map(_xxh3_64_intdigest, buffers)]
+    
+    HASH_ALGORITHM = 'xxh3_64'
+else:
+    _blake2b = hashlib.blake2b
+    _from_bytes = int.from_bytes
+    
+    def _hash_buffers(buffers):
+        return [_from_bytes(_blake2b(buffer, digest_size=8).digest(), 'little', signed=True) for buffer in buffers]
+    
+    HASH_ALGORITHM = 'blake2b-64'
+
+def _encode_int(value):
+    return b'i%d;' % value
+
+def _encode_decimal(value):
+    # 정수 값은 int와 같게, 소수는 끝자리 0을 제거한 형태로 (1.50 == 1.5)
+    text = str(value)
+    if not text[-1].isdigit():
+        # NaN, Infinity
+        return b'd%s;' % text.encode('ascii')
+    if 'E' in text:
+        text = format(value, 'f')
+    if '.' in text:
+        text = text.rstrip('0').rstrip('.')
+    if text == '-0':
+        text = '0'
+    return (('d%s;' if '.' in text else 'i%s;') % text).encode('ascii')
+
+def _encode_float(value):
+    # 정수 값은 int와 같게, 소수는 Decimal과 같은 형식으로 (드라이버가 NUMERIC을 float로 줘도 같은 지문)
+    if value != value or value in (_INF, -_INF):
+        return b'f%s;' % repr(value).encode('ascii')
+    if value.is_integer():
+        return b'i%d;' % value
+    text = repr(value)
+    if 'e' in text:
+        return _encode_decimal(Decimal(text))
+    return b'd%s;' % text.encode('ascii')
+
+def _encode_str(value):
+    value = value.encode('utf-8')
+    return b's%d:%s' % (len(value), value)
+
+def _encode_bytes(value):
+    value = bytes(value)
+    return b'b%d:%s' % (len(value), value)
+
+def _encode_bool(value):
+    return _TRUE if value else _FALSE
+
+def _encode_datetime(value):
+    return ('T%s;' % value.isoformat()).encode('ascii')
+
+def _encode_date(value):
+    return ('D%s;' % value.isoformat()).encode('ascii')
+
+def _encode_time(value):
+    return ('H%s;' % value.isoformat()).encode('ascii')
+
+def _encode_other(value):
+    return _encode_str(str(value))
+
+# 정확한 타입 -> 직렬화 함수 (bool은 int의 하위 타입이므로 isinstance 대신 type으로 조회)
+_ENCODERS = {
+    int: _encode_int,
+    bool: _encode_bool,
+    Decimal: _encode_decimal,
+    float: _encode_float,
+    str: _encode_str,
+    bytes: _encode_bytes,
+    bytearray: _encode_bytes,
+    memoryview: _encode_bytes,
+    datetime: _encode_datetime,
+    date: _encode_date,
+    time: _encode_time,
+}
+
+def encode_value(value):
+    """값 하나를 정규 바이너리 형식으로 직렬화"""
+    if value is None:
+        return _NULL
+    return _ENCODERS.get(type(value), _encode_other)(value)
+
+def encode_column(values):
+    """컬럼 하나를 직렬화 (첫 값의 타입으로 직렬화 방법을 고르고, 타입이 섞여 있으면 값마다 선택)"""
+    value_type = None
+    for value in values:
+        if value is not None:
+            value_type = type(value)
+            break
+    
+    if value_type is None:
+        return [_NULL] * len(values)
+    
+    if not all(value is None or type(value) is value_type for value in values):
+        return [encode_value(value) for value in values]
+    
+    # 가장 흔한 정수/문자열 컬럼은 함수 호출 없이 직렬화
+    if value_type is int:
+        return [_NULL if value is None else b'i%d;' % value for value in values]
+    if value_type is str:
+        encoded = [None if value is None else value.encode('utf-8') for value in values]
+        return [_NULL if value is None else b's%d:%s' % (len(value), value) for value in encoded]
+    
+    encoder = _ENCODERS.get(value_type, _encode_other)
+    return [_NULL if value is None else encoder(value) for value in values]
+
+def _fingerprint_columns(columns, num_rows):
+    """컬럼별 값 리스트 -> 행별 지문 리스트 (현재 프로세스에서 계산)"""
+    if not columns:
+        return _hash_buffers([b''] * num_rows)
+    
+    encoded = [encode_column(column) for column in columns]
+    if len(encoded) == 1:
+        return _hash_buffers(encoded[0])
+    join = b''.join
+    return _hash_buffers(map(join, zip(*encoded)))
+
+_executor = None
+_executor_lock = threading.Lock()
+
+def _get_executor(workers):
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(max_workers=workers)
+            print(f"행 지문 프로세스 풀 시작: {workers}개 워커 ({HASH_ALGORITHM})")
+        return _executor
+
+def shutdown_fingerprint_workers():
+    """프로세스 풀 종료"""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=False)
+
+def fingerprint_columns(columns, num_rows=None, workers=None):
+    """
+    컬럼별 값 리스트의 행 지문 계산
+    
+    Args:
+        columns: 컬럼별 값 리스트 (모두 같은 길이)
+        num_rows: 행 수 (None이면 첫 컬럼 길이)
+        workers: 프로세스 수 (None이면 FINGERPRINT_WORKERS, 2 미만이면 현재 프로세스에서 계산)
+    
+    Returns:
+        list: 행별 부호 있는 64비트 정수 지문
+    """
+    if num_rows is None:
+        num_rows = len(columns[0]) if columns else 0
+    workers = FINGERPRINT_WORKERS if workers is None else workers
+    
+    if workers < 2 or num_rows < PARALLEL_MIN_ROWS:
+        return _fingerprint_columns(columns, num_rows)
+    
+    # 행 범위를 워커 수만큼 나눠 계산한 뒤 순서대로 이어 붙임
+    step = -(-num_rows // workers)
+    executor = _get_executor(workers)
+    futures = [
+        executor.submit(_fingerprint_columns, [column[start:start + step] for column in columns],
+                        min(step, num_rows - start))
+        for start in range(0, num_rows, step)
+    ]
+    
+    fingerprints = []
+    for future in futures:
+        fingerprints.extend(future.result())
+    return fingerprints
+
+def fingerprint_rows(rows, workers=None):
+    """행(튜플) 리스트 또는 ColumnBatch의 행 지문 계산"""
+    columns = getattr(rows, 'columns', None)
+    if columns is not None:
+        return fingerprint_columns(columns, len(rows), workers)
+    
+    rows = list(rows)
+    if not rows:
+        return []
+    return fingerprint_columns([list(column) for column in zip(*rows)], len(rows), workers)
+
+def fingerprint_row(row):
+    """행 하나의 지문"""
+    return _hash_buffers([b''.join(map(encode_value, row))])[0]
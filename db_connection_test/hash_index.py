@@ -0,0 +1,306 @@
+"""
+작업별 해시 인덱스 모듈
+
+해시 전략 작업이 실행할 때마다 타겟의 data_hash를 모두 읽지 않도록,
+작업이 적재한 행 지문(64비트 정수)을 로컬 파일에 보관합니다.
+
+파일 구성 (HASH_INDEX_DIR/job_<작업 ID>.*):
+    .hidx:   헤더 + 정렬된 int64 지문 배열 + Bloom 필터 (mmap으로 열고, Bloom 필터 -> bisect 순으로 조회)
+    .hdelta: 마지막 압축 이후 추가된 지문 (int64 이어 쓰기, 열 때 집합으로 읽음)
+    .hmeta:  타겟의 예상 행 수와 체크섬 (data_hash 합계 mod 2^64)
+
+실행 전에 타겟의 COUNT(*)/SUM(data_hash)와 .hmeta를 비교해서 다르면
+(다른 프로세스가 타겟을 수정했거나 전체 동기화로 다시 채운 경우) 타겟에서 다시 만듭니다.
+다시 만들 때와 압축할 때는 정렬된 구간(run)을 임시 파일에 나눠 쓰고 병합하므로 메모리 사용량이 일정합니다.
+"""
+
+import heapq
+import json
+import mmap
+import os
+import struct
+import tempfile
+from array import array
+from bisect import bisect_left
+
+# 인덱스 파일 기본 폴더 (환경변수 HASH_INDEX_DIR로 변경 가능)
+DEFAULT_INDEX_DIR = os.environ.get(
+    'HASH_INDEX_DIR',
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'hash_index')
+)
+
+# Bloom 필터: 지문당 10비트, 해시 함수 4개 (거짓 양성 약 1.2%)
+BLOOM_BITS_PER_KEY = 10
+BLOOM_HASHES = 4
+
+# 델타가 기본 배열의 10%(최소 10만 개)를 넘으면 압축
+COMPACT_MIN_DELTA = 100000
+COMPACT_RATIO = 0.1
+
+# 다시 만들기/압축 시 한 번에 메모리에서 정렬하는 지문 수
+SORT_RUN_SIZE = 1000000
+_READ_BLOCK = 65536
+
+_MAGIC = b'FSHIDX01'
+_HEADER = struct.Struct('<8sqq')  # 매직, 지문 수, Bloom 필터 비트 수
+_MASK64 = 0xFFFFFFFFFFFFFFFF
+
+def _bloom_positions(value, num_bits):
+    """지문 하나의 Bloom 필터 비트 위치 (지문이 이미 균일한 해시이므로 상/하위 32비트로 이중 해싱)"""
+    value &= _MASK64
+    h1 = value & 0xFFFFFFFF
+    h2 = (value >> 32) | 1
+    return [(h1 + i * h2) % num_bits for i in range(BLOOM_HASHES)]
+
+def _read_run(path, offset, count):
+    """임시 파일에 쓴 정렬 구간을 블록 단위로 읽기"""
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        while count > 0:
+            block = array('q')
+            block.fromfile(f, min(count, _READ_BLOCK))
+            count -= len(block)
+            yield from block
+
+def _sorted_runs(chunks, run_dir):
+    """
+    지문 청크들을 정렬된 구간으로 나눠 임시 파일에 기록
+    
+    Returns:
+        (임시 파일 경로, [(오프셋, 개수)])
+    """
+    fd, path = tempfile.mkstemp(prefix='hash_runs_', dir=run_dir)
+    runs = []
+    pending = []
+    
+    with os.fdopen(fd, 'wb') as f:
+        def flush():
+            if pending:
+                runs.append((f.tell(), len(pending)))
+                array('q', sorted(pending)).tofile(f)
+                pending.clear()
+        
+        for chunk in chunks:
+            pending.extend(chunk)
+            if len(pending) >= SORT_RUN_SIZE:
+                flush()
+        flush()
+    
+    return path, runs
+
+class JobHashIndex:
+    """작업 하나의 지문 인덱스"""
+    
+    def __init__(self, path_prefix):
+        self.base_path = path_prefix + '.hidx'
+        self.delta_path = path_prefix + '.hdelta'
+        self.meta_path = path_prefix + '.hmeta'
+        self.target_rows = None
+        self.checksum = None
+        self.delta = set()
+        self._file = None
+        self._mmap = None
+        self._sorted = ()
+        self._bloom = None
+        self._bloom_bits = 0
+    
+    @classmethod
+    def for_job(cls, job_id, index_dir=None):
+        """작업 ID의 인덱스 (파일은 load()/rebuild() 때 읽거나 만듦)"""
+        index_dir = index_dir or DEFAULT_INDEX_DIR
+        os.makedirs(index_dir, exist_ok=True)
+        return cls(os.path.join(index_dir, f"job_{job_id}"))
+    
+    def __len__(self):
+        return len(self._sorted) + len(self.delta)
+    
+    def load(self):
+        """인덱스 파일 열기 (없거나 손상되었으면 False)"""
+        self.close()
+        if not os.path.exists(self.meta_path):
+            return False
+        try:
+            with open(self.meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            self._open_base()
+            
+            delta = array('q')
+            if os.path.exists(self.delta_path):
+                with open(self.delta_path, 'rb') as f:
+                    data = f.read()
+                # 기록 도중 중단되어 남은 조각은 버림
+                delta.frombytes(data[:len(data) - len(data) % delta.itemsize])
+        except (OSError, ValueError, KeyError) as e:
+            print(f"해시 인덱스를 읽을 수 없습니다: {self.base_path} ({e})")
+            self.close()
+            return False
+        
+        self.delta = set(delta)
+        self.target_rows = meta['target_rows']
+        self.checksum = meta['checksum']
+        return True
+    
+    def _open_base(self):
+        """기본 배열 파일을 mmap으로 열기"""
+        self._file = open(self.base_path, 'rb')
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, count, bloom_bits = _HEADER.unpack_from(self._mmap, 0)
+        if magic != _MAGIC:
+            raise ValueError("해시 인덱스 파일 형식이 아닙니다.")
+        
+        start = _HEADER.size
+        end = start + count * 8
+        view = memoryview(self._mmap)
+        self._sorted = view[start:end].cast('q')
+        self._bloom = view[end:end + bloom_bits // 8]
+        self._bloom_bits = bloom_bits
+    
+    def matches(self, target_rows, checksum):
+        """타겟의 행 수/체크섬이 인덱스에 기록된 값과 같은지 (다르면 다시 만들어야 함)"""
+        return self.target_rows == target_rows and self.checksum == checksum % (_MASK64 + 1)
+    
+    def _in_base(self, value):
+        bloom = self._bloom
+        if not self._bloom_bits:
+            return False
+        for position in _bloom_positions(value, self._bloom_bits):
+            if not bloom[position >> 3] & (1 << (position & 7)):
+                return False
+        
+        values = self._sorted
+        i = bisect_left(values, value)
+        return i < len(values) and values[i] == value
+    
+    def contains(self, value):
+        """지문이 인덱스에 있는지"""
+        return value in self.delta or self._in_base(value)
+    
+    def contains_many(self, values):
+        """지문 목록의 포함 여부 리스트"""
+        delta = self.delta
+        in_base = self._in_base
+        return [value in delta or in_base(value) for value in values]
+    
+    def add(self, values, rows=None):
+        """
+        적재에 성공한 지문 추가 (델타 파일에 이어 쓰고, 커지면 기본 배열과 병합)
+        
+        Args:
+            values: 타겟에 새로 쓴 행의 지문 (중복 포함, 체크섬 계산에 그대로 사용)
+            rows: 타겟에 새로 쓴 행 수 (None이면 values 개수)
+        """
+        values = array('q', values)
+        with open(self.delta_path, 'ab') as f:
+            values.tofile(f)
+        
+        self.delta.update(values)
+        self.target_rows = (self.target_rows or 0) + (len(values) if rows is None else rows)
+        self.checksum = ((self.checksum or 0) + sum(values)) & _MASK64
+        self._save_meta()
+        
+        if len(self.delta) > max(COMPACT_MIN_DELTA, int(len(self._sorted) * COMPACT_RATIO)):
+            self.compact()
+    
+    def compact(self):
+        """델타를 기본 배열에 병합"""
+        print(f"해시 인덱스 압축: 기본 {len(self._sorted)}개 + 델타 {len(self.delta)}개")
+        merged = heapq.merge(iter(self._sorted), sorted(self.delta))
+        self._write_base(merged, len(self._sorted) + len(self.delta))
+        self._reset_delta()
+    
+    def rebuild(self, chunks, target_rows, checksum):
+        """
+        타겟의 지문으로 인덱스를 다시 만듦
+        
+        Args:
+            chunks: 지문 리스트를 차례로 반환하는 이터러블 (타겟의 data_hash를 청크 단위로 읽은 값)
+            target_rows: 타겟 행 수
+            checksum: 타겟 data_hash 합계
+        """
+        index_dir = os.path.dirname(self.base_path)
+        run_path, runs = _sorted_runs(chunks, index_dir)
+        try:
+            merged = heapq.merge(*[_read_run(run_path, offset, count) for offset, count in runs])
+            self._write_base(merged, sum(count for _, count in runs))
+        finally:
+            os.remove(run_path)
+        
+        self._reset_delta()
+        self.target_rows = target_rows
+        self.checksum = checksum & _MASK64
+        self._save_meta()
+        print(f"해시 인덱스 생성 완료: {len(self._sorted)}개 (타겟 {target_rows}행)")
+    
+    def _write_base(self, sorted_values, max_count):
+        """정렬된 지문을 중복 없이 기본 배열 파일로 기록 (임시 파일에 쓴 뒤 교체)"""
+        bloom_bits = max(64, max_count * BLOOM_BITS_PER_KEY)
+        bloom_bits += -bloom_bits % 8
+        bloom = bytearray(bloom_bits // 8)
+        
+        fd, tmp_path = tempfile.mkstemp(prefix='hash_index_', dir=os.path.dirname(self.base_path))
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(_HEADER.pack(_MAGIC, 0, bloom_bits))
+                
+                count = 0
+                previous = None
+                block = array('q')
+                for value in sorted_values:
+                    if value == previous:
+                        continue
+                    previous = value
+                    block.append(value)
+                    for position in _bloom_positions(value, bloom_bits):
+                        bloom[position >> 3] |= 1 << (position & 7)
+                    if len(block) >= _READ_BLOCK:
+                        block.tofile(f)
+                        count += len(block)
+                        block = array('q')
+                block.tofile(f)
+                count += len(block)
+                
+                f.write(bloom)
+                f.seek(0)
+                f.write(_HEADER.pack(_MAGIC, count, bloom_bits))
+                f.flush()
+                os.fsync(f.fileno())
+            
+            self.close()
+            os.replace(tmp_path, self.base_path)
+        except Exception:
+            os.remove(tmp_path)
+            raise
+        
+        self._open_base()
+    
+    def _reset_delta(self):
+        with open(self.delta_path, 'wb'):
+            pass
+        self.delta = set()
+    
+    def _save_meta(self):
+        """행 수/체크섬 기록 (임시 파일에 쓴 뒤 교체)"""
+        tmp_path = self.meta_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'target_rows': self.target_rows, 'checksum': self.checksum}, f)
+        os.replace(tmp_path, self.meta_path)
+    
+    def close(self):
+        """mmap 닫기"""
+        if self._mmap is not None:
+            self._sorted.release()
+            self._bloom.release()
+            self._mmap.close()
+            self._file.close()
+        self._file = None
+        self._mmap = None
+        self._sorted = ()
+        self._bloom = None
+        self._bloom_bits = 0
+    
+    def delete(self):
+        """인덱스 파일 삭제"""
+        self.close()
+        for path in (self.base_path, self.delta_path, self.meta_path):
+            if os.path.exists(path):
+                os.remove(path)
@@ -0,0 +1,132 @@
+"""
+JDBC 배치 적재 모듈
+
+Altibase/Informix 테이블에 INSERT를 PreparedStatement로 한 번만 준비하고,
+청크의 행을 타입별 setter로 바인딩해 addBatch/executeBatch로 묶어 보냅니다.
+행마다 SQL 문자열을 만들고 서버에서 파싱하지 않으므로 왕복 횟수가 행 수가 아니라 배치 수가 됩니다.
+
+- 배치 크기: 환경변수 JDBC_BATCH_SIZE (기본값 1000)
+- 커밋 간격: 환경변수 JDBC_COMMIT_INTERVAL (기본값 0 = 호출한 쪽에서 커밋)
+  0보다 크면 그 행 수를 넘을 때마다 커밋하므로 적재 도중의 상태가 타겟에 보입니다.
+"""
+
+import os
+from datetime import date, datetime, time
+from decimal import Decimal
+
+DEFAULT_BATCH_SIZE = int(os.environ.get('JDBC_BATCH_SIZE', '1000'))
+DEFAULT_COMMIT_INTERVAL = int(os.environ.get('JDBC_COMMIT_INTERVAL', '0'))
+
+def _build_setters():
+    """Python 타입 -> setter(문장, 위치, 값) (Java 클래스는 한 번만 조회)"""
+    import jpype
+    
+    big_decimal = jpype.JClass('java.math.BigDecimal')
+    timestamp = jpype.JClass('java.sql.Timestamp')
+    sql_date = jpype.JClass('java.sql.Date')
+    sql_time = jpype.JClass('java.sql.Time')
+    byte_array = jpype.JArray(jpype.JByte)
+    
+    def set_string(stmt, index, value):
+        stmt.setString(index, value if type(value) is str else str(value))
+    
+    setters = {
+        str: set_string,
+        bool: lambda stmt, index, value: stmt.setBoolean(index, value),
+        int: lambda stmt, index, value: stmt.setLong(index, value),
+        float: lambda stmt, index, value: stmt.setDouble(index, value),
+        Decimal: lambda stmt, index, value: stmt.setBigDecimal(index, big_decimal(str(value))),
+        datetime: lambda stmt, index, value: stmt.setTimestamp(
+            index, timestamp.valueOf(value.strftime('%Y-%m-%d %H:%M:%S.%f'))),
+        date: lambda stmt, index, value: stmt.setDate(index, sql_date.valueOf(value.isoformat())),
+        time: lambda stmt, index, value: stmt.setTime(index, sql_time.valueOf(value.strftime('%H:%M:%S'))),
+        bytes: lambda stmt, index, value: stmt.setBytes(index, byte_array(value)),
+        bytearray: lambda stmt, index, value: stmt.setBytes(index, byte_array(bytes(value))),
+    }
+    null_type = jpype.JClass('java.sql.Types').NULL
+    return setters, set_string, null_type
+
+_setters = None
+
+def _get_setters():
+    global _setters
+    if _setters is None:
+        _setters = _build_setters()
+    return _setters
+
+class JdbcBatchWriter:
+    """테이블 하나에 준비된 INSERT로 배치 적재"""
+    
+    def __init__(self, java_conn, table_name, columns, batch_size=None, commit_interval=None, id_start=None):
+        """
+        Args:
+            java_conn: java.sql.Connection (자동 커밋 해제 상태)
+            table_name: 적재할 테이블
+            columns: 적재할 컬럼명 목록 (청크의 값 순서)
+            batch_size: executeBatch 한 번에 보낼 행 수
+            commit_interval: 이 행 수를 넘을 때마다 커밋 (0이면 커밋하지 않음)
+            id_start: 지정하면 id 컬럼을 앞에 추가하고 이 번호부터 매김 (기본값 없는 Altibase id)
+        """
+        self.java_conn = java_conn
+        self.table_name = table_name
+        self.batch_size = batch_size or DEFAULT_BATCH_SIZE
+        self.commit_interval = DEFAULT_COMMIT_INTERVAL if commit_interval is None else commit_interval
+        self.next_id = id_start
+        self.rows = 0
+        self._uncommitted = 0
+        
+        insert_columns = (['id'] if id_start is not None else []) + list(columns)
+        self.stmt = java_conn.prepareStatement(
+            f"INSERT INTO {table_name} ({', '.join(insert_columns)}) VALUES ({', '.join(['?'] * len(insert_columns))})"
+        )
+    
+    def write(self, rows):
+        """행(튜플) 리스트 또는 ColumnBatch를 배치로 적재 (적재한 행 수 반환)"""
+        setters, set_other, null_type = _get_setters()
+        stmt = self.stmt
+        set_null = stmt.setNull
+        add_batch = stmt.addBatch
+        offset = 1 if self.next_id is not None else 0
+        
+        pending = 0
+        for row in rows:
+            if self.next_id is not None:
+                stmt.setLong(1, self.next_id)
+                self.next_id += 1
+            for index, value in enumerate(row, 1 + offset):
+                if value is None:
+                    set_null(index, null_type)
+                else:
+                    setters.get(type(value), set_other)(stmt, index, value)
+            add_batch()
+            pending += 1
+            if pending >= self.batch_size:
+                self._execute(pending)
+                pending = 0
+        if pending:
+            self._execute(pending)
+        return len(rows)
+    
+    def _execute(self, count):
+        self.stmt.executeBatch()
+        self.rows += count
+        self._uncommitted += count
+        if self.commit_interval and self._uncommitted >= self.commit_interval:
+            self.java_conn.commit()
+            self._uncommitted = 0
+    
+    def write_chunks(self, chunks):
+        """청크 스트림 전체 적재 (적재한 행 수 반환)"""
+        total_rows = 0
+        for chunk in chunks:
+            total_rows += self.write(chunk)
+        return total_rows
+    
+    def close(self):
+        self.stmt.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
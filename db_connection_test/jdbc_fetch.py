@@ -0,0 +1,133 @@
+"""
+JDBC 블록 조회 모듈
+
+Altibase/Informix 결과셋을 fetch size 단위로 읽어 Python 행 블록 또는 컬럼 배치로 변환합니다.
+메타데이터는 결과셋마다 한 번만 조회합니다.
+"""
+
+import os
+
+try:
+    from .converters import build_column_converters, set_statement_params
+    from .batch import ColumnBatch
+except ImportError:
+    # 스크립트로 직접 실행하는 경우
+    from converters import build_column_converters, set_statement_params
+    from batch import ColumnBatch
+
+# 기본 JDBC fetch size (환경변수 JDBC_FETCH_SIZE로 변경 가능)
+DEFAULT_FETCH_SIZE = int(os.environ.get('JDBC_FETCH_SIZE', '5000'))
+
+def create_fetch_statement(java_conn, fetch_size=None, query_timeout=30):
+    """fetch size와 타임아웃이 설정된 java.sql.Statement 생성"""
+    java_stmt = java_conn.createStatement()
+    java_stmt.setFetchSize(fetch_size or DEFAULT_FETCH_SIZE)
+    if query_timeout:
+        java_stmt.setQueryTimeout(query_timeout)
+    return java_stmt
+
+class JdbcBlockReader:
+    """JDBC ResultSet을 블록 단위로 읽는 리더 (convert=True면 컬럼 타입별로 Python 값 변환)"""
+    
+    def __init__(self, result_set, fetch_size=None, convert=False):
+        self.result_set = result_set
+        self.fetch_size = fetch_size or DEFAULT_FETCH_SIZE
+        
+        try:
+            result_set.setFetchSize(self.fetch_size)
+        except Exception:
+            # 일부 드라이버는 결과셋 단위 fetch size 변경을 지원하지 않음 (Statement 설정 사용)
+            pass
+        
+        # 메타데이터는 한 번만 조회
+        self.meta_data = result_set.getMetaData()
+        self.column_count = self.meta_data.getColumnCount()
+        self.columns = [str(self.meta_data.getColumnName(i)) for i in range(1, self.column_count + 1)]
+        self.converters = build_column_converters(self.meta_data) if convert else None
+        self._exhausted = False
+    
+    def fetch_block(self, size=None):
+        """최대 size 행을 튜플 리스트로 읽기 (더 이상 행이 없으면 빈 리스트)"""
+        if self._exhausted:
+            return []
+        
+        size = size or self.fetch_size
+        
+        # JPype 메서드 조회 비용을 줄이기 위해 접근자를 블록마다 한 번만 바인딩
+        next_row = self.result_set.next
+        get_object = self.result_set.getObject
+        indexes = range(1, self.column_count + 1)
+        
+        rows = []
+        append = rows.append
+        if self.converters is None:
+            while len(rows) < size:
+                if not next_row():
+                    self._exhausted = True
+                    break
+                append(tuple([get_object(i) for i in indexes]))
+        else:
+            columns = list(zip(indexes, self.converters))
+            while len(rows) < size:
+                if not next_row():
+                    self._exhausted = True
+                    break
+                append(tuple([convert(get_object(i)) for i, convert in columns]))
+        return rows
+    
+    def fetch_columns(self, size=None):
+        """최대 size 행을 ColumnBatch로 읽기 (값은 컬럼 리스트에 바로 쌓고 변환은 컬럼 단위로 적용)"""
+        if self._exhausted:
+            return ColumnBatch(self.columns, [[] for _ in self.columns], 0)
+        
+        size = size or self.fetch_size
+        
+        next_row = self.result_set.next
+        get_object = self.result_set.getObject
+        values = [[] for _ in self.columns]
+        columns = list(zip(range(1, self.column_count + 1), [column.append for column in values]))
+        
+        count = 0
+        while count < size:
+            if not next_row():
+                self._exhausted = True
+                break
+            for i, append in columns:
+                append(get_object(i))
+            count += 1
+        
+        if self.converters is not None:
+            values = [list(map(convert, column)) for convert, column in zip(self.converters, values)]
+        return ColumnBatch(self.columns, values, count)
+    
+    def __iter__(self):
+        """fetch size 단위 블록을 차례로 반환"""
+        while True:
+            block = self.fetch_block()
+            if not block:
+                break
+            yield block
+    
+    def close(self):
+        """결과셋 닫기"""
+        self.result_set.close()
+
+def open_block_reader(java_conn, query, fetch_size=None, query_timeout=30, convert=False, params=None):
+    """쿼리를 실행하고 (statement, reader) 반환 (params가 있으면 ? 자리에 바인딩하는 PreparedStatement 사용)"""
+    if params:
+        java_stmt = java_conn.prepareStatement(query)
+        java_stmt.setFetchSize(fetch_size or DEFAULT_FETCH_SIZE)
+        if query_timeout:
+            java_stmt.setQueryTimeout(query_timeout)
+    else:
+        java_stmt = create_fetch_statement(java_conn, fetch_size, query_timeout)
+    try:
+        if params:
+            set_statement_params(java_stmt, params)
+            java_result_set = java_stmt.executeQuery()
+        else:
+            java_result_set = java_stmt.executeQuery(query)
+    except Exception:
+        java_stmt.close()
+        raise
+    return java_stmt, JdbcBlockReader(java_result_set, fetch_size, convert)
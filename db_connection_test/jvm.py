@@ -0,0 +1,151 @@
+"""
+JVM 수명 주기 관리 모듈
+
+JVM은 프로세스당 한 번만 시작할 수 있으므로, 처음 연결한 드라이버의 jar 하나로
+클래스패스가 고정되지 않도록 드라이버 폴더의 모든 jar를 모아 한 번에 시작합니다.
+애플리케이션 시작 시 start_jvm_async()로 백그라운드에서 미리 띄워 두면
+첫 Informix/Altibase 쿼리가 JVM 기동 시간을 기다리지 않습니다.
+
+환경변수:
+    JDBC_DRIVER_DIRS: jar를 찾을 폴더 목록 (os.pathsep 구분, 기본값: /app/jdbc-drivers와 이 모듈 폴더)
+    JVM_HEAP_MIN / JVM_HEAP_MAX: 힙 크기 (-Xms / -Xmx, 기본값: 256m / 1g)
+    JVM_GC: 사용할 GC (G1, Parallel, Serial, Z 등, 기본값: G1)
+    JVM_OPTIONS: 추가 JVM 옵션 (공백 구분)
+"""
+
+import glob
+import os
+import threading
+import time
+
+import jaydebeapi
+import jpype
+
+# jar를 찾을 기본 폴더
+DEFAULT_DRIVER_DIRS = ['/app/jdbc-drivers', os.path.dirname(os.path.abspath(__file__))]
+
+_lock = threading.Lock()
+_ready = threading.Event()
+_state = {
+    'status': 'stopped',  # stopped, starting, ready, failed
+    'classpath': [],
+    'options': [],
+    'started_at': None,
+    'startup_seconds': None,
+    'error': None,
+}
+
+def get_driver_dirs():
+    """jar를 찾을 폴더 목록"""
+    driver_dirs = os.environ.get('JDBC_DRIVER_DIRS')
+    if driver_dirs:
+        return [path for path in driver_dirs.split(os.pathsep) if path]
+    return list(DEFAULT_DRIVER_DIRS)
+
+def discover_driver_jars(driver_dirs=None):
+    """드라이버 폴더의 모든 jar 경로 (같은 파일명은 먼저 찾은 폴더 우선)"""
+    jars = []
+    seen_names = set()
+    for driver_dir in driver_dirs or get_driver_dirs():
+        for jar in sorted(glob.glob(os.path.join(driver_dir, '*.jar'))):
+            name = os.path.basename(jar)
+            if name not in seen_names:
+                seen_names.add(name)
+                jars.append(os.path.abspath(jar))
+    return jars
+
+def get_jvm_options():
+    """힙/GC 설정이 반영된 JVM 옵션 목록"""
+    options = [
+        f"-Xms{os.environ.get('JVM_HEAP_MIN', '256m')}",
+        f"-Xmx{os.environ.get('JVM_HEAP_MAX', '1g')}",
+    ]
+    
+    gc = os.environ.get('JVM_GC', 'G1')
+    if gc:
+        options.append(f"-XX:+Use{gc}GC")
+    
+    options.extend(os.environ.get('JVM_OPTIONS', '').split())
+    return options
+
+def start_jvm(classpath=None, options=None):
+    """JVM 시작 (이미 시작되었으면 그대로 사용, 실패하면 예외 발생)"""
+    with _lock:
+        if jpype.isJVMStarted():
+            if _state['status'] != 'ready':
+                # 다른 코드가 먼저 JVM을 시작한 경우
+                _state['status'] = 'ready'
+                _ready.set()
+            return
+        
+        classpath = classpath if classpath is not None else discover_driver_jars()
+        options = options if options is not None else get_jvm_options()
+        
+        _state.update(status='starting', classpath=classpath, options=options, error=None)
+        started = time.perf_counter()
+        print(f"JVM 시작 중: 클래스패스 {len(classpath)}개 jar, 옵션 {' '.join(options)}")
+        
+        try:
+            # jaydebeapi와 같은 문자열 변환 설정으로 시작
+            jpype.startJVM(
+                jpype.getDefaultJVMPath(), *options,
+                classpath=classpath, ignoreUnrecognized=True, convertStrings=True
+            )
+        except Exception as e:
+            _state.update(status='failed', error=str(e))
+            print(f"❌ JVM 시작 실패: {e}")
+            raise
+        
+        _state.update(
+            status='ready',
+            started_at=time.time(),
+            startup_seconds=time.perf_counter() - started,
+        )
+        _ready.set()
+        print(f"✅ JVM 시작 완료: {_state['startup_seconds']:.2f}초 ({', '.join(os.path.basename(jar) for jar in classpath)})")
+
+def start_jvm_async():
+    """백그라운드 스레드에서 JVM 시작 (애플리케이션 시작 시 호출)"""
+    def run():
+        try:
+            start_jvm()
+        except Exception:
+            # 오류는 jvm_status()로 확인, 첫 연결 시 다시 시도
+            pass
+    
+    thread = threading.Thread(target=run, name='jvm-warm-start', daemon=True)
+    thread.start()
+    return thread
+
+def wait_for_jvm(timeout=None):
+    """JVM이 준비될 때까지 대기 (준비되면 True)"""
+    return _ready.wait(timeout)
+
+def is_jvm_ready():
+    """JVM 준비 여부"""
+    return _ready.is_set()
+
+def jvm_status():
+    """JVM 상태 정보"""
+    status = dict(_state)
+    status['ready'] = _ready.is_set()
+    return status
+
+def ensure_jvm():
+    """연결 전에 JVM 준비 (백그라운드 시작 중이면 잠금에서 완료까지 대기, 실패했으면 다시 시도)"""
+    if not _ready.is_set():
+        start_jvm()
+
+def connect_jdbc(jclassname, url, driver_args=None, jars=None):
+    """
+    공통 클래스패스의 JVM에서 JDBC 연결 (jaydebeapi.connect와 같은 인자)
+    
+    jars는 하위 호환을 위해 받기만 하며, 드라이버는 JVM 시작 시 클래스패스에 포함된 jar에서 찾습니다.
+    """
+    ensure_jvm()
+    
+    # 백그라운드 스레드 등에서 처음 호출된 경우 JVM에 스레드 연결
+    if not jpype.isThreadAttachedToJVM():
+        jpype.attachThreadToJVM()
+    
+    return jaydebeapi.connect(jclassname, url, driver_args, _state['classpath'] or jars)
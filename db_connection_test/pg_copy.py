@@ -0,0 +1,265 @@
+"""
+PostgreSQL COPY 적재 모듈
+
+청크 스트림을 COPY ... FROM STDIN 입력으로 바로 인코딩해서 적재합니다.
+행마다 mogrify로 INSERT 문자열을 만들지 않으므로 파이썬 CPU/메모리와 서버의 SQL 파싱 비용이 없습니다.
+입력은 file 객체(CopyStream)로 넘기고, psycopg2가 read()할 때마다 청크 하나씩 인코딩하므로
+청크 하나 분량의 버퍼만 메모리에 둡니다.
+
+형식 (환경변수 PG_COPY_FORMAT, 기본값 csv):
+    csv:    값을 PostgreSQL 텍스트 표현으로 변환 (NULL은 따옴표 없는 빈 값, 빈 문자열은 "")
+    binary: 타겟 컬럼 타입(OID)별 바이너리 인코딩 (텍스트 변환/파싱 없음)
+            지원하지 않는 타입의 컬럼이 있으면 해당 적재는 csv로 수행
+"""
+
+import os
+import struct
+from datetime import date, datetime, time
+from decimal import Decimal
+
+COPY_FORMATS = ('csv', 'binary')
+DEFAULT_COPY_FORMAT = os.environ.get('PG_COPY_FORMAT', 'csv')
+
+# psycopg2가 COPY 입력을 한 번에 읽는 크기
+COPY_BUFFER_SIZE = 1 << 20
+
+_BINARY_HEADER = b'PGCOPY\n\xff\r\n\x00' + struct.pack('>ii', 0, 0)
+_BINARY_TRAILER = struct.pack('>h', -1)
+_NULL_FIELD = struct.pack('>i', -1)
+_PG_EPOCH_DATE = date(2000, 1, 1)
+_PG_EPOCH = datetime(2000, 1, 1)
+
+def text_value(value):
+    """값의 PostgreSQL 텍스트 표현 (None은 None, INSERT 리터럴을 텍스트 컬럼에 넣은 결과와 같은 형식)"""
+    if value is None or type(value) is str:
+        return value
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, datetime):
+        return value.isoformat(sep=' ')
+    if isinstance(value, (date, time)):
+        return value.isoformat()
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return '\\x' + bytes(value).hex()
+    return str(value)
+
+def _csv_field(text):
+    """CSV 필드 하나 (NULL은 따옴표 없는 빈 값, 특수 문자/빈 문자열/끝 표시는 따옴표로 감쌈)"""
+    if text is None:
+        return ''
+    if (not text or '"' in text or ',' in text or '\n' in text or '\r' in text
+            or text[0] == ' ' or text[-1] == ' ' or text == '\\.'):
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
+def _chunk_columns(chunk):
+    """청크의 컬럼별 값 리스트 (ColumnBatch는 그대로, 행 리스트는 전치)"""
+    columns = getattr(chunk, 'columns', None)
+    if columns is not None:
+        return columns
+    return list(zip(*chunk))
+
+def encode_csv(chunk):
+    """청크를 COPY CSV 형식 바이트열로 인코딩"""
+    encoded = [[_csv_field(text_value(value)) for value in column] for column in _chunk_columns(chunk)]
+    if not encoded:
+        return b''
+    return ('\n'.join(map(','.join, zip(*encoded))) + '\n').encode('utf-8')
+
+def _encode_text(value):
+    return text_value(value).encode('utf-8')
+
+def _encode_bool(value):
+    if isinstance(value, str):
+        value = value.strip().lower() in ('t', 'true', 'y', 'yes', 'on', '1')
+    return b'\x01' if value else b'\x00'
+
+def _encode_bytea(value):
+    if isinstance(value, str):
+        return value.encode('utf-8')
+    return bytes(value)
+
+def _int_encoder(fmt):
+    pack = struct.Struct(fmt).pack
+    return lambda value: pack(int(value))
+
+def _float_encoder(fmt):
+    pack = struct.Struct(fmt).pack
+    return lambda value: pack(float(value))
+
+def _encode_numeric(value):
+    """NUMERIC 바이너리 형식 (10000진수 자리, weight, 부호, 소수 자릿수)"""
+    if not isinstance(value, Decimal):
+        value = Decimal(str(value))
+    if value.is_nan():
+        return struct.pack('>hhHh', 0, 0, 0xC000, 0)
+    if value.is_infinite():
+        raise ValueError(f"NUMERIC으로 변환할 수 없는 값: {value}")
+    
+    sign, digits, exponent = value.as_tuple()
+    text = ''.join(map(str, digits))
+    if exponent > 0:
+        text += '0' * exponent
+        exponent = 0
+    dscale = -exponent
+    point = len(text) - dscale
+    if point < 0:
+        text = '0' * -point + text
+        point = 0
+    int_part = text[:point].lstrip('0')
+    frac_part = text[point:]
+    int_part = '0' * (-len(int_part) % 4) + int_part
+    frac_part += '0' * (-len(frac_part) % 4)
+    
+    groups = [int(int_part[i:i + 4]) for i in range(0, len(int_part), 4)]
+    weight = len(groups) - 1
+    groups += [int(frac_part[i:i + 4]) for i in range(0, len(frac_part), 4)]
+    while groups and groups[0] == 0:
+        groups.pop(0)
+        weight -= 1
+    while groups and groups[-1] == 0:
+        groups.pop()
+    if not groups:
+        weight = 0
+        sign = 0
+    return struct.pack(f'>hhHh{len(groups)}h', len(groups), weight, 0x4000 if sign else 0, dscale, *groups)
+
+def _encode_date(value):
+    if isinstance(value, datetime):
+        value = value.date()
+    return struct.pack('>i', (value - _PG_EPOCH_DATE).days)
+
+def _encode_timestamp(value):
+    if not isinstance(value, datetime):
+        value = datetime(value.year, value.month, value.day)
+    delta = value.replace(tzinfo=None) - _PG_EPOCH
+    return struct.pack('>q', (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds)
+
+def _encode_time(value):
+    return struct.pack('>q', ((value.hour * 60 + value.minute) * 60 + value.second) * 1000000 + value.microsecond)
+
+def _encode_jsonb(value):
+    return b'\x01' + _encode_text(value)
+
+# 타입 OID -> 바이너리 인코딩 함수 (텍스트 계열 컬럼은 값을 텍스트 표현으로 변환)
+_BINARY_ENCODERS = {
+    16: _encode_bool,            # boolean
+    17: _encode_bytea,           # bytea
+    19: _encode_text,            # name
+    20: _int_encoder('>q'),      # bigint
+    21: _int_encoder('>h'),      # smallint
+    23: _int_encoder('>i'),      # integer
+    25: _encode_text,            # text
+    114: _encode_text,           # json
+    700: _float_encoder('>f'),   # real
+    701: _float_encoder('>d'),   # double precision
+    1042: _encode_text,          # char
+    1043: _encode_text,          # varchar
+    1082: _encode_date,          # date
+    1083: _encode_time,          # time
+    1114: _encode_timestamp,     # timestamp (시간대 없음)
+    1700: _encode_numeric,       # numeric
+    3802: _encode_jsonb,         # jsonb
+}
+
+def binary_encoders(type_oids):
+    """컬럼 타입 OID 목록의 바이너리 인코딩 함수 목록 (지원하지 않는 타입이 있으면 None)"""
+    encoders = [_BINARY_ENCODERS.get(oid) for oid in type_oids]
+    if None in encoders:
+        return None
+    return encoders
+
+def encode_binary(chunk, encoders):
+    """청크를 COPY BINARY 형식의 튜플 바이트열로 인코딩 (헤더/끝 표시 제외)"""
+    pack_length = struct.Struct('>i').pack
+    encoded = []
+    for encode, column in zip(encoders, _chunk_columns(chunk)):
+        fields = []
+        for value in column:
+            if value is None:
+                fields.append(_NULL_FIELD)
+            else:
+                data = encode(value)
+                fields.append(pack_length(len(data)) + data)
+        encoded.append(fields)
+    if not encoded:
+        return b''
+    field_count = struct.pack('>h', len(encoded))
+    return b''.join(field_count + b''.join(row) for row in zip(*encoded))
+
+class CopyStream:
+    """
+    청크 스트림을 COPY FROM STDIN 입력(file 객체)으로 변환
+    
+    read()가 요청한 크기만큼 청크를 하나씩 인코딩해서 버퍼에 채우므로 청크 하나 분량만 메모리에 둡니다.
+    """
+    
+    def __init__(self, chunks, encode_chunk, header=b'', trailer=b''):
+        self._chunks = iter(chunks)
+        self._encode_chunk = encode_chunk
+        self._trailer = trailer
+        self._buffer = bytearray(header)
+        self.rows = 0
+    
+    def read(self, size=-1):
+        while self._chunks is not None and (size is None or size < 0 or len(self._buffer) < size):
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                self._buffer += self._trailer
+                self._chunks = None
+                break
+            if len(chunk):
+                self._buffer += self._encode_chunk(chunk)
+                self.rows += len(chunk)
+        
+        if size is None or size < 0:
+            size = len(self._buffer)
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return data
+
+class CopyLoader:
+    """테이블 하나에 COPY로 적재 (형식과 컬럼 타입은 처음 적재할 때 한 번만 확인)"""
+    
+    def __init__(self, cursor, table_name, columns, copy_format=None, freeze=False):
+        """freeze: COPY FREEZE (같은 트랜잭션에서 생성하거나 TRUNCATE한 테이블에만 사용 가능)"""
+        self.cursor = cursor
+        self.table_name = table_name
+        self.columns = list(columns)
+        self.copy_format = copy_format or DEFAULT_COPY_FORMAT
+        self.freeze = freeze
+        if self.copy_format not in COPY_FORMATS:
+            raise Exception(f"지원하지 않는 COPY 형식: {self.copy_format}")
+        self._encoders = None
+    
+    def _prepare(self):
+        """binary 형식이면 타겟 컬럼 타입으로 인코딩 함수 준비 (지원하지 않는 타입이 있으면 csv로 전환)"""
+        if self.copy_format != 'binary' or self._encoders is not None:
+            return
+        self.cursor.execute(f"SELECT {', '.join(self.columns)} FROM {self.table_name} WHERE 1=0")
+        type_oids = [description[1] for description in self.cursor.description]
+        self._encoders = binary_encoders(type_oids)
+        if self._encoders is None:
+            print(f"COPY BINARY로 인코딩할 수 없는 컬럼 타입이 있어 CSV로 적재합니다: {self.table_name} {type_oids}")
+            self.copy_format = 'csv'
+    
+    def copy(self, chunks):
+        """청크 스트림 전체를 COPY 한 번으로 적재 (적재한 행 수 반환)"""
+        self._prepare()
+        column_list = ', '.join(self.columns)
+        # FREEZE: 행을 처음부터 동결 상태로 기록 (이후 VACUUM이 다시 쓰지 않음)
+        freeze = ', FREEZE' if self.freeze else ''
+        if self.copy_format == 'binary':
+            encoders = self._encoders
+            stream = CopyStream(chunks, lambda chunk: encode_binary(chunk, encoders), _BINARY_HEADER, _BINARY_TRAILER)
+            sql = f"COPY {self.table_name} ({column_list}) FROM STDIN WITH (FORMAT binary{freeze})"
+        else:
+            stream = CopyStream(chunks, encode_csv)
+            sql = f"COPY {self.table_name} ({column_list}) FROM STDIN WITH (FORMAT csv, ENCODING 'UTF8'{freeze})"
+        
+        self.cursor.copy_expert(sql, stream, size=COPY_BUFFER_SIZE)
+        return stream.rows
+
+def copy_rows(cursor, table_name, columns, chunks, copy_format=None, freeze=False):
+    """청크 스트림을 COPY로 적재 (적재한 행 수 반환)"""
+    return CopyLoader(cursor, table_name, columns, copy_format, freeze).copy(chunks)
@@ -0,0 +1,172 @@
+"""
+청크 파이프라인 모듈
+
+추출(reader) -> 변환(해시/필터) -> 적재(writer) 단계를 bounded queue로 연결합니다.
+추출과 변환은 별도 스레드에서 실행되고 적재는 호출한 스레드에서 청크를 소비하므로,
+N+1번째 청크 추출이 N번째 청크 적재와 겹쳐서 진행됩니다.
+parallel=True이면 여러 소스(파티션)를 각자의 추출 스레드에서 동시에 읽어 같은 큐로 모읍니다.
+큐가 가득 차면 앞 단계가 대기하므로 메모리 사용량은 큐 크기만큼으로 제한됩니다.
+"""
+
+import queue
+import threading
+import time
+
+# 단계 사이 큐에 보관할 최대 청크 수
+DEFAULT_QUEUE_SIZE = 2
+
+_END = object()
+
+class _StageError:
+    """다른 스레드에서 발생한 예외를 소비자에게 전달하기 위한 래퍼"""
+    
+    def __init__(self, error):
+        self.error = error
+
+def _close_source(source):
+    """소스에 close()가 있으면 호출 (정리 중 오류는 무시)"""
+    close = getattr(source, 'close', None)
+    if close is not None:
+        try:
+            close()
+        except Exception:
+            pass
+
+class ChunkPipeline:
+    """추출/변환/적재 단계를 bounded queue로 연결하는 파이프라인"""
+    
+    def __init__(self, source, transform=None, queue_size=DEFAULT_QUEUE_SIZE, name='pipeline', parallel=False):
+        """
+        Args:
+            source: 청크(행 리스트 또는 ColumnBatch)를 생성하는 이터러블 (추출 스레드에서 소비)
+            transform: 청크를 받아 변환된 청크를 반환하는 함수 (빈 청크/None이면 건너뜀)
+            queue_size: 단계 사이 큐의 최대 청크 수
+            name: 스레드 이름 접두사
+            parallel: True이면 source는 청크 이터러블의 리스트이며 각각 별도 스레드에서 추출
+        """
+        self.sources = list(source) if parallel else [source]
+        self.transform = transform
+        self.queue_size = max(1, queue_size or DEFAULT_QUEUE_SIZE) * len(self.sources)
+        self.name = name
+        self.timings = {'extract': 0.0, 'transform': 0.0, 'load': 0.0}
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._remaining = len(self.sources)
+        self._threads = []
+    
+    def _put(self, target_queue, item):
+        """중단 요청을 확인하면서 큐에 넣기 (중단되면 False)"""
+        while not self._stop.is_set():
+            try:
+                target_queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def _get(self, source_queue):
+        """중단 요청을 확인하면서 큐에서 꺼내기 (중단되면 _END)"""
+        while True:
+            try:
+                return source_queue.get(timeout=0.1)
+            except queue.Empty:
+                if self._stop.is_set():
+                    return _END
+    
+    def _extract(self, source, out_queue):
+        """추출 단계: source를 읽어 큐에 넣기 (마지막으로 끝난 추출 스레드가 종료 표시)"""
+        source = iter(source)
+        elapsed = 0.0
+        try:
+            while not self._stop.is_set():
+                started = time.perf_counter()
+                try:
+                    chunk = next(source)
+                except StopIteration:
+                    break
+                finally:
+                    elapsed += time.perf_counter() - started
+                
+                if not self._put(out_queue, chunk):
+                    return
+            
+            with self._lock:
+                self._remaining -= 1
+                finished = self._remaining == 0
+            if finished:
+                self._put(out_queue, _END)
+        except BaseException as e:
+            self._put(out_queue, _StageError(e))
+        finally:
+            # 병렬 추출은 가장 오래 걸린 파티션의 시간을 추출 시간으로 기록
+            with self._lock:
+                self.timings['extract'] = max(self.timings['extract'], elapsed)
+            
+            # 소스 연결은 소스를 읽은 스레드에서 정리
+            _close_source(source)
+    
+    def _convert(self, in_queue, out_queue):
+        """변환 단계: 청크에 transform 적용"""
+        try:
+            while True:
+                item = self._get(in_queue)
+                if item is _END or isinstance(item, _StageError):
+                    self._put(out_queue, item)
+                    return
+                
+                started = time.perf_counter()
+                chunk = self.transform(item)
+                self.timings['transform'] += time.perf_counter() - started
+                
+                if chunk and not self._put(out_queue, chunk):
+                    return
+        except BaseException as e:
+            self._put(out_queue, _StageError(e))
+    
+    def _start(self):
+        """추출/변환 스레드 시작 (적재 단계가 읽을 큐 반환)"""
+        extract_queue = queue.Queue(maxsize=self.queue_size)
+        for index, source in enumerate(self.sources):
+            thread_name = f"{self.name}-extract" if len(self.sources) == 1 else f"{self.name}-extract-{index}"
+            self._threads.append(threading.Thread(
+                target=self._extract, args=(source, extract_queue), name=thread_name, daemon=True
+            ))
+        
+        if self.transform is None:
+            load_queue = extract_queue
+        else:
+            load_queue = queue.Queue(maxsize=self.queue_size)
+            self._threads.append(threading.Thread(
+                target=self._convert, args=(extract_queue, load_queue), name=f"{self.name}-transform", daemon=True
+            ))
+        
+        for thread in self._threads:
+            thread.start()
+        return load_queue
+    
+    def __iter__(self):
+        """적재 단계에서 소비할 청크를 차례로 반환 (적재 시간은 청크를 넘긴 뒤 다음 요청까지의 시간)"""
+        load_queue = self._start()
+        try:
+            while True:
+                item = self._get(load_queue)
+                if item is _END:
+                    break
+                if isinstance(item, _StageError):
+                    raise item.error
+                
+                handed_at = time.perf_counter()
+                yield item
+                self.timings['load'] += time.perf_counter() - handed_at
+        finally:
+            self.close()
+    
+    def close(self):
+        """파이프라인 중단 및 스레드 정리 (시작 전이면 소스만 닫기)"""
+        self._stop.set()
+        if not self._threads:
+            for source in self.sources:
+                _close_source(source)
+        for thread in self._threads:
+            if thread is not threading.current_thread():
+                thread.join()
@@ -0,0 +1,322 @@
+"""
+연결 풀 모듈
+
+서버 이름별로 PostgreSQL(psycopg2)/Altibase/Informix(JDBC) 연결을 재사용합니다.
+연결과 인증 비용(특히 JDBC를 쓰는 Informix)은 처음 한 번만 지불하고,
+반납된 연결은 트랜잭션을 정리한 뒤 다음 요청에 다시 빌려줍니다.
+
+- 최소/최대 연결 수: 서버 설정의 pool_min_size/pool_max_size, 없으면 환경변수 기본값
+- 유휴 연결 정리: DB_POOL_IDLE_TIMEOUT초 넘게 쓰지 않은 연결은 최소 연결 수를 남기고 닫음
+- 사전 확인(pre-ping): DB_POOL_PING_INTERVAL초 넘게 쉬었던 연결은 빌려주기 전에 유효성 확인
+
+connect_pooled()가 반환하는 연결의 close()는 실제로 닫지 않고 풀에 반납합니다.
+"""
+
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+import psycopg2
+
+try:
+    from .jvm import connect_jdbc
+except ImportError:
+    # 스크립트로 직접 실행하는 경우
+    from jvm import connect_jdbc
+
+DEFAULT_MIN_SIZE = int(os.environ.get('DB_POOL_MIN_SIZE', '1'))
+DEFAULT_MAX_SIZE = int(os.environ.get('DB_POOL_MAX_SIZE', '8'))
+DEFAULT_IDLE_TIMEOUT = float(os.environ.get('DB_POOL_IDLE_TIMEOUT', '300'))
+DEFAULT_PING_INTERVAL = float(os.environ.get('DB_POOL_PING_INTERVAL', '30'))
+DEFAULT_ACQUIRE_TIMEOUT = float(os.environ.get('DB_POOL_TIMEOUT', '60'))
+
+# JDBC 드라이버 클래스와 URL 형식
+JDBC_DRIVERS = {
+    'altibase': ('Altibase.jdbc.driver.AltibaseDriver', 'jdbc:Altibase://{host}:{port}/{database}'),
+    'informix': ('com.informix.jdbc.IfxDriver', 'jdbc:informix-sqli://{host}:{port}/{database}:NEWCODESET=EUC-KR,cp1252,819'),
+}
+
+# 풀을 다시 만들어야 하는 연결 설정 키
+_CONNECTION_KEYS = ('type', 'host', 'port', 'database', 'user', 'password')
+
+class PoolTimeoutError(Exception):
+    """최대 연결 수에 도달해 제한 시간 안에 연결을 빌리지 못함"""
+
+def open_connection(conf):
+    """서버 설정으로 새 연결 생성 (풀을 거치지 않음)"""
+    db_type = conf['type']
+    if db_type == 'postgresql':
+        return psycopg2.connect(
+            host=conf['host'],
+            port=conf['port'],
+            database=conf['database'],
+            user=conf['user'],
+            password=conf['password']
+        )
+    if db_type in JDBC_DRIVERS:
+        driver, url = JDBC_DRIVERS[db_type]
+        return connect_jdbc(driver, url.format(**conf), [conf['user'], conf['password']])
+    raise Exception(f"지원하지 않는 데이터베이스 타입: {db_type}")
+
+def _is_jdbc(conn):
+    return hasattr(conn, 'jconn')
+
+def _close_quietly(conn):
+    try:
+        conn.close()
+    except Exception:
+        pass
+
+def ping_connection(conn):
+    """연결 유효성 확인 (pre-ping)"""
+    try:
+        if _is_jdbc(conn):
+            return bool(conn.jconn.isValid(5))
+        
+        if conn.closed:
+            return False
+        cursor = conn.cursor()
+        cursor.execute("SELECT 1")
+        cursor.close()
+        conn.rollback()
+        return True
+    except Exception:
+        return False
+
+def reset_connection(conn):
+    """반납된 연결의 트랜잭션과 세션 설정을 기본값으로 되돌림 (재사용할 수 없으면 False)"""
+    try:
+        if _is_jdbc(conn):
+            jconn = conn.jconn
+            if jconn.isClosed():
+                return False
+            if not jconn.getAutoCommit():
+                jconn.rollback()
+                jconn.setAutoCommit(True)
+            return True
+        
+        if conn.closed:
+            return False
+        conn.rollback()
+        conn.autocommit = False
+        conn.readonly = None
+        conn.deferrable = None
+        return True
+    except Exception:
+        return False
+
+class PooledConnection:
+    """풀에서 빌린 연결 (close()하면 풀에 반납, 그 외 속성은 원래 연결로 전달)"""
+    
+    def __init__(self, pool, conn):
+        object.__setattr__(self, '_pool', pool)
+        object.__setattr__(self, '_conn', conn)
+    
+    def __getattr__(self, name):
+        conn = object.__getattribute__(self, '_conn')
+        if conn is None:
+            raise Exception("이미 풀에 반납된 연결입니다.")
+        return getattr(conn, name)
+    
+    def __setattr__(self, name, value):
+        setattr(self._conn, name, value)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    def close(self):
+        """풀에 반납"""
+        conn = object.__getattribute__(self, '_conn')
+        if conn is not None:
+            object.__setattr__(self, '_conn', None)
+            self._pool.release(conn)
+    
+    def invalidate(self):
+        """연결을 닫고 풀에서 제거 (오류로 상태를 알 수 없는 경우)"""
+        conn = object.__getattribute__(self, '_conn')
+        if conn is not None:
+            object.__setattr__(self, '_conn', None)
+            self._pool.release(conn, discard=True)
+    
+    def __del__(self):
+        # close()하지 않고 버려진 연결은 닫아서 풀의 사용 중 개수에서 제외
+        try:
+            self.invalidate()
+        except Exception:
+            pass
+
+class ConnectionPool:
+    """서버 하나의 연결 풀"""
+    
+    def __init__(self, name, conf, min_size=None, max_size=None,
+                 idle_timeout=DEFAULT_IDLE_TIMEOUT, ping_interval=DEFAULT_PING_INTERVAL):
+        self.name = name
+        self.conf = dict(conf)
+        self.max_size = max(1, int(max_size or DEFAULT_MAX_SIZE))
+        self.min_size = min(self.max_size, int(min_size if min_size is not None else DEFAULT_MIN_SIZE))
+        self.idle_timeout = idle_timeout
+        self.ping_interval = ping_interval
+        self._idle = deque()  # (연결, 반납 시각)
+        self._in_use = 0
+        self._closed = False
+        self._condition = threading.Condition()
+    
+    @property
+    def size(self):
+        """열려 있는 연결 수 (유휴 + 사용 중)"""
+        return len(self._idle) + self._in_use
+    
+    def _evict_idle(self):
+        """유휴 시간이 지난 연결 정리 (최소 연결 수는 유지, 잠금 안에서 호출)"""
+        now = time.monotonic()
+        expired = []
+        while self._idle and self.size > self.min_size and now - self._idle[0][1] > self.idle_timeout:
+            expired.append(self._idle.popleft()[0])
+        return expired
+    
+    def acquire(self, timeout=DEFAULT_ACQUIRE_TIMEOUT):
+        """연결 빌리기 (유휴 연결 재사용, 없으면 최대 연결 수까지 생성, 가득 차면 대기)"""
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        
+        while True:
+            with self._condition:
+                expired = self._evict_idle()
+                
+                while not self._idle and self.size >= self.max_size:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise PoolTimeoutError(
+                            f"'{self.name}' 연결 풀이 가득 찼습니다. (최대 {self.max_size}개, {timeout}초 대기)"
+                        )
+                    self._condition.wait(remaining)
+                
+                if self._idle:
+                    conn, released_at = self._idle.pop()
+                else:
+                    conn, released_at = None, None
+                self._in_use += 1
+            
+            for expired_conn in expired:
+                _close_quietly(expired_conn)
+            
+            if conn is None:
+                try:
+                    return PooledConnection(self, open_connection(self.conf))
+                except Exception:
+                    self._discarded()
+                    raise
+            
+            # 오래 쉬었던 연결은 빌려주기 전에 확인
+            if time.monotonic() - released_at <= self.ping_interval or ping_connection(conn):
+                return PooledConnection(self, conn)
+            
+            print(f"연결 풀 '{self.name}': 끊어진 연결을 버리고 다시 시도합니다.")
+            _close_quietly(conn)
+            self._discarded()
+    
+    def _discarded(self):
+        """사용 중이던 연결 하나가 없어졌음을 기록"""
+        with self._condition:
+            self._in_use -= 1
+            self._condition.notify()
+    
+    def release(self, conn, discard=False):
+        """연결 반납 (트랜잭션 정리에 실패하거나 discard면 닫음)"""
+        reusable = not discard and not self._closed and reset_connection(conn)
+        
+        with self._condition:
+            self._in_use -= 1
+            if reusable:
+                self._idle.append((conn, time.monotonic()))
+            self._condition.notify()
+        
+        if not reusable:
+            _close_quietly(conn)
+    
+    def warm_up(self):
+        """최소 연결 수만큼 미리 연결"""
+        connections = []
+        try:
+            while self.size < self.min_size:
+                connections.append(self.acquire())
+        finally:
+            for conn in connections:
+                conn.close()
+    
+    def close(self):
+        """유휴 연결을 모두 닫고 이후 반납되는 연결도 닫음"""
+        with self._condition:
+            self._closed = True
+            idle = [conn for conn, _ in self._idle]
+            self._idle.clear()
+        for conn in idle:
+            _close_quietly(conn)
+    
+    def status(self):
+        """풀 상태 정보"""
+        with self._condition:
+            return {
+                'type': self.conf.get('type'),
+                'idle': len(self._idle),
+                'in_use': self._in_use,
+                'min_size': self.min_size,
+                'max_size': self.max_size,
+            }
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+def _pool_key(conf):
+    return conf.get('name') or f"{conf['type']}://{conf['host']}:{conf['port']}/{conf['database']}"
+
+def get_pool(conf):
+    """서버 설정에 해당하는 연결 풀 (연결 설정이 바뀌었으면 새로 생성)"""
+    key = _pool_key(conf)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is not None and all(str(pool.conf.get(k)) == str(conf.get(k)) for k in _CONNECTION_KEYS):
+            return pool
+        
+        old_pool = pool
+        pool = ConnectionPool(key, conf, conf.get('pool_min_size'), conf.get('pool_max_size'))
+        _pools[key] = pool
+    
+    if old_pool is not None:
+        print(f"연결 풀 '{key}': 서버 설정이 바뀌어 풀을 다시 만듭니다.")
+        old_pool.close()
+    return pool
+
+def connect_pooled(conf, timeout=DEFAULT_ACQUIRE_TIMEOUT):
+    """풀에서 연결 빌리기 (close()하면 반납)"""
+    return get_pool(conf).acquire(timeout)
+
+@contextmanager
+def pooled_connection(conf, timeout=DEFAULT_ACQUIRE_TIMEOUT):
+    """with 문으로 연결 빌리기 (오류가 나면 연결을 버림)"""
+    conn = connect_pooled(conf, timeout)
+    try:
+        yield conn
+    except Exception:
+        conn.invalidate()
+        raise
+    finally:
+        conn.close()
+
+def pool_status():
+    """모든 풀의 상태 정보"""
+    with _pools_lock:
+        pools = dict(_pools)
+    return {key: pool.status() for key, pool in pools.items()}
+
+def close_all_pools():
+    """모든 풀 닫기"""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
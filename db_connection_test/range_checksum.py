@@ -0,0 +1,188 @@
+"""
+범위 체크섬 모듈
+
+정수 키 컬럼을 고정 폭 구간으로 나누고, 구간별 행 수와 행 체크섬 합계를 소스 DB와 타겟 DB 안에서
+각각 GROUP BY 한 번으로 계산합니다. 네트워크로는 구간 수만큼의 작은 행만 전송됩니다.
+두 쪽의 구간별 값을 비교해서 달라진 구간만 찾고, 이웃한 구간은 하나의 키 범위로 합칩니다.
+타겟을 직접 계산하므로 다른 곳에서 타겟을 수정했거나 적재가 중간에 실패한 구간도 다시 비교됩니다.
+체크섬이 합계이므로 상위 범위의 값은 하위 구간 값의 합과 같습니다. 그래서 트리를 위에서부터
+범위마다 다시 조회하며 내려가지 않고, 말단 구간을 한 번에 계산해 비교합니다. (양쪽 모두 스캔은 한 번)
+
+행 체크섬:
+    PostgreSQL: 컬럼마다 텍스트로 바꾼 행 값의 md5 앞 64비트
+        (타겟은 값을 TEXT 컬럼에 저장하므로 같은 값이면 타입이 있는 소스 행과 체크섬이 같음,
+         텍스트 표현이 다르게 저장된 값은 매번 다른 구간으로 잡혀 키 비교로 확인)
+    Altibase/Informix: 행 전체를 해시하는 공통 함수가 없어 지원하지 않음
+        (값의 길이 등으로 대신하면 같은 길이로 바뀐 값을 놓치므로 키 비교 전략 사용)
+
+구간 파일 (RANGE_CHECKSUM_DIR/job_<작업 ID>.json): 키 컬럼, 기준값, 구간 폭, 마지막으로 계산한 소스 구간별 [행 수, 체크섬]
+(구간 기준값/폭을 실행마다 바꾸지 않기 위해 기록)
+"""
+
+import json
+import os
+
+# 구간 파일 기본 폴더 (환경변수 RANGE_CHECKSUM_DIR로 변경 가능)
+DEFAULT_INDEX_DIR = os.environ.get(
+    'RANGE_CHECKSUM_DIR',
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'range_checksum')
+)
+
+# 구간 하나의 목표 행 수 (작을수록 변경 행 주변에서 전송하는 행이 줄고 구간 파일이 커짐)
+LEAF_ROWS = int(os.environ.get('RANGE_CHECKSUM_LEAF_ROWS', '1000'))
+MAX_LEAVES = 100000
+
+# 조건절에 넣는 최대 키 범위 수 (넘으면 간격이 가까운 범위끼리 합침)
+MAX_PREDICATE_RANGES = 200
+
+# 행 체크섬을 DB 안에서 계산할 수 있는 DB 타입
+RANGE_CHECKSUM_DB_TYPES = ('postgresql',)
+
+def row_checksum_sql(db_type, columns, alias):
+    """행 하나의 체크섬 SQL 식 (alias는 원본 쿼리를 감싼 별칭, 지원하지 않는 DB면 예외)"""
+    if db_type not in RANGE_CHECKSUM_DB_TYPES:
+        raise Exception(f"범위 체크섬 전략은 {db_type} DB를 지원하지 않습니다. "
+                        f"(행 해시를 DB 안에서 계산할 수 없으므로 키 비교 전략을 사용하세요)")
+    row_text = f"ROW({', '.join(f'{alias}.{column}::text' for column in columns)})::text"
+    return f"('x' || substr(md5({row_text}), 1, 16))::bit(64)::bigint"
+
+def bucket_query(query, key_column, base, width, db_type, columns):
+    """
+    구간별 (구간 번호, 행 수, 체크섬 합계)를 계산하는 쿼리
+    
+    구간 번호는 TRUNC((키 - 기준값) / 폭)이며, 기준값보다 작은 키는 0번 구간에 포함됩니다.
+    (큰 쪽은 제한하지 않으므로 키가 늘어나면 구간도 늘어남)
+    소스와 타겟에 같은 columns 순서로 실행해야 두 쪽의 체크섬을 비교할 수 있습니다.
+    """
+    bucket = f"CASE WHEN {key_column} < {base} THEN 0 ELSE TRUNC(({key_column} - {base}) / {width}, 0) END"
+    return f"""
+        SELECT bucket_no, COUNT(*), SUM(row_checksum) FROM (
+            SELECT {bucket} AS bucket_no, {row_checksum_sql(db_type, columns, 'range_src')} AS row_checksum
+            FROM ({query}) range_src
+        ) range_buckets
+        GROUP BY bucket_no
+    """
+
+class RangeChecksumIndex:
+    """작업 하나의 구간별 체크섬"""
+    
+    def __init__(self, path):
+        self.path = path
+        self.key_column = None
+        self.base = 0
+        self.width = 1
+        self.leaves = {}  # 구간 번호 -> (행 수, 체크섬 문자열)
+        self._pending = None
+    
+    @classmethod
+    def for_job(cls, job_id, index_dir=None):
+        """작업 ID의 구간 체크섬 (파일은 load()/save() 때 읽거나 씀)"""
+        index_dir = index_dir or DEFAULT_INDEX_DIR
+        os.makedirs(index_dir, exist_ok=True)
+        return cls(os.path.join(index_dir, f"job_{job_id}.json"))
+    
+    def load(self):
+        """구간 파일 읽기 (없거나 손상되었으면 False)"""
+        if not os.path.exists(self.path):
+            return False
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.key_column = data['key_column']
+            self.base = int(data['base'])
+            self.width = int(data['width'])
+            self.leaves = {int(bucket): (int(count), str(checksum))
+                           for bucket, (count, checksum) in data['leaves'].items()}
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"범위 체크섬 파일을 읽을 수 없습니다: {self.path} ({e})")
+            return False
+        return True
+    
+    def plan(self, key_column, min_value, max_value, row_count):
+        """키 범위와 행 수로 구간 기준값/폭을 새로 정함 (기록된 구간은 비움)"""
+        self.key_column = key_column
+        self.leaves = {}
+        if min_value is None or max_value is None:
+            self.base, self.width = 0, 1
+            return
+        
+        num_leaves = max(1, min(MAX_LEAVES, row_count // max(1, LEAF_ROWS)))
+        self.base = int(min_value)
+        self.width = max(1, -(-(int(max_value) - self.base + 1) // num_leaves))
+        print(f"범위 체크섬 구간: {key_column} {self.base}부터 폭 {self.width} (약 {num_leaves}개)")
+    
+    def compare(self, buckets, target_buckets=None):
+        """
+        소스에서 계산한 구간별 값을 타겟에서 계산한 값(없으면 기록된 값)과 비교 (save() 때 기록할 값으로 보관)
+        
+        Args:
+            buckets: 소스의 (구간 번호, 행 수, 체크섬 합계) 행들
+            target_buckets: 타겟의 (구간 번호, 행 수, 체크섬 합계) 행들
+        
+        Returns:
+            list: 값이 다른 구간 번호 (정렬됨, 한쪽에만 있는 구간 포함)
+        """
+        current = self._leaves(buckets)
+        self._pending = current
+        other = self.leaves if target_buckets is None else self._leaves(target_buckets)
+        return sorted(bucket for bucket in set(current) | set(other)
+                      if current.get(bucket) != other.get(bucket))
+    
+    @staticmethod
+    def _leaves(buckets):
+        return {int(bucket): (int(count), str(int(checksum or 0))) for bucket, count, checksum in buckets}
+    
+    def ranges(self, buckets):
+        """정렬된 구간 번호를 연속 범위 [(시작, 끝)]로 합침 (많으면 간격이 가까운 범위끼리 더 합침)"""
+        ranges = []
+        for bucket in buckets:
+            if ranges and ranges[-1][1] + 1 == bucket:
+                ranges[-1][1] = bucket
+            else:
+                ranges.append([bucket, bucket])
+        
+        if len(ranges) > MAX_PREDICATE_RANGES:
+            gaps = sorted(range(len(ranges) - 1), key=lambda i: ranges[i + 1][0] - ranges[i][1])
+            merge_after = set(gaps[:len(ranges) - MAX_PREDICATE_RANGES])
+            merged = [ranges[0]]
+            for i in range(1, len(ranges)):
+                if i - 1 in merge_after:
+                    merged[-1][1] = ranges[i][1]
+                else:
+                    merged.append(ranges[i])
+            ranges = merged
+        return [tuple(r) for r in ranges]
+    
+    def predicate(self, ranges):
+        """키 범위 목록의 WHERE 조건 (범위가 없으면 항상 거짓)"""
+        if not ranges:
+            return "1=0"
+        conditions = []
+        for start, end in ranges:
+            upper = f"{self.key_column} < {self.base + (end + 1) * self.width}"
+            if start == 0:
+                # 0번 구간은 기준값보다 작은 키도 포함
+                conditions.append(f"({upper})")
+            else:
+                conditions.append(f"({self.key_column} >= {self.base + start * self.width} AND {upper})")
+        return ' OR '.join(conditions)
+    
+    def save(self):
+        """compare()로 계산한 값을 기록 (적재가 성공한 뒤 호출, 임시 파일에 쓴 뒤 교체)"""
+        if self._pending is None:
+            return
+        self.leaves, self._pending = self._pending, None
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'key_column': self.key_column,
+                'base': self.base,
+                'width': self.width,
+                'leaves': {str(bucket): [count, checksum] for bucket, (count, checksum) in self.leaves.items()},
+            }, f)
+        os.replace(tmp_path, self.path)
+    
+    def delete(self):
+        """구간 파일 삭제"""
+        if os.path.exists(self.path):
+            os.remove(self.path)
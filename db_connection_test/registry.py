@@ -0,0 +1,98 @@
+"""
+서버 설정 레지스트리 모듈
+
+db_servers.ini(또는 애플리케이션의 ServerConfig 테이블)에서 읽은 서버 설정을 메모리에 보관합니다.
+설정 파일은 작업 디렉토리와 관계없이 절대 경로로 읽고, 처음 조회할 때 한 번만 파싱합니다.
+서버가 추가/수정/삭제되면 update()로 새 스냅샷을 통째로 교체하고 버전을 올립니다.
+조회는 현재 스냅샷을 참조만 하므로 잠금 없이 여러 스레드에서 동시에 호출할 수 있습니다.
+"""
+
+import configparser
+import os
+import threading
+
+# 기본 설정 파일 경로 (환경변수 DB_SERVERS_INI로 변경 가능)
+DEFAULT_CONFIG_FILE = os.environ.get(
+    'DB_SERVERS_INI', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'db_servers.ini')
+)
+
+def _optional_int(value):
+    if value is None or value == '':
+        return None
+    return int(value)
+
+def make_server_conf(server_name, values):
+    """ini 섹션 또는 딕셔너리를 서버 설정 딕셔너리로 변환"""
+    return {
+        "name": server_name,
+        "type": values["type"],
+        "host": values["host"],
+        "port": str(values["port"]),
+        "database": values["database"],
+        "user": values["user"],
+        "password": values["password"],
+        # 연결 풀 크기 (설정이 없으면 풀 기본값 사용)
+        "pool_min_size": _optional_int(values.get("pool_min_size")),
+        "pool_max_size": _optional_int(values.get("pool_max_size"))
+    }
+
+class ServerRegistry:
+    """서버 이름별 설정을 보관하는 레지스트리"""
+    
+    def __init__(self, config_file=None):
+        self.config_file = config_file or DEFAULT_CONFIG_FILE
+        self._lock = threading.Lock()
+        self._version = 0
+        self._snapshot = None  # (버전, {서버 이름: 설정}), 교체만 하고 수정하지 않음
+    
+    @property
+    def version(self):
+        """설정이 바뀔 때마다 증가하는 버전"""
+        return self._version
+    
+    def _replace(self, servers):
+        """새 스냅샷으로 교체 (잠금 안에서 호출)"""
+        self._version += 1
+        self._snapshot = (self._version, servers)
+        return self._snapshot
+    
+    def reload(self):
+        """설정 파일을 다시 읽어 스냅샷 교체"""
+        config = configparser.ConfigParser()
+        config.read(self.config_file)
+        servers = {name: make_server_conf(name, config[name]) for name in config.sections()}
+        
+        with self._lock:
+            return self._replace(servers)
+    
+    def update(self, servers):
+        """서버 설정 전체를 교체 (servers: {서버 이름: ini 섹션 또는 딕셔너리})"""
+        servers = {name: make_server_conf(name, values) for name, values in servers.items()}
+        with self._lock:
+            return self._replace(servers)
+    
+    def invalidate(self):
+        """다음 조회 때 설정 파일을 다시 읽도록 표시"""
+        with self._lock:
+            self._version += 1
+            self._snapshot = None
+    
+    def _current(self):
+        snapshot = self._snapshot
+        if snapshot is None:
+            snapshot = self.reload()
+        return snapshot[1]
+    
+    def get(self, server_name):
+        """서버 설정 조회 (호출한 쪽에서 수정해도 되도록 복사본 반환)"""
+        conf = self._current().get(server_name)
+        if conf is None:
+            raise Exception(f"서버 '{server_name}' 설정이 없습니다.")
+        return dict(conf)
+    
+    def names(self):
+        """등록된 서버 이름 목록"""
+        return list(self._current())
+
+# 프로세스 전체에서 공유하는 레지스트리
+server_registry = ServerRegistry()
@@ -0,0 +1,157 @@
+"""
+섀도 테이블 교체 모듈
+
+전체 동기화에서 DELETE 후 다시 INSERT하는 대신, 라이브 테이블과 같은 컬럼의 섀도 테이블(인덱스 없음)에
+적재하고 인덱스를 만든 뒤 이름을 바꿔 교체합니다. 적재하는 동안 라이브 테이블은 그대로 읽을 수 있고,
+PostgreSQL에는 삭제된 행(dead tuple)이 남지 않습니다. 교체된 기존 테이블은 커밋 후 별도 스레드에서 삭제합니다.
+
+- PostgreSQL: 교체(테이블/인덱스 이름 변경, 시퀀스 소유자 이동)가 적재와 같은 트랜잭션으로 커밋되므로
+  읽는 쪽은 이전 테이블 또는 새 테이블만 봅니다.
+- Informix: 인덱스 정보는 JDBC DatabaseMetaData로 읽고, 이름 변경은 DDL로 연달아 실행합니다.
+  (로그 모드 데이터베이스에서는 DDL도 트랜잭션에 포함되어 함께 커밋)
+- Altibase: DDL마다 커밋되어 두 이름 변경 사이에 테이블이 보이지 않는 순간이 생기고,
+  테이블 잠금도 DDL 커밋과 함께 풀려 막을 수 없으므로 지원하지 않습니다.
+
+인덱스는 교체 전까지 임시 이름(<원래 이름>_shadow)으로 만들고, 교체할 때 기존 테이블의 인덱스를
+<원래 이름>_old_<시각>으로 바꾼 뒤 원래 이름을 넘겨받으므로 인덱스 이름이 실행마다 바뀌지 않습니다.
+"""
+
+import threading
+import time
+
+try:
+    from .pool import pooled_connection
+    from .table_indexes import index_create_sql, list_indexes
+except ImportError:
+    from pool import pooled_connection
+    from table_indexes import index_create_sql, list_indexes
+
+# 교체를 한 트랜잭션으로 커밋할 수 있는 DB
+SWAP_DB_TYPES = ('postgresql', 'informix')
+
+# 식별자 최대 길이 (PostgreSQL 기준, 다른 DB도 이 길이 안에서 이름을 만듦)
+MAX_IDENTIFIER_LENGTH = 63
+
+def suffixed_name(name, suffix):
+    """이름 뒤에 접미사를 붙이되 식별자 길이 제한을 넘으면 앞부분을 잘라냄"""
+    return name[:MAX_IDENTIFIER_LENGTH - len(suffix)] + suffix
+
+class ShadowTable:
+    """라이브 테이블 하나의 섀도 테이블 (create -> 적재 -> build_indexes -> swap -> drop_retired_async)"""
+    
+    def __init__(self, db_type, cursor, table_name):
+        """
+        Args:
+            db_type: SWAP_DB_TYPES 중 하나 ('postgresql', 'informix')
+            cursor: PostgreSQL 커서 또는 JDBC Statement (java.sql.Statement)
+            table_name: 교체할 라이브 테이블
+        """
+        if db_type not in SWAP_DB_TYPES:
+            raise Exception(f"{db_type}은(는) 테이블 이름 변경이 바로 커밋되어 섀도 테이블 교체를 지원하지 않습니다. "
+                            f"(전체 동기화 방식을 삭제 후 적재로 바꾸세요)")
+        self.db_type = db_type
+        self.cursor = cursor
+        self.table_name = table_name
+        self.shadow_name = suffixed_name(table_name, '_shadow')
+        self.retired_suffix = f"_old_{int(time.time())}"
+        self.retired_name = suffixed_name(table_name, self.retired_suffix)
+        self._indexes = []  # (원래 이름, 섀도 인덱스 이름)
+        self._sequences = []  # (컬럼, 시퀀스) - PostgreSQL SERIAL 컬럼
+        self.swapped = False
+    
+    def _execute(self, sql):
+        self.cursor.execute(sql)
+    
+    def create(self):
+        """이전 실행에서 남은 섀도 테이블을 지우고 라이브 테이블과 같은 컬럼으로 새로 생성 (인덱스 없음)"""
+        if self.db_type == 'postgresql':
+            self._execute(f"DROP TABLE IF EXISTS {self.shadow_name}")
+            # 기본값(SERIAL의 nextval 포함)과 NOT NULL만 복사하고 인덱스/제약은 적재 후에 생성
+            self._execute(f"CREATE TABLE {self.shadow_name} (LIKE {self.table_name} INCLUDING DEFAULTS)")
+            self.cursor.execute("""
+                SELECT a.attname, pg_get_serial_sequence(%s, a.attname)
+                FROM pg_attribute a
+                WHERE a.attrelid = %s::regclass AND a.attnum > 0 AND NOT a.attisdropped
+            """, (self.table_name, self.table_name))
+            self._sequences = [(column, sequence) for column, sequence in self.cursor.fetchall() if sequence]
+        else:
+            if self._table_exists(self.shadow_name):
+                self._execute(f"DROP TABLE {self.shadow_name}")
+            self._execute(f"CREATE TABLE {self.shadow_name} AS SELECT * FROM {self.table_name} WHERE 1=0")
+        print(f"섀도 테이블 생성: {self.shadow_name}")
+    
+    def _table_exists(self, table_name):
+        """JDBC: 테이블 존재 여부 (있는 테이블의 삭제 오류는 무시하지 않도록 조회로 먼저 확인)"""
+        try:
+            self.cursor.executeQuery(f"SELECT 1 FROM {table_name} WHERE 1=0").close()
+            return True
+        except Exception:
+            return False
+    
+    def build_indexes(self):
+        """라이브 테이블의 기본 키/인덱스를 섀도 테이블에 임시 이름으로 생성 (적재가 끝난 뒤 호출)"""
+        statements = []
+        for index in list_indexes(self.db_type, self.cursor, self.table_name):
+            shadow_index = suffixed_name(index['name'], '_shadow')
+            statements.append(index_create_sql(self.db_type, index, self.shadow_name, shadow_index))
+            if self.db_type == 'postgresql' or not index['primary']:
+                # JDBC 기본 키는 DB가 이름을 정하므로 이름을 바꾸지 않음
+                self._indexes.append((index['name'], shadow_index))
+        
+        started = time.time()
+        for sql in statements:
+            self._execute(sql)
+        print(f"섀도 테이블 인덱스 {len(statements)}개 생성 완료: {time.time() - started:.2f}초")
+    
+    def _rename_table(self, old_name, new_name):
+        if self.db_type == 'informix':
+            self._execute(f"RENAME TABLE {old_name} TO {new_name}")
+        else:
+            self._execute(f"ALTER TABLE {old_name} RENAME TO {new_name}")
+    
+    def _rename_index(self, old_name, new_name):
+        if self.db_type == 'informix':
+            self._execute(f"RENAME INDEX {old_name} TO {new_name}")
+        else:
+            self._execute(f"ALTER INDEX {old_name} RENAME TO {new_name}")
+    
+    def swap(self):
+        """라이브 테이블을 기존 테이블 이름으로 바꾸고 섀도 테이블을 라이브 이름으로 교체 (커밋은 호출한 쪽에서)"""
+        self._rename_table(self.table_name, self.retired_name)
+        for index_name, shadow_index in self._indexes:
+            self._rename_index(index_name, suffixed_name(index_name, self.retired_suffix))
+            self._rename_index(shadow_index, index_name)
+        self._rename_table(self.shadow_name, self.table_name)
+        for column, sequence in self._sequences:
+            # 기존 테이블을 삭제해도 시퀀스가 함께 삭제되지 않도록 새 테이블로 소유자 이동
+            self._execute(f"ALTER SEQUENCE {sequence} OWNED BY {self.table_name}.{column}")
+        self.swapped = True
+        print(f"테이블 교체 완료: {self.shadow_name} -> {self.table_name} (기존 테이블: {self.retired_name})")
+    
+    def drop_retired_async(self, conf):
+        """교체된 기존 테이블을 별도 스레드에서 삭제 (교체가 커밋된 뒤 호출)"""
+        if not self.swapped:
+            return None
+        thread = threading.Thread(target=drop_table, args=(conf, self.retired_name),
+                                  name=f"drop-{self.retired_name}", daemon=True)
+        thread.start()
+        return thread
+
+def drop_table(conf, table_name):
+    """테이블 삭제 (실패하면 로그만 남기고 다음 실행에 영향을 주지 않음)"""
+    try:
+        with pooled_connection(conf) as conn:
+            if conf['type'] == 'postgresql':
+                cursor = conn.cursor()
+                cursor.execute(f"DROP TABLE IF EXISTS {table_name}")
+                conn.commit()
+            else:
+                stmt = conn.jconn.createStatement()
+                try:
+                    stmt.execute(f"DROP TABLE {table_name}")
+                finally:
+                    stmt.close()
+                conn.jconn.commit()
+        print(f"기존 테이블 삭제 완료: {table_name}")
+    except Exception as e:
+        print(f"기존 테이블 삭제 실패: {table_name} ({e})")
@@ -0,0 +1,364 @@
+"""
+테이블 인덱스/통계 모듈
+
+타겟 테이블의 기본 키/인덱스 정의를 읽어 다른 테이블(섀도 테이블)에 다시 만들거나,
+대량 적재 전에 보조 인덱스를 삭제했다가 적재 후 다시 만드는 기능과 적재 후 통계 갱신을 제공합니다.
+
+- PostgreSQL: pg_index/pg_constraint (인덱스 정의는 pg_get_indexdef의 USING 이후를 재사용)
+- Altibase/Informix: JDBC DatabaseMetaData (getPrimaryKeys/getIndexInfo)
+
+대량 적재 기준 (환경변수):
+    INDEX_DEFER_MIN_ROWS: 예상 적재 행 수가 이 값 이상이면 보조 인덱스를 적재 후에 생성 (기본값 1000000, 0이면 사용 안 함)
+    ANALYZE_MIN_ROWS: 적재한 행 수가 이 값 이상이면 적재 후 통계 갱신 (기본값 10000, 0이면 사용 안 함)
+"""
+
+import os
+import re
+import time
+
+try:
+    from .pool import pooled_connection
+except ImportError:
+    from pool import pooled_connection
+
+INDEX_DEFER_MIN_ROWS = int(os.environ.get('INDEX_DEFER_MIN_ROWS', '1000000'))
+ANALYZE_MIN_ROWS = int(os.environ.get('ANALYZE_MIN_ROWS', '10000'))
+# Altibase/Informix 타겟에서 적재 동안 삭제한 인덱스의 생성 SQL (비정상 종료된 실행의 인덱스를 다음 실행이 복구)
+DEFERRED_INDEX_TABLE = 'fs_deferred_index'
+
+def list_indexes(db_type, cursor, table_name):
+    """
+    테이블의 기본 키/인덱스 목록
+    
+    Args:
+        db_type: 'postgresql', 'altibase', 'informix'
+        cursor: PostgreSQL 커서 또는 JDBC Statement (java.sql.Statement)
+        table_name: 테이블명
+    
+    Returns:
+        list: 인덱스 정보 딕셔너리
+            name: 인덱스 이름 (기본 키/유니크 제약은 제약 이름)
+            unique: 유니크 여부
+            constraint: 기본 키/유니크 제약이 만든 인덱스인지 여부 (보조 인덱스가 아님)
+            definition: PostgreSQL은 제약 정의 또는 USING 이후의 인덱스 정의, JDBC는 컬럼 목록
+    """
+    if db_type == 'postgresql':
+        return _postgresql_indexes(cursor, table_name)
+    return _jdbc_indexes(cursor, table_name)
+
+def _postgresql_indexes(cursor, table_name):
+    cursor.execute("""
+        SELECT i.relname, x.indisunique, pg_get_indexdef(i.oid), c.contype, pg_get_constraintdef(c.oid)
+        FROM pg_index x
+        JOIN pg_class i ON i.oid = x.indexrelid
+        LEFT JOIN pg_constraint c ON c.conindid = x.indexrelid AND c.conrelid = x.indrelid
+            AND c.contype IN ('p', 'u')
+        WHERE x.indrelid = %s::regclass
+    """, (table_name,))
+    
+    indexes = []
+    for index_name, unique, index_def, constraint_type, constraint_def in cursor.fetchall():
+        if constraint_type is not None:
+            indexes.append({'name': index_name, 'unique': True, 'constraint': True,
+                            'primary': constraint_type == 'p', 'definition': constraint_def})
+        else:
+            # "CREATE INDEX 이름 ON 테이블 USING ..."에서 USING 이후(방식, 컬럼, 조건)만 재사용
+            indexes.append({'name': index_name, 'unique': unique, 'constraint': False,
+                            'primary': False, 'definition': index_def.split(' USING ', 1)[1]})
+    return indexes
+
+def _jdbc_indexes(stmt, table_name):
+    meta_data = stmt.getConnection().getMetaData()
+    # 카탈로그에 저장된 대소문자로 조회 (Altibase는 대문자, Informix는 소문자)
+    for name in (table_name, table_name.upper(), table_name.lower()):
+        primary_key = {}
+        primary_key_name = None
+        result_set = meta_data.getPrimaryKeys(None, None, name)
+        while result_set.next():
+            primary_key[int(result_set.getShort('KEY_SEQ'))] = str(result_set.getString('COLUMN_NAME'))
+            primary_key_name = result_set.getString('PK_NAME')
+        result_set.close()
+        
+        index_columns = {}
+        result_set = meta_data.getIndexInfo(None, None, name, False, False)
+        while result_set.next():
+            index_name = result_set.getString('INDEX_NAME')
+            column = result_set.getString('COLUMN_NAME')
+            if index_name is None or column is None:
+                continue  # 테이블 통계 행
+            index = index_columns.setdefault(str(index_name), {'unique': not result_set.getBoolean('NON_UNIQUE'),
+                                                               'columns': {}})
+            order = ' DESC' if result_set.getString('ASC_OR_DESC') == 'D' else ''
+            index['columns'][int(result_set.getShort('ORDINAL_POSITION'))] = f"{column}{order}"
+        result_set.close()
+        if primary_key or index_columns:
+            break
+    
+    indexes = []
+    primary_columns = [primary_key[i] for i in sorted(primary_key)]
+    if primary_columns:
+        indexes.append({'name': str(primary_key_name), 'unique': True, 'constraint': True,
+                        'primary': True, 'definition': primary_columns})
+    for index_name, index in index_columns.items():
+        columns = [index['columns'][i] for i in sorted(index['columns'])]
+        if index_name == primary_key_name or (index['unique'] and
+                                              [c.lower() for c in columns] == [c.lower() for c in primary_columns]):
+            continue  # 기본 키가 만든 인덱스
+        indexes.append({'name': index_name, 'unique': index['unique'], 'constraint': False,
+                        'primary': False, 'definition': columns})
+    return indexes
+
+def _index_columns(db_type, index):
+    """list_indexes()의 인덱스가 포함하는 컬럼명 (소문자, 식/부분 인덱스는 빈 리스트)"""
+    definition = index['definition']
+    if db_type == 'postgresql':
+        # "btree (a, b DESC)", "PRIMARY KEY (a, b)"에서 첫 괄호의 컬럼 목록만 사용
+        match = re.match(r'[^(]*\(([^()]*)\)', definition)
+        if not match or ' WHERE ' in definition:
+            return []
+        definition = match.group(1).split(',')
+    return [part.strip().split(' ')[0].strip('"').lower() for part in definition]
+
+def find_index(db_type, cursor, table_name, columns, unique=False):
+    """columns(순서 무관)로 된 인덱스 이름 (unique면 기본 키/유니크 인덱스만, 없으면 None)"""
+    wanted = sorted(column.lower() for column in columns)
+    for index in list_indexes(db_type, cursor, table_name):
+        if (index['unique'] or not unique) and sorted(_index_columns(db_type, index)) == wanted:
+            return index['name']
+    return None
+
+def unique_key_index(db_type, cursor, table_name, columns):
+    """columns(순서 무관)를 키로 하는 기본 키/유니크 인덱스 이름 (없으면 None)"""
+    return find_index(db_type, cursor, table_name, columns, unique=True)
+
+def find_duplicate_key(db_type, cursor, table_name, columns):
+    """columns 값이 같은 행이 여러 개인 키 하나 (없으면 None)"""
+    key_list = ', '.join(columns)
+    query = f"SELECT {key_list} FROM {table_name} GROUP BY {key_list} HAVING COUNT(*) > 1"
+    if db_type == 'postgresql':
+        cursor.execute(query + " LIMIT 1")
+        row = cursor.fetchone()
+        return tuple(row) if row else None
+    
+    result_set = cursor.executeQuery(query)
+    try:
+        if not result_set.next():
+            return None
+        return tuple(str(result_set.getString(i + 1)) for i in range(len(columns)))
+    finally:
+        result_set.close()
+
+def ensure_unique_key_index(db_type, cursor, table_name, columns, index_name):
+    """
+    columns의 유니크 인덱스가 없으면 생성 (생성했으면 True)
+    
+    타겟에 이미 키가 같은 행이 여러 개 있으면 인덱스를 만들 수 없고, 키 기준 업서트/MERGE가
+    중복 행을 모두 갱신하므로 인덱스를 만들기 전에 확인해서 중복 키를 알려주는 예외를 발생시킵니다.
+    """
+    if unique_key_index(db_type, cursor, table_name, columns):
+        return False
+    
+    key_list = ', '.join(columns)
+    duplicate = find_duplicate_key(db_type, cursor, table_name, columns)
+    if duplicate is not None:
+        raise Exception(f"타겟 테이블 {table_name}에 업서트 키({key_list})가 같은 행이 여러 개 있습니다: {duplicate} "
+                        f"(중복 행을 정리한 뒤 다시 실행하세요)")
+    cursor.execute(f"CREATE UNIQUE INDEX {index_name} ON {table_name} ({key_list})")
+    print(f"업서트 키 인덱스 생성: {index_name} ({key_list})")
+    return True
+
+def index_create_sql(db_type, index, table_name, index_name=None, concurrently=False):
+    """list_indexes()의 인덱스를 table_name에 index_name(기본값은 원래 이름)으로 만드는 SQL"""
+    index_name = index_name or index['name']
+    unique = 'UNIQUE ' if index['unique'] else ''
+    if db_type == 'postgresql':
+        if index['constraint']:
+            # 기본 키/유니크 제약은 제약으로 생성 (인덱스 이름 = 제약 이름)
+            return f"ALTER TABLE {table_name} ADD CONSTRAINT {index_name} {index['definition']}"
+        concurrent = 'CONCURRENTLY ' if concurrently else ''
+        return f"CREATE {unique}INDEX {concurrent}{index_name} ON {table_name} USING {index['definition']}"
+    
+    if index['primary']:
+        return f"ALTER TABLE {table_name} ADD PRIMARY KEY ({', '.join(index['definition'])})"
+    return f"CREATE {unique}INDEX {index_name} ON {table_name} ({', '.join(index['definition'])})"
+
+def _ensure_deferred_index_table(stmt):
+    """DEFERRED_INDEX_TABLE이 없으면 생성 (JDBC, 생성했으면 커밋)"""
+    try:
+        stmt.executeQuery(f"SELECT index_name FROM {DEFERRED_INDEX_TABLE} WHERE 1=0").close()
+    except Exception:
+        stmt.execute(f"""
+            CREATE TABLE {DEFERRED_INDEX_TABLE} (
+                table_name VARCHAR(128) NOT NULL,
+                index_name VARCHAR(128) NOT NULL,
+                create_sql VARCHAR(1000) NOT NULL,
+                dropped_at VARCHAR(40)
+            )
+        """)
+        stmt.getConnection().commit()
+
+def _update_deferred_index(stmt, sql, params):
+    prep_stmt = stmt.getConnection().prepareStatement(sql)
+    try:
+        for i, value in enumerate(params):
+            prep_stmt.setString(i + 1, value)
+        prep_stmt.executeUpdate()
+    finally:
+        prep_stmt.close()
+
+def _forget_deferred_index(stmt, table_name, index_name):
+    _update_deferred_index(stmt, f"DELETE FROM {DEFERRED_INDEX_TABLE} WHERE table_name = ? AND index_name = ?",
+                           [table_name, index_name])
+
+def restore_deferred_indexes(db_type, stmt, table_name):
+    """
+    이전 실행이 적재 중에 비정상 종료되어 다시 만들지 못한 인덱스 복구 (Altibase/Informix, 복구한 인덱스 이름 반환)
+    
+    적재 연결(자동 커밋 해제)에서 적재 전에 호출하며 인덱스마다 커밋합니다.
+    복구하지 못한 인덱스는 기록을 남겨 다음 실행이 다시 시도합니다.
+    """
+    try:
+        result_set = stmt.executeQuery(f"SELECT index_name, create_sql FROM {DEFERRED_INDEX_TABLE} "
+                                       f"WHERE table_name = '{table_name}'")
+    except Exception:
+        stmt.getConnection().rollback()
+        return []  # 기록 테이블이 없으면 삭제한 적도 없음
+    try:
+        pending = []
+        while result_set.next():
+            pending.append((str(result_set.getString(1)), str(result_set.getString(2))))
+    finally:
+        result_set.close()
+    if not pending:
+        return []
+    
+    existing = {index['name'].lower() for index in list_indexes(db_type, stmt, table_name)}
+    restored = []
+    for index_name, create_sql in pending:
+        try:
+            if index_name.lower() not in existing:
+                # 이미 있으면 재생성은 끝났고 기록만 남은 것
+                stmt.execute(create_sql)
+                restored.append(index_name)
+            _forget_deferred_index(stmt, table_name, index_name)
+            stmt.getConnection().commit()
+        except Exception as e:
+            stmt.getConnection().rollback()
+            print(f"이전 실행에서 삭제된 인덱스 복구 실패: {index_name} ({e})")
+    if restored:
+        print(f"이전 실행에서 삭제된 인덱스 복구: {', '.join(restored)}")
+    return restored
+
+class IndexDeferral:
+    """
+    대량 적재 동안 보조 인덱스 제외
+    
+    기본 키/유니크 인덱스는 중복 방지와 업서트에 필요하므로 남기고, 일반 인덱스만 삭제합니다.
+    PostgreSQL은 삭제와 재생성을 적재와 같은 트랜잭션에서 실행하므로(rebuild_in_transaction())
+    적재가 실패하거나 프로세스가 죽으면 인덱스 삭제도 함께 롤백됩니다.
+    (DROP INDEX가 테이블을 잠그므로 TRUNCATE와 같이 읽기도 커밋까지 대기)
+    Altibase/Informix는 DDL이 바로 커밋되므로 인덱스마다 생성 SQL을 DEFERRED_INDEX_TABLE에 기록한 뒤 삭제하고,
+    rebuild()가 적재가 커밋된 뒤(또는 실패한 뒤) 새 연결에서 다시 만들며 기록을 지웁니다.
+    남은 기록은 다음 실행이 restore_deferred_indexes()로 복구합니다.
+    다시 만들지 못한 인덱스는 failed에 (이름, 오류)로 남아 호출한 쪽이 작업 결과에 기록합니다.
+    """
+    
+    def __init__(self, db_type, table_name):
+        self.db_type = db_type
+        self.table_name = table_name
+        self.dropped = []
+        self.failed = []
+    
+    def drop(self, cursor):
+        """보조 인덱스 삭제 (PostgreSQL은 커밋하지 않음, 삭제한 인덱스 수 반환)"""
+        indexes = [index for index in list_indexes(self.db_type, cursor, self.table_name)
+                   if not (index['unique'] or index['constraint'])]
+        if indexes and self.db_type != 'postgresql':
+            _ensure_deferred_index_table(cursor)
+        for index in indexes:
+            if self.db_type != 'postgresql':
+                # 삭제가 바로 커밋되므로 생성 SQL을 먼저 커밋
+                _forget_deferred_index(cursor, self.table_name, index['name'])
+                _update_deferred_index(cursor, f"INSERT INTO {DEFERRED_INDEX_TABLE} "
+                                               f"(table_name, index_name, create_sql, dropped_at) VALUES (?, ?, ?, ?)",
+                                       [self.table_name, index['name'],
+                                        index_create_sql(self.db_type, index, self.table_name),
+                                        time.strftime('%Y-%m-%d %H:%M:%S')])
+                cursor.getConnection().commit()
+            cursor.execute(f"DROP INDEX {index['name']}")
+            self.dropped.append(index)
+        if self.dropped:
+            print(f"대량 적재 전 보조 인덱스 삭제: {', '.join(index['name'] for index in self.dropped)}")
+        return len(self.dropped)
+    
+    def rebuild_in_transaction(self, cursor):
+        """삭제한 인덱스를 적재와 같은 트랜잭션에서 다시 생성 (PostgreSQL, 실패하면 예외가 나서 적재와 함께 롤백)"""
+        dropped, self.dropped = self.dropped, []
+        for index in dropped:
+            started = time.time()
+            cursor.execute(index_create_sql(self.db_type, index, self.table_name))
+            print(f"인덱스 재생성 완료: {index['name']} ({time.time() - started:.2f}초)")
+    
+    def rebuild(self, conf):
+        """삭제한 인덱스를 새 연결에서 다시 생성 (Altibase/Informix, 실패한 인덱스는 failed에 남기고 다음 인덱스 계속)"""
+        if not self.dropped:
+            return
+        remaining = list(self.dropped)
+        try:
+            with pooled_connection(conf) as conn:
+                conn.jconn.setAutoCommit(True)
+                cursor = conn.jconn.createStatement()
+                try:
+                    while remaining:
+                        index = remaining.pop(0)
+                        started = time.time()
+                        try:
+                            cursor.execute(index_create_sql(self.db_type, index, self.table_name))
+                            _forget_deferred_index(cursor, self.table_name, index['name'])
+                            print(f"인덱스 재생성 완료: {index['name']} ({time.time() - started:.2f}초)")
+                        except Exception as e:
+                            print(f"인덱스 재생성 실패: {index['name']} ({e})")
+                            self.failed.append((index['name'], str(e)))
+                finally:
+                    cursor.close()
+        except Exception as e:
+            # 연결 실패 등으로 다시 만들지 못한 인덱스 (기록이 남아 있어 다음 실행이 복구)
+            print(f"인덱스 재생성 중 오류: {e} (대상: {', '.join(index['name'] for index in remaining)})")
+            self.failed.extend((index['name'], str(e)) for index in remaining)
+        self.dropped = []
+    
+    def failure_message(self):
+        """다시 만들지 못한 인덱스 요약 (없으면 None)"""
+        if not self.failed:
+            return None
+        details = ', '.join(f"{name} ({error})" for name, error in self.failed)
+        return f"인덱스 재생성 실패: {details} - 다음 실행에서 {DEFERRED_INDEX_TABLE} 기록으로 다시 생성합니다"
+
+def update_statistics(conf, table_name):
+    """적재 후 옵티마이저 통계 갱신 (PostgreSQL ANALYZE, Altibase GATHER_TABLE_STATS, Informix UPDATE STATISTICS)"""
+    started = time.time()
+    with pooled_connection(conf) as conn:
+        if conf['type'] == 'postgresql':
+            cursor = conn.cursor()
+            cursor.execute(f"ANALYZE {table_name}")
+            cursor.close()
+            conn.commit()
+        else:
+            jconn = conn.jconn
+            if conf['type'] == 'altibase':
+                call = jconn.prepareCall("{call GATHER_TABLE_STATS(?, ?)}")
+                try:
+                    call.setString(1, jconn.getMetaData().getUserName())
+                    call.setString(2, table_name.upper())
+                    call.execute()
+                finally:
+                    call.close()
+            else:
+                stmt = jconn.createStatement()
+                try:
+                    stmt.execute(f"UPDATE STATISTICS MEDIUM FOR TABLE {table_name}")
+                finally:
+                    stmt.close()
+            if not jconn.getAutoCommit():
+                jconn.commit()
+    print(f"통계 갱신 완료: {table_name} ({time.time() - started:.2f}초)")
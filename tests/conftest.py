@@ -0,0 +1,8 @@
+import os
+import sys
+
+# db_connection_test 패키지의 __init__은 DB 드라이버(psycopg2, JPype)를 불러오므로
+# 드라이버 없이 테스트할 수 있는 모듈은 폴더를 경로에 추가해 직접 import
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'db_connection_test'))
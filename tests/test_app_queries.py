@@ -0,0 +1,46 @@
+import pytest
+
+# app.py는 Flask 앱을 함께 만들므로 Flask가 없는 환경에서는 건너뜀
+pytest.importorskip('flask')
+app = pytest.importorskip('app')
+
+
+def test_typed_key_query_casts_keys_and_keeps_raw_values():
+    query, delete_key_indexes = app.typed_key_query(
+        'postgresql', 'orders', ['data_hash', 'id', 'name'], ['id'], (9,), where="id >= 100"
+    )
+    
+    assert query == (
+        "SELECT * FROM (SELECT data_hash, CAST(id AS BIGINT) AS id, name, id AS fs_raw_key_0 FROM orders) typed_tgt"
+        " WHERE id >= 100 ORDER BY id"
+    )
+    assert delete_key_indexes == [3]
+
+
+def test_typed_key_query_leaves_string_keys():
+    query, delete_key_indexes = app.typed_key_query('informix', 'orders', ['data_hash', 'code'], ['code'], ('A1',))
+    
+    assert query == "SELECT data_hash, code FROM orders ORDER BY code"
+    assert delete_key_indexes is None
+
+
+def test_keyset_predicate_single_key():
+    assert app.build_keyset_predicate(['id'], [5]) == ("id > %s", [5])
+    assert app.build_keyset_predicate(['id'], [5], 'altibase') == ("id > ?", [5])
+
+
+def test_keyset_predicate_postgresql_row_comparison():
+    assert app.build_keyset_predicate(['updated_at', 'id'], ['2024-01-01', 7]) == (
+        "(updated_at, id) > (%s, %s)", ['2024-01-01', 7]
+    )
+
+
+def test_keyset_predicate_jdbc_expands_to_or_terms():
+    sql, params = app.build_keyset_predicate(['a', 'b', 'c'], [1, 2, 3], 'informix')
+    
+    assert sql == "a >= ? AND ((a > ?) OR (a = ? AND b > ?) OR (a = ? AND b = ? AND c > ?))"
+    assert params == [1, 1, 1, 2, 1, 2, 3]
+
+
+def test_keyset_predicate_uses_only_given_values():
+    assert app.build_keyset_predicate(['a', 'b'], [1]) == ("a > %s", [1])
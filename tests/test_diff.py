@@ -0,0 +1,148 @@
+import pytest
+
+from diff import merge_diff
+
+
+def test_typed_target_keys_compare_numerically_and_delete_raw_values():
+    # 소스는 정수 키, 타겟은 TEXT 컬럼을 BIGINT로 변환한 키 + 원래 문자열 키(끝 컬럼)
+    source = [[(1, 9, 'a'), (2, 10, 'b'), (3, 11, 'c')]]
+    target = [[(1, 9, 'a', '9'), (5, 10, 'x', '10'), (6, 12, 'z', '12')]]
+    
+    changes = list(merge_diff(source, target, [1], [1], hash_indexes=(0, 0), delete_key_indexes=[3]))
+    
+    assert len(changes) == 1
+    change_set = changes[0]
+    assert list(change_set) == [(2, 10, 'b'), (3, 11, 'c')]
+    assert change_set.added_count == 1
+    assert [new for _, new, _ in change_set.updated] == [(2, 10, 'b')]
+    assert change_set.deleted_keys == [('12',)]
+    assert change_set.unchanged_count == 1
+
+
+def test_text_target_keys_without_cast_cannot_be_compared():
+    # 변환하지 않은 TEXT 키는 '10'이 '9'보다 앞에 정렬되고 정수 키와 비교할 수 없음
+    source = [[(1, 9, 'a'), (2, 10, 'b')]]
+    target = [[(2, '10', 'b'), (1, '9', 'a')]]
+    
+    with pytest.raises(TypeError):
+        list(merge_diff(source, target, [1], [1], hash_indexes=(0, 0)))
+
+
+def test_key_only_reconcile_deletes_raw_target_keys():
+    # 삭제 반영: 키만 비교하고 타겟에만 있는 키를 저장된 원래 값으로 삭제 (소스에만 있는 키는 무시)
+    source = [[(2,), (9,), (10,)]]
+    target = [[(2, '2'), (3, '3'), (10, '10'), (100, '100')]]
+    
+    changes = list(merge_diff(source, target, [0], [0], compare_indexes=[], delete_key_indexes=[1]))
+    
+    assert [change_set.deleted_keys for change_set in changes] == [[('3',), ('100',)]]
+
+
+def test_added_updated_deleted_rows_with_interleaved_keys():
+    # 키가 양쪽에 번갈아 나타나도 한 번의 병합으로 추가/수정/삭제/동일을 구분
+    source = [[(1, 'a'), (3, 'c'), (4, 'd2')], [(6, 'f'), (8, 'h')]]
+    target = [[(2, 'b'), (3, 'c')], [(4, 'd'), (5, 'e'), (8, 'h')]]
+    
+    changes = list(merge_diff(source, target, [0], [0]))
+    
+    assert len(changes) == 1
+    change_set = changes[0]
+    assert list(change_set) == [(1, 'a'), (4, 'd2'), (6, 'f')]
+    assert change_set.added_count == 2
+    assert change_set.updated == [((4, 'd'), (4, 'd2'), [True])]
+    assert change_set.deleted == [(2, 'b'), (5, 'e')]
+    assert change_set.deleted_keys == [(2,), (5,)]
+    assert change_set.unchanged_count == 2
+
+
+def test_batch_size_splits_change_sets():
+    source = [[(i, 'new') for i in range(5)]]
+    
+    changes = list(merge_diff(source, [], [0], [0], batch_size=2))
+    
+    assert [len(change_set) for change_set in changes] == [2, 2, 1]
+
+
+def test_trailing_unchanged_count_is_kept():
+    # 마지막 변경 묶음 뒤의 동일 행 수는 빈 ChangeSet으로 반환
+    source = [[(1, 'new'), (2, 'b'), (3, 'c')]]
+    target = [[(1, 'old'), (2, 'b'), (3, 'c')]]
+    
+    changes = list(merge_diff(source, target, [0], [0], batch_size=1))
+    
+    assert [bool(change_set) for change_set in changes] == [True, False]
+    assert [change_set.unchanged_count for change_set in changes] == [0, 2]
+
+
+def test_no_changes_yields_only_unchanged_count():
+    rows = [(1, 'a'), (2, 'b')]
+    
+    changes = list(merge_diff([rows], [list(rows)], [0], [0]))
+    
+    assert not any(changes)
+    assert sum(change_set.unchanged_count for change_set in changes) == 2
+
+
+def test_empty_streams_yield_nothing():
+    assert list(merge_diff([], [], [0], [0])) == []
+
+
+def test_same_hash_skips_column_compare():
+    # data_hash가 같으면 다른 컬럼은 비교하지 않음
+    source = [[(10, 1, 'a')]]
+    target = [[(10, 1, 'changed')]]
+    
+    assert not any(merge_diff(source, target, [1], [1], hash_indexes=(0, 0)))
+
+
+def test_different_hash_falls_back_to_columns():
+    # 해시만 다르고 컬럼이 같으면(이전 형식 해시 등) 같은 행
+    source = [[(10, 1, 'a'), (20, 2, 'b')]]
+    target = [[(11, 1, 'a'), (21, 2, 'old')]]
+    
+    changes = list(merge_diff(source, target, [1], [1], hash_indexes=(0, 0)))
+    
+    assert [new for _, new, _ in changes[0].updated] == [(20, 2, 'b')]
+    assert changes[0].updated[0][2] == [True]  # 해시 컬럼은 마스크에서 제외
+
+
+def test_composite_keys():
+    source = [[(1, 'a', 'x'), (1, 'b', 'y'), (2, 'a', 'z')]]
+    target = [[(1, 'a', 'x'), (1, 'c', 'q'), (2, 'a', 'z')]]
+    
+    changes = list(merge_diff(source, target, [0, 1], [0, 1]))
+    
+    assert list(changes[0]) == [(1, 'b', 'y')]
+    assert changes[0].deleted_keys == [(1, 'c')]
+
+
+@pytest.mark.parametrize('side', ['source', 'target'])
+def test_duplicate_keys_raise(side):
+    rows = [(1, 'a'), (1, 'b')]
+    other = [(1, 'a')]
+    source, target = (rows, other) if side == 'source' else (other, rows)
+    
+    with pytest.raises(Exception, match='정렬되어 있지 않거나 키가 중복됩니다'):
+        list(merge_diff([source], [target], [0], [0]))
+
+
+def test_unordered_keys_raise():
+    with pytest.raises(Exception, match='정렬되어 있지 않거나 키가 중복됩니다'):
+        list(merge_diff([[(2, 'b'), (1, 'a')]], [], [0], [0]))
+
+
+@pytest.mark.parametrize('side', ['source', 'target'])
+def test_null_keys_raise(side):
+    rows = [(None, 'a')]
+    source, target = (rows, []) if side == 'source' else ([], rows)
+    
+    with pytest.raises(Exception, match='키가 NULL입니다'):
+        list(merge_diff([source], [target], [0], [0]))
+
+
+def test_text_target_values_equal_source_values():
+    # 타겟 TEXT 컬럼에 저장된 값은 문자열로 비교
+    source = [[(1, 10, 2.5)]]
+    target = [[(1, '10', '2.5')]]
+    
+    assert not any(merge_diff(source, target, [0], [0]))
@@ -0,0 +1,77 @@
+import pytest
+
+from range_checksum import MAX_PREDICATE_RANGES, RangeChecksumIndex, bucket_query
+
+
+def make_index(tmp_path, base=0, width=10):
+    index = RangeChecksumIndex(str(tmp_path / 'job_1.json'))
+    index.key_column = 'id'
+    index.base = base
+    index.width = width
+    return index
+
+
+def test_compare_returns_changed_added_and_removed_buckets(tmp_path):
+    index = make_index(tmp_path)
+    index.leaves = {0: (10, '100'), 1: (10, '200'), 2: (10, '300')}
+    
+    changed = index.compare([(0, 10, 100), (1, 10, 201), (3, 5, 50)])
+    
+    assert changed == [1, 2, 3]
+
+
+def test_compare_with_target_buckets_ignores_recorded_values(tmp_path):
+    # 타겟에서 계산한 값과 비교하므로 기록 이후 타겟만 바뀐 구간도 찾음
+    index = make_index(tmp_path)
+    index.leaves = {0: (10, '100'), 1: (10, '200')}
+    
+    changed = index.compare([(0, 10, 100), (1, 10, 200)], [(0, 10, 100), (1, 10, 999), (2, 1, 5)])
+    
+    assert changed == [1, 2]
+
+
+def test_compare_result_is_saved_and_loaded(tmp_path):
+    index = make_index(tmp_path)
+    index.compare([(0, 3, 7), (2, 1, None)])
+    index.save()
+    
+    loaded = RangeChecksumIndex(index.path)
+    assert loaded.load()
+    assert loaded.leaves == {0: (3, '7'), 2: (1, '0')}
+    assert loaded.compare([(0, 3, 7), (2, 1, 0)]) == []
+
+
+def test_ranges_merges_adjacent_buckets(tmp_path):
+    index = make_index(tmp_path)
+    
+    assert index.ranges([1, 2, 3, 7, 9, 10]) == [(1, 3), (7, 7), (9, 10)]
+    assert index.ranges([]) == []
+
+
+def test_ranges_limits_predicate_ranges(tmp_path):
+    index = make_index(tmp_path)
+    
+    ranges = index.ranges(list(range(0, (MAX_PREDICATE_RANGES + 10) * 2, 2)))
+    
+    assert len(ranges) == MAX_PREDICATE_RANGES
+    assert ranges[0][0] == 0 and ranges[-1][1] == (MAX_PREDICATE_RANGES + 9) * 2
+
+
+def test_predicate_builds_key_ranges(tmp_path):
+    index = make_index(tmp_path, base=100, width=10)
+    
+    assert index.predicate([(0, 1), (3, 3)]) == "(id < 120) OR (id >= 130 AND id < 140)"
+    assert index.predicate([]) == "1=0"
+
+
+def test_bucket_query_hashes_whole_row():
+    query = bucket_query("SELECT * FROM src", 'id', 100, 10, 'postgresql', ['id', 'name'])
+    
+    assert "md5(ROW(range_src.id::text, range_src.name::text)::text)" in query
+    assert "TRUNC((id - 100) / 10, 0)" in query
+
+
+@pytest.mark.parametrize('db_type', ['altibase', 'informix'])
+def test_bucket_query_rejects_db_without_row_hash(db_type):
+    with pytest.raises(Exception, match='지원하지 않습니다'):
+        bucket_query("SELECT * FROM src", 'id', 100, 10, db_type, ['id'])
@@ -0,0 +1,42 @@
+import pytest
+
+# table_indexes는 연결 풀(psycopg2)을 함께 불러옴
+pytest.importorskip('psycopg2')
+table_indexes = pytest.importorskip('table_indexes')
+
+
+class FakeCursor:
+    def __init__(self, rows):
+        self.rows = rows
+        self.executed = []
+    
+    def execute(self, sql, params=None):
+        self.executed.append(sql)
+    
+    def fetchone(self):
+        return self.rows.pop(0) if self.rows else None
+
+
+def test_existing_unique_key_index_is_reused(monkeypatch):
+    monkeypatch.setattr(table_indexes, 'list_indexes', lambda *args: [
+        {'name': 'orders_pkey', 'unique': True, 'constraint': True, 'primary': True, 'definition': 'PRIMARY KEY (id)'}
+    ])
+    cursor = FakeCursor([])
+    
+    assert table_indexes.ensure_unique_key_index('postgresql', cursor, 'orders', ['ID'], 'orders_merge_key_idx') is False
+    assert cursor.executed == []
+
+
+def test_duplicate_keys_are_rejected_before_creating_index(monkeypatch):
+    monkeypatch.setattr(table_indexes, 'list_indexes', lambda *args: [])
+    cursor = FakeCursor([(5,)])
+    
+    with pytest.raises(Exception, match='같은 행이 여러 개'):
+        table_indexes.ensure_unique_key_index('postgresql', cursor, 'orders', ['id'], 'orders_merge_key_idx')
+    assert not any(sql.startswith('CREATE') for sql in cursor.executed)
+
+
+def test_expression_and_partial_indexes_are_not_key_indexes():
+    assert table_indexes._index_columns('postgresql', {'definition': 'btree (lower(code))'}) == []
+    assert table_indexes._index_columns('postgresql', {'definition': 'btree (code) WHERE (code IS NOT NULL)'}) == []
+    assert table_indexes._index_columns('postgresql', {'definition': 'btree (a, "B" DESC)'}) == ['a', 'b']